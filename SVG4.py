@@ -1,10 +1,23 @@
 #!/usr/bin/env python3
 import argparse
+import heapq
 import json
+import operator
+import re
+import shutil
 import subprocess
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Literal
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple, Literal
+
+from svgGeometry import fmt_num
+from tableColumns import DELIMITERS, ColumnTable, as_table, load_table
 
 # ----------------------------
 #  Palette
@@ -55,6 +68,12 @@ def unique_path(base: Path) -> Path:
         i += 1
 
 
+def _write_svg(path: Path, svg: str):
+    with _stage("write"):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(svg)
+
+
 # ----------------------------
 #  Git helpers (for autopush)
 # ----------------------------
@@ -70,6 +89,92 @@ def run_git_command(cmd: List[str]):
         return (False, str(e))
 
 
+# ----------------------------
+#  Profiling hooks
+# ----------------------------
+
+class RenderProfile:
+    """
+    Per-stage wall time and call counts for the render pipeline.
+
+    Stages: load, format (column measurement), layout, emit, write, autopush.
+    With track_allocations=True (and tracemalloc tracing), each stage also
+    records its peak traced allocation above the level it started at.
+    callback(stage, seconds) is called after every stage, if given.
+    """
+
+    def __init__(
+        self,
+        track_allocations: bool = False,
+        callback: Optional[Callable[[str, float], None]] = None,
+    ):
+        self.track_allocations = track_allocations
+        self.callback = callback
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        tracing = self.track_allocations and tracemalloc.is_tracing()
+        if tracing:
+            start_mem, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            entry = self.stages.setdefault(name, {"calls": 0, "wall_s": 0.0})
+            entry["calls"] += 1
+            entry["wall_s"] += elapsed
+            if tracing:
+                _, peak = tracemalloc.get_traced_memory()
+                alloc_kb = max(0, peak - start_mem) / 1024.0
+                entry["alloc_peak_kb"] = max(entry.get("alloc_peak_kb", 0.0), alloc_kb)
+            if self.callback is not None:
+                self.callback(name, elapsed)
+
+    def report(self) -> Dict:
+        return {
+            "stages": self.stages,
+            "total_wall_s": sum(e["wall_s"] for e in self.stages.values()),
+        }
+
+
+_active_profile: Optional[RenderProfile] = None
+
+
+@contextmanager
+def render_profiling(
+    track_allocations: bool = False,
+    callback: Optional[Callable[[str, float], None]] = None,
+):
+    """
+    Record render stages for everything run inside the block:
+
+        with render_profiling() as prof:
+            generate_svg_table(data)
+        print(prof.report())
+    """
+    global _active_profile
+    previous = _active_profile
+    profile = RenderProfile(track_allocations=track_allocations, callback=callback)
+    _active_profile = profile
+    try:
+        yield profile
+    finally:
+        _active_profile = previous
+
+
+@contextmanager
+def _stage(name: str):
+    """Time a pipeline stage if a RenderProfile is active; no-op otherwise."""
+    if _active_profile is None:
+        yield
+        return
+    with _active_profile.stage(name):
+        yield
+
+
 # ----------------------------
 #  Formatting helpers
 # ----------------------------
@@ -165,6 +270,154 @@ def format_value(value, fmt: str) -> str:
     return "" if s.strip() == "" else s
 
 
+# ----------------------------
+#  Query stage (select / where / sort / limit)
+# ----------------------------
+
+QUERY_OPS: Dict[str, Callable] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+_CONDITION_RE = re.compile(r"^(.+?)\s*(>=|<=|==|!=|>|<)\s*(.+)$")
+
+
+def parse_condition(text: str) -> Tuple[str, str, object]:
+    """
+    "Weight > 5%" -> ("Weight", ">", 0.05). Numbers are read like cell values
+    ($ and , ignored; a trailing % divides by 100); anything else, or a quoted
+    value, is text and only allows == and !=.
+    """
+    m = _CONDITION_RE.match(text.strip())
+    if not m:
+        raise ValueError(f"Cannot parse condition {text!r}; use e.g. \"Weight > 5%\" or \"Country == US\"")
+    column, op, raw = m.group(1).strip(), m.group(2), m.group(3).strip()
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "'\"":
+        value: object = raw[1:-1]
+    else:
+        value = _to_number(raw)
+        if value is None:
+            value = raw
+        elif raw.endswith("%"):
+            value = value / 100.0
+    if isinstance(value, str) and op not in ("==", "!="):
+        raise ValueError(f"Condition {text!r}: {op} needs a number, got {raw!r}")
+    return column, op, value
+
+
+def _condition_filter(column: str, op_name: str, value) -> Callable[[List[Dict]], List[Dict]]:
+    """A function keeping the rows of a list that satisfy one condition."""
+    op = QUERY_OPS[op_name]
+    if isinstance(value, str):
+        def keep_text(rows: List[Dict]) -> List[Dict]:
+            return [row for row in rows
+                    if op("" if row.get(column) is None else str(row.get(column)), value)]
+        return keep_text
+
+    def keep_number(rows: List[Dict]) -> List[Dict]:
+        kept = []
+        for row in rows:
+            num = row.get(column)
+            if type(num) not in (int, float):  # fast path for JSON numbers
+                num = _to_number(num)
+            if num is not None and op(num, value):
+                kept.append(row)
+        return kept
+    return keep_number
+
+
+def _sort_key(value, descending: bool) -> Tuple[int, float, str]:
+    """Numbers (by value) come before text (alphabetical) in either direction."""
+    num = _to_number(value)
+    if num is not None:
+        return (1 if descending else 0, num, "")
+    return (0 if descending else 1, 0.0, str(value))
+
+
+def _sorted_rows(rows: List[Dict], column: str, descending: bool, limit: Optional[int]) -> List[Dict]:
+    """
+    Sort rows by a column, blanks last, keeping the input order of ties.
+    With a limit only the first `limit` rows are picked, via a partial heap
+    sort instead of a full sort.
+    """
+    values = [row.get(column) for row in rows]
+    blank: List[int] = []
+    if set(map(type, values)) <= {int, float}:
+        keys: List = values  # all JSON numbers: compare them directly
+        order: List[int] = list(range(len(rows)))
+    else:
+        keys = [None] * len(rows)
+        order = []
+        for i, value in enumerate(values):
+            if value is None or str(value).strip() == "":
+                blank.append(i)
+            else:
+                keys[i] = _sort_key(value, descending)
+                order.append(i)
+
+    if limit is None:
+        picked = sorted(order, key=keys.__getitem__, reverse=descending)
+    elif descending:
+        picked = heapq.nlargest(limit, order, key=keys.__getitem__)
+    else:
+        picked = heapq.nsmallest(limit, order, key=keys.__getitem__)
+    picked.extend(blank)
+    if limit is not None:
+        picked = picked[:limit]
+    return [rows[i] for i in picked]
+
+
+def query_table(
+    data: List[Dict],
+    select: Optional[List[str]] = None,
+    where: Optional[List[str]] = None,
+    sort_by: Optional[str] = None,
+    descending: bool = False,
+    limit: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Filter (every where condition must hold), sort, limit and project rows
+    before anything is formatted or measured. Column names are checked
+    against the first row. Raises ValueError if nothing is left.
+    """
+    data = _table_data(data)
+    conditions = [parse_condition(w) for w in where or []]
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1.")
+
+    known = data[0].keys()
+    named = list(select or []) + [c for c, _, _ in conditions] + ([sort_by] if sort_by else [])
+    unknown = [c for c in dict.fromkeys(named) if c not in known]
+    if unknown:
+        raise ValueError(f"Unknown columns in query: {unknown} (have: {list(known)})")
+
+    with _stage("query"):
+        if conditions and limit is not None and not sort_by:
+            # first `limit` matches: stop scanning once they are found
+            tests = [_condition_filter(*c) for c in conditions]
+            matches = (row for row in data if all(test([row]) for test in tests))
+            rows = list(islice(matches, limit))
+        else:
+            rows = data
+            for column, op_name, value in conditions:
+                rows = _condition_filter(column, op_name, value)(rows)
+            if sort_by:
+                rows = _sorted_rows(rows, sort_by, descending, limit)
+            elif limit is not None:
+                rows = rows[:limit]
+            else:
+                rows = list(rows)
+        if select:
+            rows = [{c: row[c] for c in select if c in row} for row in rows]
+
+    if not rows:
+        raise ValueError("Query matched no rows.")
+    return rows
+
+
 # ----------------------------
 #  Geometry helpers + SVG generators
 # ----------------------------
@@ -173,59 +426,121 @@ def _pts_to_px(pts: float) -> float:
     return pts * 1.333  # approx pt → px
 
 
-def _compute_table_layout(
+def _table_data(data):
+    """
+    Table input as the generators read it: a list of row dicts or a
+    ColumnTable (DataFrames, Arrow tables etc. are converted column by
+    column, see tableColumns.as_table). Raises ValueError if empty.
+    """
+    data = as_table(data)
+    if not isinstance(data, (list, ColumnTable)) or len(data) == 0:
+        raise ValueError("data must be a non-empty list of dicts, a ColumnTable or a DataFrame.")
+    return data
+
+
+def _resolve_table_columns(
     data: List[Dict],
-    col_keys: List[str],
+    cols: Optional[List[str]],
     headers: Optional[List[str]],
     formats: Optional[List[str]],
-    svg_size: Tuple[int, int],
-    font_size_pt: int,
-    col_widths: Optional[List[float]] = None,
+    justifications: Optional[List[str]] = None,
 ):
     """
-    Layout + auto-fit rules:
-
-    1) Determine longest formatted string (header + data) per column.
-    2) At the requested font size, check:
-       - Horizontal fit: do all columns fit within svg_width?
-       - Vertical fit: do header + all rows fit within svg_height?
-    3) If not, shrink font size just enough so BOTH width and height fit.
-    4) Recompute row height from the final font size.
-    5) Compute column widths:
-       - If col_widths is None: widths are based on formatted text length and scaled to svg_width.
-       - If col_widths is provided: treat as relative weights, still shrink font if needed.
+    Resolve column keys, header labels, format codes and justification codes
+    the same way for every generator. Returns (col_keys, header_labels,
+    fmt_list, just).
     """
-
-    svg_width, svg_height = svg_size
-    num_rows = len(data)
+    # Determine columns
+    if cols and len(cols) > 0:
+        col_keys = cols
+    else:
+        col_keys = list(data[0].keys())
     num_cols = len(col_keys)
-    if num_cols == 0:
-        raise ValueError("No columns provided for layout.")
 
-    # Resolve header labels for measurement (headers themselves are not formatted)
+    # Headers
     if headers and len(headers) == num_cols:
         header_labels = headers
     else:
         header_labels = col_keys
 
-    # Normalize format list
+    # Formats
     if formats and len(formats) == num_cols:
-        fmt_list = [fmt or "text" for fmt in formats]
+        fmt_list = [f or "text" for f in formats]
     else:
         fmt_list = ["text"] * num_cols
 
-    # 1) Longest formatted string per column (header + data)
+    # Justifications
+    if justifications and len(justifications) == num_cols:
+        just = []
+        for j in justifications:
+            code = str(j or "L").upper()
+            just.append(code if code in ("L", "C", "R") else "L")
+    else:
+        just = ["L"] * num_cols
+
+    return col_keys, header_labels, fmt_list, just
+
+
+def _column_values(rows, col_keys: List[str]) -> List[List]:
+    """
+    The raw values of each column in col_keys ("" where a row lacks the key).
+    A ColumnTable hands over its own column lists; row dicts are read once.
+    """
+    if isinstance(rows, ColumnTable):
+        return [rows.column(key) for key in col_keys]
+    return [[row.get(key, "") for row in rows] for key in col_keys]
+
+
+def _measure_columns(
+    data: List[Dict],
+    col_keys: List[str],
+    header_labels: List[str],
+    fmt_list: List[str],
+) -> List[int]:
+    """Longest formatted string per column (header + data)."""
     max_chars_per_col: List[int] = []
-    for j, key in enumerate(col_keys):
-        fmt = fmt_list[j]
-        # header text length
-        max_chars = len(str(header_labels[j]))
-        # data values (formatted)
-        for row in data:
-            if key in row:
-                s = format_value(row[key], fmt)
+    with _stage("format"):
+        for j, values in enumerate(_column_values(data, col_keys)):
+            fmt = fmt_list[j]
+            # header text length
+            max_chars = len(str(header_labels[j]))
+            # data values (formatted; missing cells format to "")
+            for value in values:
+                s = format_value(value, fmt)
                 max_chars = max(max_chars, len(s))
-        max_chars_per_col.append(max_chars)
+            max_chars_per_col.append(max_chars)
+    return max_chars_per_col
+
+
+def _fit_table_layout(
+    max_chars_per_col: List[int],
+    num_rows: int,
+    svg_size: Tuple[int, int],
+    font_size_pt: int,
+    col_widths: Optional[List[float]] = None,
+    fit_height: bool = True,
+):
+    """
+    Layout + auto-fit rules, from per-column text lengths:
+
+    1) At the requested font size, check:
+       - Horizontal fit: do all columns fit within svg_width?
+       - Vertical fit: do header + num_rows rows fit within svg_height?
+    2) If not, shrink font size just enough so BOTH width and height fit.
+    3) Recompute row height from the final font size.
+    4) Compute column widths:
+       - If col_widths is None: widths are based on formatted text length and scaled to svg_width.
+       - If col_widths is provided: treat as relative weights, still shrink font if needed.
+
+    With fit_height=False only the width constrains the font, and svg_height
+    in the result is the full height of header + num_rows rows (used for
+    windowed rendering of tables far taller than any viewport).
+    """
+
+    svg_width, svg_height = svg_size
+    num_cols = len(max_chars_per_col)
+    if num_cols == 0:
+        raise ValueError("No columns provided for layout.")
 
     # Heuristics for text width + row height
     char_width_factor = 0.6      # ~ char width in px per 1px of font-size
@@ -237,7 +552,9 @@ def _compute_table_layout(
 
     # --------- Vertical constraint (height) ----------
     total_rows_for_height = num_rows + 1  # header + data
-    if total_rows_for_height > 0:
+    if not fit_height:
+        max_font_px_height = font_px_requested
+    elif total_rows_for_height > 0:
         max_font_px_height = svg_height / (total_rows_for_height * row_height_factor)
     else:
         max_font_px_height = font_px_requested
@@ -320,6 +637,9 @@ def _compute_table_layout(
     header_center_y = top_rule_y + header_band_height / 2.0
     header_divider_y = top_rule_y + header_band_height
 
+    if not fit_height:
+        svg_height = header_divider_y + row_height * num_rows
+
     return {
         "svg_width": svg_width,
         "svg_height": svg_height,
@@ -339,240 +659,426 @@ def _compute_table_layout(
     }
 
 
-def generate_svg_table(
+def _compute_table_layout(
     data: List[Dict],
-    cols: Optional[List[str]] = None,
-    headers: Optional[List[str]] = None,
-    formats: Optional[List[str]] = None,
-    font_size_pt: int = 14,
-    svg_size: Tuple[int, int] = (800, 500),
-    justifications: Optional[List[str]] = None,
+    col_keys: List[str],
+    headers: Optional[List[str]],
+    formats: Optional[List[str]],
+    svg_size: Tuple[int, int],
+    font_size_pt: int,
     col_widths: Optional[List[float]] = None,
-    background_color: Optional[str] = None,   # None = transparent
-) -> str:
+):
     """
-    Generate SVG table following your style guide, with optional Oxford Blue background.
-    Auto-resizes columns and shrinks font if needed so all text fits.
+    Layout + auto-fit for a whole table: measure the longest formatted string
+    (header + data) per column, then fit font and column widths to svg_size
+    (see _fit_table_layout).
     """
-    if not isinstance(data, list) or len(data) == 0:
-        raise ValueError("data must be a non-empty list of dicts.")
-
-    svg_width, svg_height = svg_size
-
-    COLORS = {
-        "persian_red": "rgb(198,62,48)",
-        "cadet": "rgb(155,184,193)",
-        "white": "rgb(255,255,255)",
-    }
-
-    # Determine columns
-    if cols and len(cols) > 0:
-        col_keys = cols
-    else:
-        col_keys = list(data[0].keys())
     num_cols = len(col_keys)
+    if num_cols == 0:
+        raise ValueError("No columns provided for layout.")
 
-    # Headers
+    # Resolve header labels for measurement (headers themselves are not formatted)
     if headers and len(headers) == num_cols:
         header_labels = headers
     else:
         header_labels = col_keys
 
-    # Justifications
-    if justifications and len(justifications) == num_cols:
-        just = []
-        for j in justifications:
-            code = str(j or "L").upper()
-            just.append(code if code in ("L", "C", "R") else "L")
-    else:
-        just = ["L"] * num_cols
-
-    # Formats
+    # Normalize format list
     if formats and len(formats) == num_cols:
-        fmt_list = [f or "text" for f in formats]
+        fmt_list = [fmt or "text" for fmt in formats]
     else:
         fmt_list = ["text"] * num_cols
 
-    # Layout (auto-fit columns + font, uses formatted text lengths)
-    layout = _compute_table_layout(
-        data=data,
-        col_keys=col_keys,
-        headers=header_labels,
-        formats=fmt_list,
-        svg_size=svg_size,
-        font_size_pt=font_size_pt,
-        col_widths=col_widths,
+    max_chars_per_col = _measure_columns(data, col_keys, header_labels, fmt_list)
+    with _stage("layout"):
+        return _fit_table_layout(
+            max_chars_per_col,
+            num_rows=len(data),
+            svg_size=svg_size,
+            font_size_pt=font_size_pt,
+            col_widths=col_widths,
+        )
+
+
+def _escape_xml(value) -> str:
+    s = str(value)
+    return (
+        s.replace("&", "&amp;")
+         .replace("<", "&lt;")
+         .replace(">", "&gt;")
+         .replace('"', "&quot;")
+         .replace("'", "&apos;")
     )
 
-    font_size_px = layout["font_size_px"]
-    margin_left = layout["margin_left"]
-    margin_right = layout["margin_right"]
-    top_rule_y = layout["top_rule_y"]
-    header_center_y = layout["header_center_y"]
-    header_divider_y = layout["header_divider_y"]
-    row_height = layout["row_height"]
-    col_start_x = layout["col_start_x"]
-    col_end_x = layout["col_end_x"]
 
-    def escape_xml(value) -> str:
-        s = str(value)
-        return (
-            s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&apos;")
-        )
+def _render_table_svg(*args, **kwargs) -> str:
+    """Emit the SVG for a table against a computed layout (see _emit_table_svg)."""
+    with _stage("emit"):
+        return _emit_table_svg(*args, **kwargs)
+
+
+TABLE_COLORS = {
+    "persian_red": "rgb(198,62,48)",
+    "cadet": "rgb(155,184,193)",
+    "white": "rgb(255,255,255)",
+}
+CELL_PADDING = 5  # px between a cell's text and its column edge (L / R alignment)
 
-    inner_pad = 5
 
-    def get_text_position(col_index: int, align: str):
-        start = col_start_x[col_index]
-        end = col_end_x[col_index]
-        center = (start + end) / 2.0
+def _text_positions(layout: Dict, just: List[str]) -> List[Tuple[float, str]]:
+    """(x, text-anchor) of each column's text for its L / C / R alignment."""
+    positions: List[Tuple[float, str]] = []
+    for start, end, align in zip(layout["col_start_x"], layout["col_end_x"], just):
         if align == "C":
-            return center, "middle"
+            positions.append(((start + end) / 2.0, "middle"))
         elif align == "R":
-            return end - inner_pad, "end"
+            positions.append((end - CELL_PADDING, "end"))
         else:
-            return start + inner_pad, "start"
+            positions.append((start + CELL_PADDING, "start"))
+    return positions
+
+
+def _table_chrome_parts(
+    header_labels: List[str],
+    just: List[str],
+    layout: Dict,
+    background_color: Optional[str] = None,
+    precision: Optional[int] = None,
+    minify: bool = False,
+    group_columns: bool = False,
+    include_header: bool = True,
+    view_box: Optional[Tuple[float, float, float, float]] = None,
+) -> List[str]:
+    """
+    The parts of a table SVG that do not depend on the rows: root element,
+    background, <style>, top rule, header texts and header divider.
+    """
+    svg_width = layout["svg_width"]
+    svg_height = layout["svg_height"]
+    font_size_px = layout["font_size_px"]
+    top_rule_y = layout["top_rule_y"]
+    header_center_y = layout["header_center_y"]
+    header_divider_y = layout["header_divider_y"]
+    COLORS = TABLE_COLORS
+
+    def n(value) -> str:
+        return fmt_num(value, precision)
 
     parts: List[str] = []
 
     # SVG root
-    parts.append(
-        f'<svg width="{svg_width}" height="{svg_height}" '
-        f'viewBox="0 0 {svg_width} {svg_height}" '
-        f'xmlns="http://www.w3.org/2000/svg">'
-    )
+    if view_box is None:
+        parts.append(
+            f'<svg width="{svg_width}" height="{svg_height}" '
+            f'viewBox="0 0 {svg_width} {svg_height}" '
+            f'xmlns="http://www.w3.org/2000/svg">'
+        )
+    else:
+        vx, vy, vw, vh = (n(v) for v in view_box)
+        parts.append(
+            f'<svg width="{vw}" height="{vh}" '
+            f'viewBox="{vx} {vy} {vw} {vh}" '
+            f'xmlns="http://www.w3.org/2000/svg">'
+        )
 
     # Optional background rect (Oxford Blue, etc.)
     if background_color:
-        parts.append(
-            f'<rect x="0" y="0" width="{svg_width}" height="{svg_height}" '
-            f'fill="{background_color}"/>'
-        )
+        if view_box is None:
+            parts.append(
+                f'<rect x="0" y="0" width="{svg_width}" height="{svg_height}" '
+                f'fill="{background_color}"/>'
+            )
+        else:
+            parts.append(
+                f'<rect x="{vx}" y="{vy}" width="{vw}" height="{vh}" '
+                f'fill="{background_color}"/>'
+            )
 
     # Styles
-    parts.append(
-        f"""
+    if minify:
+        parts.append(
+            f'<style>.header,.cell{{font-family:"Montserrat",sans-serif;'
+            f'font-size:{n(font_size_px)}px;fill:{COLORS["white"]};'
+            f'dominant-baseline:middle}}.header{{font-weight:700}}'
+            f'.cell{{font-weight:400}}.cell text{{dominant-baseline:middle}}</style>'
+        )
+    elif group_columns:
+        parts.append(
+            f"""
+  <style>
+    .header {{
+      font-family: "Montserrat", sans-serif;
+      font-size: {n(font_size_px)}px;
+      font-weight: 700;
+      fill: {COLORS["white"]};
+      dominant-baseline: middle;
+    }}
+    .cell, .cell text {{
+      font-family: "Montserrat", sans-serif;
+      font-size: {n(font_size_px)}px;
+      font-weight: 400;
+      fill: {COLORS["white"]};
+      dominant-baseline: middle;
+    }}
+  </style>
+"""
+        )
+    else:
+        parts.append(
+            f"""
   <style>
     .header {{
       font-family: "Montserrat", sans-serif;
-      font-size: {font_size_px}px;
+      font-size: {n(font_size_px)}px;
       font-weight: 700;
       fill: {COLORS["white"]};
       dominant-baseline: middle;
     }}
     .cell {{
       font-family: "Montserrat", sans-serif;
-      font-size: {font_size_px}px;
+      font-size: {n(font_size_px)}px;
       font-weight: 400;
       fill: {COLORS["white"]};
       dominant-baseline: middle;
     }}
   </style>
 """
-    )
+        )
 
-    # Top Persian Red rule (4pt)
-    top_rule_stroke_width = _pts_to_px(4)
-    parts.append(
-        f'<line x1="{margin_left}" y1="{top_rule_y}" '
-        f'x2="{svg_width - margin_right}" y2="{top_rule_y}" '
-        f'stroke="{COLORS["persian_red"]}" stroke-width="{top_rule_stroke_width}"/>'
-    )
+    if include_header:
+        rule_x1 = n(layout["margin_left"])
+        rule_x2 = n(svg_width - layout["margin_right"])
 
-    # Headers
-    for idx, label in enumerate(header_labels):
-        x, anchor = get_text_position(idx, just[idx])
+        # Top Persian Red rule (4pt)
+        top_rule_stroke_width = _pts_to_px(4)
         parts.append(
-            f'<text x="{x}" y="{header_center_y}" class="header" '
-            f'text-anchor="{anchor}">{escape_xml(label)}</text>'
+            f'<line x1="{rule_x1}" y1="{n(top_rule_y)}" '
+            f'x2="{rule_x2}" y2="{n(top_rule_y)}" '
+            f'stroke="{COLORS["persian_red"]}" stroke-width="{n(top_rule_stroke_width)}"/>'
         )
 
-    # Header-bottom Cadet divider (1pt)
-    row_divider_stroke_width = _pts_to_px(1)
-    parts.append(
-        f'<line x1="{margin_left}" y1="{header_divider_y}" '
-        f'x2="{svg_width - margin_right}" y2="{header_divider_y}" '
-        f'stroke="{COLORS["cadet"]}" stroke-width="{row_divider_stroke_width}"/>'
-    )
+        # Headers
+        for label, (x, anchor) in zip(header_labels, _text_positions(layout, just)):
+            parts.append(
+                f'<text x="{n(x)}" y="{n(header_center_y)}" class="header" '
+                f'text-anchor="{anchor}">{_escape_xml(label)}</text>'
+            )
 
-    # Row dividers
-    num_rows = len(data)
-    for i in range(1, num_rows + 1):
-        y = header_divider_y + row_height * i
-        is_last = i == num_rows
-        color = COLORS["persian_red"] if is_last else COLORS["cadet"]
+        # Header-bottom Cadet divider (1pt)
         parts.append(
-            f'<line x1="{margin_left}" y1="{y}" '
-            f'x2="{svg_width - margin_right}" y2="{y}" '
-            f'stroke="{color}" stroke-width="{row_divider_stroke_width}"/>'
+            f'<line x1="{rule_x1}" y1="{n(header_divider_y)}" '
+            f'x2="{rule_x2}" y2="{n(header_divider_y)}" '
+            f'stroke="{COLORS["cadet"]}" stroke-width="{n(_pts_to_px(1))}"/>'
         )
 
-    # Data rows
-    for row_index, row_data in enumerate(data):
-        center_y = header_divider_y + row_height * (row_index + 0.5)
-        for col_index, key in enumerate(col_keys):
-            raw_value = row_data.get(key, "")
-            fmt = fmt_list[col_index]
+    return parts
+
+
+def _row_divider_parts(
+    layout: Dict,
+    row_offset: int,
+    num_rows: int,
+    total_rows: int,
+    precision: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    The divider line under each of num_rows rows starting at table row
+    row_offset; the table's last row (of total_rows) gets the Persian Red rule.
+    """
+    header_divider_y = layout["header_divider_y"]
+    row_height = layout["row_height"]
+    rule_x1 = fmt_num(layout["margin_left"], precision)
+    rule_x2 = fmt_num(layout["svg_width"] - layout["margin_right"], precision)
+    stroke_width = fmt_num(_pts_to_px(1), precision)
+    for i in range(row_offset + 1, row_offset + num_rows + 1):
+        y = fmt_num(header_divider_y + row_height * i, precision)
+        color = TABLE_COLORS["persian_red"] if i == total_rows else TABLE_COLORS["cadet"]
+        yield (
+            f'<line x1="{rule_x1}" y1="{y}" '
+            f'x2="{rule_x2}" y2="{y}" '
+            f'stroke="{color}" stroke-width="{stroke_width}"/>'
+        )
+
+
+def _row_cell_parts(
+    rows: Iterable[Sequence],
+    fmt_list: List[str],
+    positions: List[Tuple[float, str]],
+    layout: Dict,
+    precision: Optional[int] = None,
+    row_offset: int = 0,
+) -> Iterator[str]:
+    """One <text class="cell"> per non-blank cell, row by row (rows are value tuples in column order)."""
+    header_divider_y = layout["header_divider_y"]
+    row_height = layout["row_height"]
+    cells = [
+        (fmt, f'" class="cell" text-anchor="{anchor}">', f'<text x="{fmt_num(x, precision)}" y="')
+        for fmt, (x, anchor) in zip(fmt_list, positions)
+    ]
+    for row_index, values in enumerate(rows):
+        center_y = fmt_num(header_divider_y + row_height * (row_offset + row_index + 0.5), precision)
+        for (fmt, attrs, text_open), raw_value in zip(cells, values):
             rendered = format_value(raw_value, fmt)
             if rendered == "":
                 continue  # blank cell
-            align = just[col_index]
-            x, anchor = get_text_position(col_index, align)
-            parts.append(
-                f'<text x="{x}" y="{center_y}" class="cell" '
-                f'text-anchor="{anchor}">{escape_xml(rendered)}</text>'
-            )
+            yield f'{text_open}{center_y}{attrs}{_escape_xml(rendered)}</text>'
 
-    parts.append("</svg>")
-    return "\n".join(parts)
 
+def _column_group(x: float, anchor: str, group_columns: bool, precision: Optional[int]) -> Tuple[str, str]:
+    """(opening <g>, x attribute for each cell) of a column's cell group."""
+    if group_columns:
+        return f'<g class="cell" text-anchor="{anchor}" transform="translate({fmt_num(x, precision)})">', ""
+    return f'<g class="cell" text-anchor="{anchor}">', f'x="{fmt_num(x, precision)}" '
 
-def generate_highlight_overlay(
-    kind: Literal["row", "column", "cell"],
-    *,
-    data: List[Dict],
-    cols: Optional[List[str]],
-    headers: Optional[List[str]],
-    formats: Optional[List[str]],
-    svg_size: Tuple[int, int],
-    font_size_pt: int,
-    col_widths: Optional[List[float]] = None,
-    row_index: Optional[int] = None,
-    col_index: Optional[int] = None,
-    color_rgb: str = "rgb(221,232,185)",  # Tea
-    opacity: float = 0.5,
+
+# Layout fields the row-independent parts of a table SVG depend on
+TEMPLATE_LAYOUT_KEYS = (
+    "svg_width", "svg_height", "font_size_px", "margin_left", "margin_right",
+    "top_rule_y", "header_center_y", "header_divider_y", "row_height",
+    "col_start_x", "col_end_x",
+)
+TEMPLATE_MAX_ROWS = 2000  # taller tables build their dividers each time instead of caching them
+
+
+def _layout_signature(layout: Dict) -> Tuple:
+    """The layout fields a table template depends on, as a hashable tuple."""
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (layout[key] for key in TEMPLATE_LAYOUT_KEYS)
+    )
+
+
+@lru_cache(maxsize=128)
+def _table_template(
+    signature: Tuple,
+    header_labels: Tuple,
+    just: Tuple[str, ...],
+    background_color: Optional[str],
+    precision: Optional[int],
+    minify: bool,
+    group_columns: bool,
+    include_header: bool,
+    view_box: Optional[Tuple[float, float, float, float]],
+    row_offset: int,
+    num_rows: int,
+    total_rows: int,
 ) -> str:
     """
-    Generate an SVG overlay to highlight a row, column, or cell.
-    Uses the same layout logic (including auto font shrink) as the base table.
+    Everything in a table SVG before the cells (root, <style>, rules, headers,
+    row dividers), joined and cached per layout signature: same-shaped tables
+    (monthly calendars, _a / _b pairs, pages, series) only format their cells.
     """
-    if kind not in ("row", "column", "cell"):
-        raise ValueError("kind must be 'row', 'column', or 'cell'.")
-    if len(data) <= 0:
-        raise ValueError("data_length must be positive.")
+    layout = dict(zip(TEMPLATE_LAYOUT_KEYS, signature))
+    parts = _table_chrome_parts(
+        list(header_labels), list(just), layout, background_color, precision,
+        minify, group_columns, include_header, view_box,
+    )
+    parts.extend(_row_divider_parts(layout, row_offset, num_rows, total_rows, precision))
+    return ("" if minify else "\n").join(parts)
 
-    # Resolve columns / headers exactly as in generate_svg_table
-    if cols and len(cols) > 0:
-        col_keys = cols
-    else:
-        col_keys = list(data[0].keys())
-    num_cols = len(col_keys)
 
-    if headers and len(headers) == num_cols:
-        header_labels = headers
-    else:
-        header_labels = col_keys
+def _emit_table_svg(
+    rows: List[Dict],
+    col_keys: List[str],
+    header_labels: List[str],
+    fmt_list: List[str],
+    just: List[str],
+    layout: Dict,
+    background_color: Optional[str] = None,
+    precision: Optional[int] = None,
+    minify: bool = False,
+    group_columns: bool = False,
+    row_offset: int = 0,
+    total_rows: Optional[int] = None,
+    include_header: bool = True,
+    view_box: Optional[Tuple[float, float, float, float]] = None,
+) -> str:
+    """
+    Emit the SVG for `rows` against an already computed layout.
 
-    # Formats
-    if formats and len(formats) == num_cols:
-        fmt_list = [f or "text" for f in formats]
+    rows[0] is drawn at table row `row_offset` (the last of `total_rows` gets
+    the Persian Red rule). view_box, if given, sets the root size/viewBox to a
+    region of the table instead of the full svg_size.
+    """
+    num_rows = len(rows)
+    if total_rows is None:
+        total_rows = row_offset + num_rows
+    if minify and precision is None:
+        precision = 2
+
+    template = _table_template if num_rows <= TEMPLATE_MAX_ROWS else _table_template.__wrapped__
+    parts = [template(
+        _layout_signature(layout), tuple(header_labels), tuple(just), background_color,
+        precision, minify, group_columns, include_header, view_box,
+        row_offset, num_rows, total_rows,
+    )]
+
+    # Data rows
+    columns = _column_values(rows, col_keys)
+    positions = _text_positions(layout, just)
+    if minify or group_columns:
+        # One <g> per column carries the shared class and anchor (and x, if grouped)
+        header_divider_y = layout["header_divider_y"]
+        row_height = layout["row_height"]
+        row_ys = [
+            fmt_num(header_divider_y + row_height * (row_offset + r + 0.5), precision)
+            for r in range(num_rows)
+        ]
+        for values, fmt, (x, anchor) in zip(columns, fmt_list, positions):
+            group_open, x_attr = _column_group(x, anchor, group_columns, precision)
+            cells: List[str] = []
+            for row_index, raw_value in enumerate(values):
+                rendered = format_value(raw_value, fmt)
+                if rendered == "":
+                    continue  # blank cell
+                cells.append(
+                    f'<text {x_attr}y="{row_ys[row_index]}">{_escape_xml(rendered)}</text>'
+                )
+            if cells:
+                parts.append(group_open)
+                parts.extend(cells)
+                parts.append("</g>")
     else:
-        fmt_list = ["text"] * num_cols
+        parts.extend(_row_cell_parts(zip(*columns), fmt_list, positions, layout, precision, row_offset))
+
+    parts.append("</svg>")
+    return ("" if minify else "\n").join(parts)
 
+
+def generate_svg_table(
+    data: List[Dict],
+    cols: Optional[List[str]] = None,
+    headers: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    font_size_pt: int = 14,
+    svg_size: Tuple[int, int] = (800, 500),
+    justifications: Optional[List[str]] = None,
+    col_widths: Optional[List[float]] = None,
+    background_color: Optional[str] = None,   # None = transparent
+    precision: Optional[int] = None,          # None = full float output
+    minify: bool = False,
+    group_columns: bool = False,
+) -> str:
+    """
+    Generate SVG table following your style guide, with optional Oxford Blue background.
+    Auto-resizes columns and shrinks font if needed so all text fits.
+
+    precision rounds all geometry to that many decimals. minify writes a compact
+    one-line <style>, no whitespace between elements, and wraps each column's
+    cells in a <g> carrying the shared class and text-anchor (defaults to
+    precision=2 if none given).
+
+    group_columns also moves each column's shared x onto its <g> as a
+    translate(), so cells are bare <text y="..."> elements. Header texts keep
+    their own x so overlaySVG.py can still detect column boundaries.
+    """
+    data = _table_data(data)
+
+    col_keys, header_labels, fmt_list, just = _resolve_table_columns(
+        data, cols, headers, formats, justifications
+    )
+
+    # Layout (auto-fit columns + font, uses formatted text lengths)
     layout = _compute_table_layout(
         data=data,
         col_keys=col_keys,
@@ -583,19 +1089,36 @@ def generate_highlight_overlay(
         col_widths=col_widths,
     )
 
-    svg_width = layout["svg_width"]
-    svg_height = layout["svg_height"]
+    return _render_table_svg(
+        data,
+        col_keys,
+        header_labels,
+        fmt_list,
+        just,
+        layout,
+        background_color=background_color,
+        precision=precision,
+        minify=minify,
+        group_columns=group_columns,
+    )
+
+
+def _highlight_rect(
+    kind: Literal["row", "column", "cell"],
+    layout: Dict,
+    num_rows: int,
+    row_index: Optional[int] = None,
+    col_index: Optional[int] = None,
+) -> Tuple[float, float, float, float]:
+    """(x, y, width, height) of a row / column / cell highlight on a layout."""
     header_divider_y = layout["header_divider_y"]
     row_height = layout["row_height"]
     col_start_x = layout["col_start_x"]
     col_end_x = layout["col_end_x"]
-    data_length = len(data)
-    col_count = num_cols
-
-    x = y = width = height = None
+    col_count = len(col_start_x)
 
     if kind == "row":
-        if row_index is None or not (0 <= row_index < data_length):
+        if row_index is None or not (0 <= row_index < num_rows):
             raise ValueError("row_index must be valid for kind='row'.")
         row_top = header_divider_y + row_height * row_index
         x = col_start_x[0]
@@ -610,11 +1133,11 @@ def generate_highlight_overlay(
         x = col_left
         y = header_divider_y
         width = col_end_x[col_index] - col_start_x[col_index]
-        height = row_height * data_length
+        height = row_height * num_rows
 
-    else:  # cell
+    elif kind == "cell":
         if (
-            row_index is None or not (0 <= row_index < data_length)
+            row_index is None or not (0 <= row_index < num_rows)
             or col_index is None or not (0 <= col_index < col_count)
         ):
             raise ValueError("row_index and col_index must be valid for kind='cell'.")
@@ -625,14 +1148,563 @@ def generate_highlight_overlay(
         width = col_end_x[col_index] - col_start_x[col_index]
         height = row_height
 
-    svg = (
+    else:
+        raise ValueError("kind must be 'row', 'column', or 'cell'.")
+
+    return x, y, width, height
+
+
+def _overlay_svg(
+    layout: Dict,
+    rect: Tuple[float, float, float, float],
+    color_rgb: str,
+    opacity: float,
+    precision: Optional[int] = None,
+) -> str:
+    return _overlay_rects_svg(layout, [rect], color_rgb, opacity, precision)
+
+
+def _overlay_rects_svg(
+    layout: Dict,
+    rects: List[Tuple[float, float, float, float]],
+    color_rgb: str,
+    opacity: float,
+    precision: Optional[int] = None,
+) -> str:
+    """Overlay SVG sized like the table, with one <rect> per (x, y, width, height)."""
+    svg_width = layout["svg_width"]
+    svg_height = layout["svg_height"]
+    parts = [
         f'<svg width="{svg_width}" height="{svg_height}" '
         f'viewBox="0 0 {svg_width} {svg_height}" xmlns="http://www.w3.org/2000/svg">\n'
-        f'  <rect x="{x}" y="{y}" width="{width}" height="{height}" '
-        f'fill="{color_rgb}" fill-opacity="{opacity}" />\n'
-        f"</svg>"
+    ]
+    for x, y, width, height in rects:
+        parts.append(
+            f'  <rect x="{fmt_num(x, precision)}" y="{fmt_num(y, precision)}" '
+            f'width="{fmt_num(width, precision)}" height="{fmt_num(height, precision)}" '
+            f'fill="{color_rgb}" fill-opacity="{opacity}" />\n'
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+def generate_highlight_overlay(
+    kind: Literal["row", "column", "cell"],
+    *,
+    data: List[Dict],
+    cols: Optional[List[str]],
+    headers: Optional[List[str]],
+    formats: Optional[List[str]],
+    svg_size: Tuple[int, int],
+    font_size_pt: int,
+    col_widths: Optional[List[float]] = None,
+    row_index: Optional[int] = None,
+    col_index: Optional[int] = None,
+    color_rgb: str = "rgb(221,232,185)",  # Tea
+    opacity: float = 0.5,
+    precision: Optional[int] = None,
+) -> str:
+    """
+    Generate an SVG overlay to highlight a row, column, or cell.
+    Uses the same layout logic (including auto font shrink) as the base table.
+    """
+    if kind not in ("row", "column", "cell"):
+        raise ValueError("kind must be 'row', 'column', or 'cell'.")
+    data = _table_data(data)
+
+    # Resolve columns / headers exactly as in generate_svg_table
+    col_keys, header_labels, fmt_list, _ = _resolve_table_columns(
+        data, cols, headers, formats
+    )
+
+    layout = _compute_table_layout(
+        data=data,
+        col_keys=col_keys,
+        headers=header_labels,
+        formats=fmt_list,
+        svg_size=svg_size,
+        font_size_pt=font_size_pt,
+        col_widths=col_widths,
+    )
+
+    rect = _highlight_rect(kind, layout, len(data), row_index, col_index)
+    return _overlay_svg(layout, rect, color_rgb, opacity, precision)
+
+
+# ----------------------------
+#  Pagination (tall tables)
+# ----------------------------
+
+def paginate_table_layout(
+    data: List[Dict],
+    cols: Optional[List[str]] = None,
+    headers: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    font_size_pt: int = 14,
+    svg_size: Tuple[int, int] = (800, 500),
+    col_widths: Optional[List[float]] = None,
+    min_font_size_pt: float = 9,
+) -> Dict:
+    """
+    Work out how a table splits across SVG pages.
+
+    If the whole table fits on one page at >= min_font_size_pt, there is a
+    single page with the usual auto-fit layout. Otherwise rows are split at the
+    minimum legible font size (or smaller, if the requested size or the width
+    already force it), with the header repeated on every page.
+
+    Columns are measured once over the whole table, so every page shares one
+    layout: same font, same column widths, same row height.
+    """
+    data = _table_data(data)
+
+    col_keys, header_labels, fmt_list, _ = _resolve_table_columns(
+        data, cols, headers, formats
+    )
+    max_chars_per_col = _measure_columns(data, col_keys, header_labels, fmt_list)
+    num_rows = len(data)
+    min_font_px = _pts_to_px(min_font_size_pt)
+
+    with _stage("layout"):
+        layout = _fit_table_layout(
+            max_chars_per_col, num_rows, svg_size, font_size_pt, col_widths
+        )
+        if layout["font_size_px"] >= min_font_px:
+            rows_per_page = num_rows
+        else:
+            # Font allowed by the width alone (a zero-row table never binds on height)
+            width_only = _fit_table_layout(
+                max_chars_per_col, 0, svg_size, font_size_pt, col_widths
+            )
+            page_font_px = min(width_only["font_size_px"], min_font_px)
+            row_height = 1.5 * page_font_px
+            rows_per_page = max(1, int(svg_size[1] // row_height) - 1)
+            layout = _fit_table_layout(
+                max_chars_per_col, rows_per_page, svg_size, font_size_pt, col_widths
+            )
+
+    num_pages = (num_rows + rows_per_page - 1) // rows_per_page
+    return {
+        "layout": layout,
+        "rows_per_page": rows_per_page,
+        "num_pages": num_pages,
+        "num_rows": num_rows,
+    }
+
+
+def page_for_row(row_index: int, rows_per_page: int) -> Tuple[int, int]:
+    """Map a global 0-based row index to (page_index, row_index_on_page)."""
+    return divmod(row_index, rows_per_page)
+
+
+def iter_svg_table_pages(
+    data: List[Dict],
+    cols: Optional[List[str]] = None,
+    headers: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    font_size_pt: int = 14,
+    svg_size: Tuple[int, int] = (800, 500),
+    justifications: Optional[List[str]] = None,
+    col_widths: Optional[List[float]] = None,
+    background_color: Optional[str] = None,
+    min_font_size_pt: float = 9,
+    pagination: Optional[Dict] = None,
+    precision: Optional[int] = None,
+    minify: bool = False,
+    group_columns: bool = False,
+):
+    """
+    Yield one SVG string per page, lazily, each with the header repeated.
+    Pass a `pagination` from paginate_table_layout to reuse its layout.
+    """
+    data = _table_data(data)
+    if pagination is None:
+        pagination = paginate_table_layout(
+            data, cols, headers, formats, font_size_pt, svg_size, col_widths,
+            min_font_size_pt,
+        )
+    col_keys, header_labels, fmt_list, just = _resolve_table_columns(
+        data, cols, headers, formats, justifications
+    )
+    layout = pagination["layout"]
+    rows_per_page = pagination["rows_per_page"]
+    for start in range(0, len(data), rows_per_page):
+        yield _render_table_svg(
+            data[start:start + rows_per_page],
+            col_keys,
+            header_labels,
+            fmt_list,
+            just,
+            layout,
+            background_color=background_color,
+            precision=precision,
+            minify=minify,
+            group_columns=group_columns,
+        )
+
+
+def generate_page_highlight_overlays(
+    kind: Literal["row", "column", "cell"],
+    pagination: Dict,
+    row_index: Optional[int] = None,
+    col_index: Optional[int] = None,
+    color_rgb: str = "rgb(221,232,185)",  # Tea
+    opacity: float = 0.5,
+    precision: Optional[int] = None,
+) -> List[Tuple[int, str]]:
+    """
+    Highlight overlays for a paginated table, addressed by GLOBAL row index.
+    Returns (page_index, svg) pairs: one page for a row or cell, every page
+    for a column. Uses the pagination's shared layout; nothing is re-laid out.
+    """
+    layout = pagination["layout"]
+    rows_per_page = pagination["rows_per_page"]
+    num_rows = pagination["num_rows"]
+
+    def rows_on(page: int) -> int:
+        return min(rows_per_page, num_rows - page * rows_per_page)
+
+    if kind == "column":
+        return [
+            (page, _overlay_svg(
+                layout,
+                _highlight_rect("column", layout, rows_on(page), col_index=col_index),
+                color_rgb, opacity, precision,
+            ))
+            for page in range(pagination["num_pages"])
+        ]
+
+    if row_index is None or not (0 <= row_index < num_rows):
+        raise ValueError(f"row_index must be valid for kind='{kind}'.")
+    page, local_row = page_for_row(row_index, rows_per_page)
+    rect = _highlight_rect(kind, layout, rows_on(page), local_row, col_index)
+    return [(page, _overlay_svg(layout, rect, color_rgb, opacity, precision))]
+
+
+# ----------------------------
+#  Windowed rendering (huge tables)
+# ----------------------------
+
+def prepare_table_windows(
+    data: List[Dict],
+    cols: Optional[List[str]] = None,
+    headers: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    font_size_pt: int = 14,
+    svg_width: int = 800,
+    justifications: Optional[List[str]] = None,
+    col_widths: Optional[List[float]] = None,
+) -> Dict:
+    """
+    Measure and lay out a whole table once for windowed rendering.
+
+    The font is only fitted to the width (never shrunk for height), and the
+    layout covers the full table height, so every window rendered from it has
+    the same font, column widths and absolute row positions.
+    """
+    data = _table_data(data)
+
+    col_keys, header_labels, fmt_list, just = _resolve_table_columns(
+        data, cols, headers, formats, justifications
+    )
+    max_chars_per_col = _measure_columns(data, col_keys, header_labels, fmt_list)
+    with _stage("layout"):
+        layout = _fit_table_layout(
+            max_chars_per_col,
+            num_rows=len(data),
+            svg_size=(svg_width, 0),
+            font_size_pt=font_size_pt,
+            col_widths=col_widths,
+            fit_height=False,
+        )
+    return {
+        "layout": layout,
+        "col_keys": col_keys,
+        "header_labels": header_labels,
+        "fmt_list": fmt_list,
+        "just": just,
+        "num_rows": len(data),
+    }
+
+
+def render_table_window(
+    data: List[Dict],
+    start: int,
+    stop: int,
+    prepared: Dict,
+    background_color: Optional[str] = None,
+    precision: Optional[int] = None,
+    minify: bool = False,
+    group_columns: bool = False,
+) -> str:
+    """
+    Render rows [start, stop) of a table prepared by prepare_table_windows.
+
+    Only those rows are formatted and emitted, at their absolute y positions;
+    the SVG's viewBox is the window's slice of the full table. The header is
+    drawn only in the window that starts at row 0.
+
+    A DataFrame is converted on every call; to render many windows, pass
+    tableColumns.as_table(df) instead.
+    """
+    data = as_table(data)
+    num_rows = prepared["num_rows"]
+    start = max(0, start)
+    stop = min(stop, num_rows)
+    if start >= stop:
+        raise ValueError("window must contain at least one row.")
+
+    layout = prepared["layout"]
+    header_divider_y = layout["header_divider_y"]
+    row_height = layout["row_height"]
+    top = 0.0 if start == 0 else header_divider_y + row_height * start
+    bottom = header_divider_y + row_height * stop
+    view_box = (0, top, layout["svg_width"], bottom - top)
+
+    return _render_table_svg(
+        data[start:stop],
+        prepared["col_keys"],
+        prepared["header_labels"],
+        prepared["fmt_list"],
+        prepared["just"],
+        layout,
+        background_color=background_color,
+        precision=precision,
+        minify=minify,
+        group_columns=group_columns,
+        row_offset=start,
+        total_rows=num_rows,
+        include_header=start == 0,
+        view_box=view_box,
+    )
+
+
+# ----------------------------
+#  Streaming rendering (JSON arrays too big to load)
+# ----------------------------
+
+_JSON_WS_RE = re.compile(r"[ \t\n\r]*")
+
+
+def iter_json_array(path: Path, chunk_size: int = 1 << 16) -> Iterator[Dict]:
+    """
+    Yield the row objects of a JSON array file one at a time. The file is
+    read in chunks and each row decoded with raw_decode, so only the current
+    chunk and row are ever in memory.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf, pos = "", 0
+
+        def next_char() -> str:
+            """Skip whitespace; the next character ("" at end of file)."""
+            nonlocal buf, pos
+            while True:
+                pos = _JSON_WS_RE.match(buf, pos).end()
+                if pos < len(buf):
+                    return buf[pos]
+                buf, pos = f.read(chunk_size), 0
+                if not buf:
+                    return ""
+
+        if next_char() != "[":
+            raise ValueError(f"{path} is not a JSON array")
+        pos += 1
+        c = next_char()
+        if c == "]":
+            return
+        row_count = 0
+        while True:
+            if c != "{":
+                raise ValueError(f"{path}: item {row_count} is not a row object")
+            while True:
+                try:
+                    row, pos = decoder.raw_decode(buf, pos)
+                    break
+                except json.JSONDecodeError:
+                    # row runs past the chunk: read on (errors out at end of file)
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        raise
+                    buf, pos = buf[pos:] + chunk, 0
+            yield row
+            row_count += 1
+            c = next_char()
+            if c == "]":
+                return
+            if c != ",":
+                raise ValueError(f"{path}: expected ',' or ']' after item {row_count - 1}")
+            pos += 1
+            c = next_char()
+
+
+def _spool_column_groups(
+    out,
+    sep: str,
+    rows: Iterable[Sequence],
+    fmt_list: List[str],
+    positions: List[Tuple[float, str]],
+    layout: Dict,
+    precision: Optional[int],
+    group_columns: bool,
+):
+    """
+    Write the per-column cell groups of a minified / grouped table from a
+    stream of rows: each column's cells go to its own temporary file and the
+    files are copied out in column order, so memory stays flat.
+    """
+    header_divider_y = layout["header_divider_y"]
+    row_height = layout["row_height"]
+    groups = [_column_group(x, anchor, group_columns, precision) for x, anchor in positions]
+    spools = [tempfile.TemporaryFile("w+", encoding="utf-8") for _ in groups]
+    try:
+        has_cells = [False] * len(groups)
+        for row_index, values in enumerate(rows):
+            y = fmt_num(header_divider_y + row_height * (row_index + 0.5), precision)
+            for j, raw_value in enumerate(values):
+                rendered = format_value(raw_value, fmt_list[j])
+                if rendered == "":
+                    continue  # blank cell
+                if has_cells[j]:
+                    spools[j].write(sep)
+                spools[j].write(f'<text {groups[j][1]}y="{y}">{_escape_xml(rendered)}</text>')
+                has_cells[j] = True
+
+        for (group_open, _), spool, used in zip(groups, spools, has_cells):
+            if used:
+                out.write(sep + group_open + sep)
+                spool.seek(0)
+                shutil.copyfileobj(spool, out)
+                out.write(sep + "</g>")
+    finally:
+        for spool in spools:
+            spool.close()
+
+
+def stream_svg_table(
+    json_path: Path,
+    out_path: Path,
+    cols: Optional[List[str]] = None,
+    headers: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    font_size_pt: int = 14,
+    svg_size: Tuple[int, int] = (800, 500),
+    justifications: Optional[List[str]] = None,
+    col_widths: Optional[List[float]] = None,
+    background_color: Optional[str] = None,
+    precision: Optional[int] = None,
+    minify: bool = False,
+    group_columns: bool = False,
+) -> Dict:
+    """
+    Render a JSON array file to out_path in two streaming passes, holding one
+    row at a time: the first pass counts rows and measures each column, the
+    second writes the SVG as it reads rows again. The file is byte-for-byte
+    what generate_svg_table writes for the loaded array.
+
+    Returns the layout (for highlight overlays; num_rows is in it).
+    """
+    # Pass 1: row count + longest formatted string per column
+    col_keys: Optional[List[str]] = None
+    max_chars_per_col: List[int] = []
+    num_rows = 0
+    with _stage("format"):
+        for row in iter_json_array(json_path):
+            if col_keys is None:
+                col_keys, header_labels, fmt_list, just = _resolve_table_columns(
+                    [row], cols, headers, formats, justifications
+                )
+                max_chars_per_col = [len(str(label)) for label in header_labels]
+            for j, key in enumerate(col_keys):
+                if key in row:
+                    width = len(format_value(row[key], fmt_list[j]))
+                    if width > max_chars_per_col[j]:
+                        max_chars_per_col[j] = width
+            num_rows += 1
+    if col_keys is None:
+        raise ValueError(f"{json_path} has no rows.")
+
+    with _stage("layout"):
+        layout = _fit_table_layout(
+            max_chars_per_col,
+            num_rows=num_rows,
+            svg_size=svg_size,
+            font_size_pt=font_size_pt,
+            col_widths=col_widths,
+        )
+
+    # Pass 2: emit straight to the file
+    if minify and precision is None:
+        precision = 2
+    sep = "" if minify else "\n"
+    positions = _text_positions(layout, just)
+    rows = (
+        tuple(row.get(key, "") for key in col_keys) for row in iter_json_array(json_path)
     )
-    return svg
+    with _stage("emit"), open(out_path, "w", encoding="utf-8") as out:
+        out.write(sep.join(_table_chrome_parts(
+            header_labels, just, layout, background_color, precision, minify, group_columns,
+        )))
+        out.writelines(sep + part for part in _row_divider_parts(layout, 0, num_rows, num_rows, precision))
+        if minify or group_columns:
+            _spool_column_groups(out, sep, rows, fmt_list, positions, layout, precision, group_columns)
+        else:
+            out.writelines(sep + part for part in _row_cell_parts(rows, fmt_list, positions, layout, precision))
+        out.write(sep + "</svg>")
+    return layout
+
+
+# ----------------------------
+#  Autopush
+# ----------------------------
+
+def autopush_svgs(output_dir: Path):
+    """Stage output_dir, commit with a timestamped message and push to origin/main."""
+    print("\n--- AUTOPUSH START ---")
+
+    # Ensure we are in a git repo
+    ok, out = run_git_command(["git", "rev-parse", "--is-inside-work-tree"])
+    if not ok or "true" not in out:
+        print("Not inside a git repository. Auto-push skipped.")
+        return
+
+    # Stage only the SVG directory
+    print(f"Staging SVGs from: {output_dir}")
+    ok, out = run_git_command(["git", "add", str(output_dir)])
+    if not ok:
+        print("Failed to git add SVGs:")
+        print(out)
+        return
+
+    # Check if anything actually changed
+    ok, out = run_git_command(["git", "status", "--porcelain"])
+    if not ok:
+        print("git status failed:")
+        print(out)
+        return
+
+    if out.strip() == "":
+        print("No changes to commit.")
+        return
+
+    # Create commit message with timestamp
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    commit_message = f"Auto-update SVG tables ({timestamp})"
+
+    print("Committing...")
+    ok, out = run_git_command(["git", "commit", "-m", commit_message])
+    if not ok:
+        print("Commit failed:")
+        print(out)
+        return
+
+    print("Pushing to origin/main...")
+    ok, out = run_git_command(["git", "push", "origin", "main"])
+    if not ok:
+        print("Push failed:")
+        print(out)
+    else:
+        print("Auto-push successful!")
 
 
 # ----------------------------
@@ -643,7 +1715,10 @@ def main():
     parser = argparse.ArgumentParser(
         description="Generate SVG table + optional highlights from JSON."
     )
-    parser.add_argument("json_file", help="Path to input JSON file (e.g., Table14_1a.json)")
+    parser.add_argument(
+        "json_file",
+        help="Path to input JSON file (e.g., Table14_1a.json), or a .csv / .tsv file with a header row",
+    )
     parser.add_argument("--cols", nargs="*", help="Column keys to include (default: all keys from first row)")
     parser.add_argument("--headers", nargs="*", help="Custom header labels (must match number of cols)")
     parser.add_argument("--justify", nargs="*", help="Per-column alignment codes: L, C, R")
@@ -691,6 +1766,82 @@ def main():
         help="Highlight a cell, e.g. --cellhighlight 8 4 Cinnabar",
     )
 
+    parser.add_argument(
+        "--precision",
+        type=int,
+        help="Round geometry to this many decimals (default: full precision)",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Compact output: one-line style, no whitespace, cells grouped per column "
+             "(implies --precision 2 unless given).",
+    )
+    parser.add_argument(
+        "--groupcols",
+        action="store_true",
+        help="Put each column's shared x and anchor on a <g>; cells carry only y.",
+    )
+
+    # Query stage: applied right after loading, so only the rows and
+    # columns left are ever formatted or measured
+    parser.add_argument(
+        "--select",
+        nargs="+",
+        metavar="COL",
+        help="Keep only these columns of the JSON rows (--cols then picks among them)",
+    )
+    parser.add_argument(
+        "--where",
+        action="append",
+        metavar="CONDITION",
+        help='Keep rows matching a condition, e.g. --where "Weight > 5%%" --where "Country == US"',
+    )
+    parser.add_argument(
+        "--sort",
+        metavar="COL",
+        help="Sort rows by this column (numbers, then text; blanks last)",
+    )
+    parser.add_argument("--desc", action="store_true", help="With --sort, largest first")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        metavar="N",
+        help="Keep only the first N rows after --where / --sort (top-N uses a partial sort)",
+    )
+
+    # Pagination for tall tables
+    parser.add_argument(
+        "--paginate",
+        action="store_true",
+        help="Split rows across several SVG pages (header repeated) instead of "
+             "shrinking the font below --minfont.",
+    )
+    parser.add_argument(
+        "--minfont",
+        type=float,
+        default=9,
+        help="Minimum legible font size in pt when paginating (default: 9)",
+    )
+
+    # Streaming render for JSON arrays too big to load
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Read the JSON array in two streaming passes (measure, then write) so memory "
+             "stays flat however big it is; same SVG. Not with --paginate or query flags.",
+    )
+
+    # Optional PNG export (needs cairosvg or rsvg-convert, see rasterSVG.py)
+    parser.add_argument(
+        "--png",
+        nargs="?",
+        type=float,
+        const=1.0,
+        metavar="SCALE",
+        help="Also write PNGs of every generated SVG to <svg dir>/png (optional scale, default 1).",
+    )
+
     # Optional Oxford Blue background
     parser.add_argument(
         "--bgoxford",
@@ -698,14 +1849,123 @@ def main():
         help="If set, draw an Oxford Blue background (otherwise transparent).",
     )
 
+    # Profiling / instrumentation
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        metavar="REPORT_JSON",
+        help="Record per-stage wall time and call counts; write a JSON report "
+             "to REPORT_JSON (or stdout if no path is given).",
+    )
+    parser.add_argument(
+        "--tracemalloc",
+        action="store_true",
+        help="With --profile, also record per-stage peak allocations and top allocation sites.",
+    )
+    parser.add_argument(
+        "--cprofile",
+        metavar="PROF_FILE",
+        help="Run under cProfile and dump stats to PROF_FILE (view with python -m pstats).",
+    )
+
     args = parser.parse_args()
+    if args.tracemalloc and not args.profile:
+        parser.error("--tracemalloc only reports through --profile; add --profile")
+    if args.stream:
+        if Path(args.json_file).suffix.lower() in DELIMITERS:
+            parser.error("--stream reads JSON arrays; CSV/TSV input is already column-streamed")
+        if args.paginate or args.select or args.where or args.sort or args.limit is not None:
+            parser.error("--stream cannot be combined with --paginate or query flags")
+
+    cprof = None
+    if args.cprofile:
+        import cProfile
+        cprof = cProfile.Profile()
+
+    if args.tracemalloc:
+        tracemalloc.start()
 
+    try:
+        if args.profile:
+            with render_profiling(track_allocations=args.tracemalloc) as prof:
+                if cprof is not None:
+                    cprof.enable()
+                try:
+                    _render_from_args(args)
+                finally:
+                    if cprof is not None:
+                        cprof.disable()
+            report = prof.report()
+            report["input"] = args.json_file
+            if args.tracemalloc:
+                snapshot = tracemalloc.take_snapshot()
+                report["top_allocations"] = [
+                    {
+                        "site": str(stat.traceback[0]),
+                        "size_kb": stat.size / 1024.0,
+                        "count": stat.count,
+                    }
+                    for stat in snapshot.statistics("lineno")[:10]
+                ]
+            text = json.dumps(report, indent=1)
+            if args.profile == "-":
+                print(text)
+            else:
+                with open(args.profile, "w", encoding="utf-8") as f:
+                    f.write(text)
+                print(f"Profile report saved to: {args.profile}")
+        else:
+            if cprof is not None:
+                cprof.enable()
+            try:
+                _render_from_args(args)
+            finally:
+                if cprof is not None:
+                    cprof.disable()
+    finally:
+        if cprof is not None:
+            cprof.dump_stats(args.cprofile)
+            print(f"cProfile stats saved to: {args.cprofile}")
+        if args.tracemalloc:
+            tracemalloc.stop()
+
+
+def _export_png(svg_paths: List[Path], scale: float):
+    """Rasterize the SVGs just written (cached; see rasterSVG.py)."""
+    from rasterSVG import print_results, rasterize_files
+
+    with _stage("raster"):
+        try:
+            results = rasterize_files(svg_paths, scale=scale)
+        except RuntimeError as e:
+            print(f"PNG export skipped: {e}")
+            return
+    print_results(results)
+
+
+def _render_from_args(args):
+    """Render the table (and any highlights) described by parsed CLI args."""
     json_path = Path(args.json_file)
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
 
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if args.stream:
+        _stream_from_args(args, json_path)
+        return
+
+    with _stage("load"):
+        data = load_table(json_path)  # JSON rows, or a CSV / TSV file as columns
+
+    if args.select or args.where or args.sort or args.limit is not None:
+        data = query_table(
+            data,
+            select=args.select,
+            where=args.where,
+            sort_by=args.sort,
+            descending=args.desc,
+            limit=args.limit,
+        )
 
     svg_width, svg_height = args.size
     cols = args.cols
@@ -716,6 +1976,9 @@ def main():
     font_size_pt = args.fontsize
 
     bg_color = color_from_name("oxford") if args.bgoxford else None
+    precision = args.precision
+    if args.minify and precision is None:
+        precision = 2
 
     # Base name for outputs (Scott.json -> Scott)
     base_name = json_path.stem
@@ -729,6 +1992,73 @@ def main():
 
     generated_files: List[Path] = []
 
+    if args.paginate:
+        pagination = paginate_table_layout(
+            data,
+            cols=cols,
+            headers=headers,
+            formats=formats,
+            font_size_pt=font_size_pt,
+            svg_size=(svg_width, svg_height),
+            col_widths=col_widths,
+            min_font_size_pt=args.minfont,
+        )
+        if pagination["num_pages"] > 1:
+            pages = iter_svg_table_pages(
+                data,
+                cols=cols,
+                headers=headers,
+                formats=formats,
+                justifications=justifications,
+                background_color=bg_color,
+                pagination=pagination,
+                precision=precision,
+                minify=args.minify,
+                group_columns=args.groupcols,
+            )
+            for page, page_svg in enumerate(pages, start=1):
+                path = unique_path(output_dir / f"{base_name}_p{page}.svg")
+                _write_svg(path, page_svg)
+                generated_files.append(path)
+                print(f"Page {page}/{pagination['num_pages']} saved to: {path}")
+
+            highlights = []
+            if args.rowhighlight:
+                row_idx_str, color_name = args.rowhighlight
+                highlights.append(("row", int(row_idx_str), None, color_name,
+                                   f"row_{row_idx_str}"))
+            if args.colhighlight:
+                col_idx_str, color_name = args.colhighlight
+                highlights.append(("column", None, int(col_idx_str), color_name,
+                                   f"col_{col_idx_str}"))
+            if args.cellhighlight:
+                row_idx_str, col_idx_str, color_name = args.cellhighlight
+                highlights.append(("cell", int(row_idx_str), int(col_idx_str), color_name,
+                                   f"cell_{row_idx_str}_{col_idx_str}"))
+
+            for kind, row_index, col_index, color_name, label in highlights:
+                overlays = generate_page_highlight_overlays(
+                    kind,
+                    pagination,
+                    row_index=row_index,
+                    col_index=col_index,
+                    color_rgb=color_from_name(color_name),
+                    opacity=0.5,
+                    precision=precision,
+                )
+                for page, overlay_svg in overlays:
+                    name = f"{base_name}_p{page + 1}_{label}_{color_name}.svg"
+                    path = unique_path(output_dir / name)
+                    _write_svg(path, overlay_svg)
+                    generated_files.append(path)
+                    print(f"Highlight saved to: {path}")
+
+            if args.png:
+                _export_png(generated_files, args.png)
+            with _stage("autopush"):
+                autopush_svgs(output_dir)
+            return
+
     # Generate base table
     table_svg = generate_svg_table(
         data,
@@ -740,11 +2070,13 @@ def main():
         justifications=justifications,
         col_widths=col_widths,
         background_color=bg_color,
+        precision=precision,
+        minify=args.minify,
+        group_columns=args.groupcols,
     )
 
     base_svg_path = unique_path(output_dir / f"{base_name}.svg")
-    with open(base_svg_path, "w", encoding="utf-8") as f:
-        f.write(table_svg)
+    _write_svg(base_svg_path, table_svg)
     generated_files.append(base_svg_path)
     print(f"Base table saved to: {base_svg_path}")
 
@@ -765,11 +2097,11 @@ def main():
             row_index=row_index,
             color_rgb=color_rgb,
             opacity=0.5,
+            precision=precision,
         )
         name = f"{base_name}_row_{row_index}_{color_name}.svg"
         path = unique_path(output_dir / name)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(overlay_svg)
+        _write_svg(path, overlay_svg)
         generated_files.append(path)
         print(f"Row highlight saved to: {path}")
 
@@ -790,11 +2122,11 @@ def main():
             col_index=col_index,
             color_rgb=color_rgb,
             opacity=0.5,
+            precision=precision,
         )
         name = f"{base_name}_col_{col_index}_{color_name}.svg"
         path = unique_path(output_dir / name)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(overlay_svg)
+        _write_svg(path, overlay_svg)
         generated_files.append(path)
         print(f"Column highlight saved to: {path}")
 
@@ -817,62 +2149,76 @@ def main():
             col_index=col_index,
             color_rgb=color_rgb,
             opacity=0.5,
+            precision=precision,
         )
         name = f"{base_name}_cell_{row_index}_{col_index}_{color_name}.svg"
         path = unique_path(output_dir / name)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(overlay_svg)
+        _write_svg(path, overlay_svg)
         generated_files.append(path)
         print(f"Cell highlight saved to: {path}")
 
+    if args.png:
+        _export_png(generated_files, args.png)
+
     # ------------------------------------------------------
     # ALWAYS AUTOPUSH AFTER GENERATING SVGs
     # ------------------------------------------------------
-    print("\n--- AUTOPUSH START ---")
-
-    # Ensure we are in a git repo
-    ok, out = run_git_command(["git", "rev-parse", "--is-inside-work-tree"])
-    if not ok or "true" not in out:
-        print("Not inside a git repository. Auto-push skipped.")
-        return
-
-    # Stage only the SVG directory
-    print(f"Staging SVGs from: {output_dir}")
-    ok, out = run_git_command(["git", "add", str(output_dir)])
-    if not ok:
-        print("Failed to git add SVGs:")
-        print(out)
-        return
+    with _stage("autopush"):
+        autopush_svgs(output_dir)
 
-    # Check if anything actually changed
-    ok, out = run_git_command(["git", "status", "--porcelain"])
-    if not ok:
-        print("git status failed:")
-        print(out)
-        return
 
-    if out.strip() == "":
-        print("No changes to commit.")
-        return
+def _stream_from_args(args, json_path: Path):
+    """--stream: render the table file-to-file in two passes, then its highlights."""
+    precision = args.precision
+    if args.minify and precision is None:
+        precision = 2
+    output_dir = json_path.parent / "svg"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    base_name = json_path.stem
 
-    # Create commit message with timestamp
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    commit_message = f"Auto-update SVG tables ({timestamp})"
+    base_svg_path = unique_path(output_dir / f"{base_name}.svg")
+    layout = stream_svg_table(
+        json_path,
+        base_svg_path,
+        cols=args.cols,
+        headers=args.headers,
+        formats=args.format,
+        font_size_pt=args.fontsize,
+        svg_size=tuple(args.size),
+        justifications=args.justify,
+        col_widths=args.colwidths,
+        background_color=color_from_name("oxford") if args.bgoxford else None,
+        precision=args.precision,
+        minify=args.minify,
+        group_columns=args.groupcols,
+    )
+    generated_files: List[Path] = [base_svg_path]
+    print(f"Base table saved to: {base_svg_path} ({layout['num_rows']} rows, streamed)")
 
-    print("Committing...")
-    ok, out = run_git_command(["git", "commit", "-m", commit_message])
-    if not ok:
-                    print("Commit failed:")
-        print(out)
-        return
+    highlights = []
+    if args.rowhighlight:
+        row_idx_str, color_name = args.rowhighlight
+        highlights.append(("row", int(row_idx_str), None, color_name, f"row_{row_idx_str}"))
+    if args.colhighlight:
+        col_idx_str, color_name = args.colhighlight
+        highlights.append(("column", None, int(col_idx_str), color_name, f"col_{col_idx_str}"))
+    if args.cellhighlight:
+        row_idx_str, col_idx_str, color_name = args.cellhighlight
+        highlights.append(("cell", int(row_idx_str), int(col_idx_str), color_name,
+                           f"cell_{row_idx_str}_{col_idx_str}"))
+
+    for kind, row_index, col_index, color_name, label in highlights:
+        rect = _highlight_rect(kind, layout, layout["num_rows"], row_index, col_index)
+        overlay_svg = _overlay_svg(layout, rect, color_from_name(color_name), 0.5, precision)
+        path = unique_path(output_dir / f"{base_name}_{label}_{color_name}.svg")
+        _write_svg(path, overlay_svg)
+        generated_files.append(path)
+        print(f"Highlight saved to: {path}")
 
-    print("Pushing to origin/main...")
-    ok, out = run_git_command(["git", "push", "origin", "main"])
-    if not ok:
-        print("Push failed:")
-        print(out)
-    else:
-        print("Auto-push successful!")
+    if args.png:
+        _export_png(generated_files, args.png)
+    with _stage("autopush"):
+        autopush_svgs(output_dir)
 
 
 if __name__ == "__main__":
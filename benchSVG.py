@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark for the table render pipeline.
+
+Stages timed for every case:
+
+  format     format_value over every cell
+  layout     _compute_table_layout
+  table      generate_svg_table, template cache cleared before every run (cold)
+  table_warm each table's second generate_svg_table call, right after an
+             untimed first one filled its template (warm), as in a batch of
+             same-shaped tables
+  overlay    generate_highlight_overlay (row highlight)
+  detect     overlaySVG.py geometry detection on the rendered table
+
+Cases are synthetic tables (fixed seed, 10 to 100k rows x 2 to 40 columns) and
+the real files in tablejsons/ as one corpus case.
+
+Usage examples (from repo root):
+
+  # Default matrix, print a report
+  python benchSVG.py
+
+  # Quick run (up to 1,000 rows) and save it as the baseline
+  python benchSVG.py --quick --save-baseline bench_baseline.json
+
+  # Compare against a saved baseline; exits 1 if any stage regressed
+  python benchSVG.py --quick --baseline bench_baseline.json
+
+Wall time is the best of --repeat runs; peak memory comes from one extra run
+under tracemalloc (kept separate so tracing does not distort the timings).
+For table_warm that run includes the untimed first renders.
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from SVG4 import (
+    VALID_FORMATS,
+    _compute_table_layout,
+    _table_template,
+    format_value,
+    generate_highlight_overlay,
+    generate_svg_table,
+)
+from overlaySVG import (
+    detect_column_boundaries,
+    detect_row_layout,
+    detect_svg_size_and_viewbox,
+)
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_TABLE_DIR = REPO_DIR / "tablejsons"
+
+DEFAULT_ROWS = [10, 100, 1000, 10000, 100000]
+DEFAULT_COLS = [2, 10, 40]
+QUICK_ROWS = [10, 100, 1000]
+SVG_SIZE = (1400, 820)
+FONT_SIZE_PT = 14
+
+STAGES = ["format", "layout", "table", "table_warm", "overlay", "detect"]
+
+# Run before each timed run of a stage (outside the timing)
+STAGE_SETUP: Dict[str, Callable[[], None]] = {
+    "table": _table_template.cache_clear,
+}
+
+
+# ----------------------------
+#  Cases
+# ----------------------------
+
+def synthetic_table(num_rows: int, num_cols: int, seed: int = 0):
+    """
+    Deterministic table of num_rows x num_cols. Column 0 is text; the rest
+    cycle through numeric values rendered with the different format families.
+    Returns (data, cols, formats).
+    """
+    rng = random.Random(seed * 1_000_003 + num_rows * 101 + num_cols)
+    numeric_formats = sorted(f for f in VALID_FORMATS if f != "text")
+    cols = [f"C{j}" for j in range(num_cols)]
+    formats = ["text"] + [numeric_formats[j % len(numeric_formats)] for j in range(num_cols - 1)]
+    words = ["Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot", "Golf", "Hotel"]
+
+    data: List[Dict] = []
+    for i in range(num_rows):
+        row = {cols[0]: f"{rng.choice(words)} {i}"}
+        for j in range(1, num_cols):
+            row[cols[j]] = round(rng.uniform(-1e6, 1e6), 4)
+        data.append(row)
+    return data, cols, formats
+
+
+def corpus_tables(table_dir: Path) -> List[Tuple[str, List[Dict]]]:
+    """Every tablejsons/*.json that is a non-empty list of row objects."""
+    tables = []
+    for path in sorted(table_dir.glob("*.json")):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except ValueError:
+            continue
+        if isinstance(data, list) and data and all(isinstance(r, dict) for r in data):
+            tables.append((path.stem, data))
+    return tables
+
+
+# ----------------------------
+#  Stage runners
+# ----------------------------
+
+# A stage function returns None (timed as a whole) or the seconds it timed itself
+StageFn = Callable[[], Optional[float]]
+
+
+def _stage_functions(
+    tables: List[Tuple[List[Dict], Optional[List[str]], Optional[List[str]]]],
+) -> Dict[str, StageFn]:
+    """One zero-argument callable per stage, each running over all `tables`."""
+    rendered: List[str] = []
+    for data, cols, formats in tables:
+        svg = generate_svg_table(
+            data, cols=cols, formats=formats, font_size_pt=FONT_SIZE_PT, svg_size=SVG_SIZE
+        )
+        rendered.append(svg)
+
+    def run_format():
+        for data, cols, formats in tables:
+            keys = cols or list(data[0].keys())
+            fmts = formats or ["text"] * len(keys)
+            for row in data:
+                for key, fmt in zip(keys, fmts):
+                    format_value(row.get(key, ""), fmt)
+
+    def run_layout():
+        for data, cols, formats in tables:
+            keys = cols or list(data[0].keys())
+            _compute_table_layout(
+                data, keys, None, formats, SVG_SIZE, FONT_SIZE_PT
+            )
+
+    def run_table():
+        for data, cols, formats in tables:
+            generate_svg_table(
+                data, cols=cols, formats=formats, font_size_pt=FONT_SIZE_PT, svg_size=SVG_SIZE
+            )
+
+    def run_table_warm() -> float:
+        # Per table, so the cache only has to hold one template at a time
+        # (the corpus has more layout signatures than the cache has slots)
+        elapsed = 0.0
+        for data, cols, formats in tables:
+            kwargs = dict(cols=cols, formats=formats, font_size_pt=FONT_SIZE_PT, svg_size=SVG_SIZE)
+            generate_svg_table(data, **kwargs)
+            t0 = time.perf_counter()
+            generate_svg_table(data, **kwargs)
+            elapsed += time.perf_counter() - t0
+        return elapsed
+
+    def run_overlay():
+        for data, cols, formats in tables:
+            generate_highlight_overlay(
+                "row", data=data, cols=cols, headers=None, formats=formats,
+                svg_size=SVG_SIZE, font_size_pt=FONT_SIZE_PT, row_index=len(data) // 2,
+            )
+
+    def run_detect():
+        for svg in rendered:
+            root = ET.fromstring(svg)
+            width, _, _ = detect_svg_size_and_viewbox(root)
+            detect_row_layout(root)
+            detect_column_boundaries(root, width)
+
+    return {
+        "format": run_format,
+        "layout": run_layout,
+        "table": run_table,
+        "table_warm": run_table_warm,
+        "overlay": run_overlay,
+        "detect": run_detect,
+    }
+
+
+def measure(
+    fn: StageFn,
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> Dict[str, float]:
+    """
+    Best-of-`repeat` wall time plus tracemalloc peak of one extra run; a
+    stage that times itself is credited with the seconds it returns.
+    setup (if any) runs untimed before every run, including the traced one.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        elapsed = fn()
+        best = min(best, time.perf_counter() - t0 if elapsed is None else elapsed)
+
+    if setup is not None:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_kb": peak / 1024.0}
+
+
+def run_benchmarks(
+    rows_list: List[int],
+    cols_list: List[int],
+    repeat: int,
+    max_cells: int,
+    table_dir: Optional[Path],
+) -> Dict[str, Dict[str, float]]:
+    """Return {"<case>/<stage>": {"seconds": ..., "peak_kb": ...}}."""
+    cases: List[Tuple[str, list]] = []
+    for num_rows in rows_list:
+        for num_cols in cols_list:
+            if num_rows * num_cols > max_cells:
+                continue
+            data, cols, formats = synthetic_table(num_rows, num_cols)
+            cases.append((f"synthetic_{num_rows}x{num_cols}", [(data, cols, formats)]))
+    if table_dir is not None:
+        corpus = corpus_tables(table_dir)
+        if corpus:
+            cases.append(("corpus_tablejsons", [(data, None, None) for _, data in corpus]))
+
+    results: Dict[str, Dict[str, float]] = {}
+    for case_name, tables in cases:
+        stage_fns = _stage_functions(tables)
+        for stage in STAGES:
+            results[f"{case_name}/{stage}"] = measure(stage_fns[stage], repeat, STAGE_SETUP.get(stage))
+        print(f"  {case_name}: done", file=sys.stderr)
+    return results
+
+
+# ----------------------------
+#  Reporting + baseline comparison
+# ----------------------------
+
+def print_report(results: Dict[str, Dict[str, float]], baseline: Optional[Dict] = None):
+    print(f"{'case/stage':<40} {'ms':>10} {'peak KB':>10} {'vs base':>8}")
+    for key, r in results.items():
+        ratio = ""
+        if baseline and key in baseline:
+            old = baseline[key]["seconds"]
+            if old > 0:
+                ratio = f"{r['seconds'] / old:.2f}x"
+        print(f"{key:<40} {r['seconds'] * 1000:>10.2f} {r['peak_kb']:>10.0f} {ratio:>8}")
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """
+    Keys whose time or peak memory grew by more than `threshold` (fraction).
+    Time changes below min_delta_ms are treated as noise.
+    """
+    regressions: List[str] = []
+    for key, new in results.items():
+        old = baseline.get(key)
+        if old is None:
+            continue
+        dt_ms = (new["seconds"] - old["seconds"]) * 1000
+        if old["seconds"] > 0 and new["seconds"] > old["seconds"] * (1 + threshold) and dt_ms > min_delta_ms:
+            regressions.append(
+                f"{key}: time {old['seconds'] * 1000:.2f} -> {new['seconds'] * 1000:.2f} ms"
+            )
+        if old["peak_kb"] > 0 and new["peak_kb"] > old["peak_kb"] * (1 + threshold) and new["peak_kb"] - old["peak_kb"] > 64:
+            regressions.append(
+                f"{key}: peak {old['peak_kb']:.0f} -> {new['peak_kb']:.0f} KB"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark formatting, layout, SVG emission and overlay detection."
+    )
+    parser.add_argument("--rows", nargs="*", type=int, help=f"Synthetic row counts (default: {DEFAULT_ROWS})")
+    parser.add_argument("--cols", nargs="*", type=int, help=f"Synthetic column counts (default: {DEFAULT_COLS})")
+    parser.add_argument("--quick", action="store_true", help=f"Use row counts {QUICK_ROWS}")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage; best is kept (default: 3)")
+    parser.add_argument(
+        "--max-cells",
+        type=int,
+        default=1_000_000,
+        help="Skip synthetic cases with more cells than this (default: 1,000,000)",
+    )
+    parser.add_argument("--no-corpus", action="store_true", help="Skip the tablejsons/ corpus case")
+    parser.add_argument("--json", help="Write results as JSON to this path")
+    parser.add_argument("--save-baseline", help="Write results as the new baseline to this path")
+    parser.add_argument("--baseline", help="Compare against this baseline; exit 1 on regression")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown / memory growth as a fraction (default: 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="Ignore time differences smaller than this (default: 1.0 ms)",
+    )
+    args = parser.parse_args()
+
+    rows_list = args.rows or (QUICK_ROWS if args.quick else DEFAULT_ROWS)
+    cols_list = args.cols or DEFAULT_COLS
+
+    results = run_benchmarks(
+        rows_list,
+        cols_list,
+        repeat=max(1, args.repeat),
+        max_cells=args.max_cells,
+        table_dir=None if args.no_corpus else DEFAULT_TABLE_DIR,
+    )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+
+    print_report(results, baseline)
+
+    payload = {
+        "python": sys.version.split()[0],
+        "svg_size": list(SVG_SIZE),
+        "font_size_pt": FONT_SIZE_PT,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=1)
+        print(f"Results written to: {args.json}")
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=1)
+        print(f"Baseline saved to: {args.save_baseline}")
+
+    if baseline is not None:
+        regressions = find_regressions(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
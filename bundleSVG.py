@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Bundle many small table / overlay SVGs (SVG4.py and overlaySVG.py outputs)
+into one file per chapter, so a page makes one request instead of dozens.
+
+Usage examples (from repo root):
+
+  # Bundle tablejsons/svg/*.svg by chapter (Table14_1a -> Ch14) as sprites
+  python bundleSVG.py
+
+  # JSON bundles instead, or both
+  python bundleSVG.py --format json
+  python bundleSVG.py --format both
+
+  # Bundle an explicit list of files under one name
+  python bundleSVG.py tablejsons/svg/Table3_1.svg tablejsons/svg/Table3_1_row_10_Robin.svg --name Ch3
+
+Output goes to <svg dir>/bundles/:
+
+  Ch14.svg   sprite: each input is a <symbol>, placed once with <use> and
+             addressable with a <view>, so an <img> (insertSvgIntoShape)
+             can show one item with "bundles/Ch14.svg#Table14_1a"
+  Ch14.json  {"version", "items": {name: {"svg", "width", "height"}}},
+             for insertBundledSvgIntoShape in globalAssets.js
+  index.json bundle -> members, sizes and an input hash
+
+Class names and ids are prefixed per item inside a sprite, so each table's
+<style> only applies to its own symbol. A bundle whose inputs hash the same
+as last time is not rebuilt.
+
+The default glob skips the _v2, _v3, ... copies SVG4.py writes next to an
+existing output (Table14_1a_v2.svg): they are earlier or later renders of
+the same table, not separate items. Name them explicitly to bundle them.
+A default run also deletes the bundles (and index entries) of chapters that
+no longer have any SVGs.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_SVG_DIR = REPO_DIR / "tablejsons" / "svg"
+BUNDLE_DIR_NAME = "bundles"
+INDEX_NAME = "index.json"
+BUNDLE_VERSION = 1
+
+SVG_NS = "http://www.w3.org/2000/svg"
+ET.register_namespace("", SVG_NS)
+
+_CHAPTER_RE = re.compile(r"^[A-Za-z]+(\d+)_")
+_CHAPTER_BUNDLE_RE = re.compile(r"^(Ch\d+|misc)\.(svg|json)$")
+_VERSION_SUFFIX_RE = re.compile(r"_v\d+$")
+_RULE_RE = re.compile(r"([^{}]+)(\{[^{}]*\})")
+_CLASS_SELECTOR_RE = re.compile(r"\.(-?[A-Za-z_][\w-]*)")
+_URL_REF_RE = re.compile(r"url\(#([\w.-]+)\)")
+
+
+# ----------------------------
+#  Grouping + hashing
+# ----------------------------
+
+def chapter_of(svg_path: Path) -> str:
+    """Table14_1a.svg -> "Ch14"; files without a chapter number go to "misc"."""
+    m = _CHAPTER_RE.match(svg_path.stem)
+    return f"Ch{int(m.group(1))}" if m else "misc"
+
+
+def is_versioned_copy(svg_path: Path) -> bool:
+    """Table14_1a_v2.svg (a unique_path copy) -> True."""
+    return bool(_VERSION_SUFFIX_RE.search(svg_path.stem))
+
+
+def group_by_chapter(svg_paths: List[Path]) -> Dict[str, List[Path]]:
+    groups: Dict[str, List[Path]] = {}
+    for path in sorted(svg_paths):
+        groups.setdefault(chapter_of(path), []).append(path)
+    return groups
+
+
+def inputs_hash(paths: List[Path], fmt: str) -> str:
+    h = hashlib.sha256(f"{BUNDLE_VERSION}\0{fmt}\0".encode("utf-8"))
+    for path in paths:
+        h.update(path.name.encode("utf-8") + b"\0")
+        h.update(path.read_bytes())
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+
+# ----------------------------
+#  SVG helpers
+# ----------------------------
+
+def _local(tag: str) -> str:
+    return tag.split("}")[-1]
+
+
+def svg_size(root: ET.Element) -> Tuple[float, float]:
+    """(width, height) from the viewBox, falling back to width/height."""
+    view_box = root.get("viewBox")
+    if view_box:
+        parts = view_box.replace(",", " ").split()
+        if len(parts) == 4:
+            return float(parts[2]), float(parts[3])
+    return float(root.get("width", 0)), float(root.get("height", 0))
+
+
+def _fmt(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def scope_element(root: ET.Element, prefix: str):
+    """
+    Prefix class names (in <style> selectors and class attributes) and ids
+    (plus their #id / url(#id) references), in place.
+    """
+    for el in root.iter():
+        if _local(el.tag) == "style" and el.text:
+            el.text = _RULE_RE.sub(
+                lambda m: _CLASS_SELECTOR_RE.sub(lambda c: f".{prefix}{c.group(1)}", m.group(1)) + m.group(2),
+                el.text,
+            )
+        cls = el.get("class")
+        if cls:
+            el.set("class", " ".join(prefix + c for c in cls.split()))
+        if el.get("id"):
+            el.set("id", prefix + el.get("id"))
+        for key, value in list(el.attrib.items()):
+            if _local(key) == "href" and value.startswith("#"):
+                el.set(key, "#" + prefix + value[1:])
+            elif "url(#" in value:
+                el.set(key, _URL_REF_RE.sub(lambda m: f"url(#{prefix}{m.group(1)})", value))
+
+
+# ----------------------------
+#  Bundle builders
+# ----------------------------
+
+def build_sprite(paths: List[Path]) -> Tuple[str, Dict[str, Dict[str, float]]]:
+    """
+    One SVG with a <symbol> per input stacked vertically, a <use> placing it
+    and a <view id="<name>"> framing it. Returns (svg text, item sizes).
+    """
+    sprite = ET.Element(f"{{{SVG_NS}}}svg")
+    defs = ET.SubElement(sprite, f"{{{SVG_NS}}}defs")
+    items: Dict[str, Dict[str, float]] = {}
+    y = 0.0
+    max_width = 0.0
+
+    for i, path in enumerate(paths):
+        name = path.stem
+        root = ET.parse(path).getroot()
+        width, height = svg_size(root)
+        scope_element(root, f"s{i}-")
+
+        symbol = ET.SubElement(defs, f"{{{SVG_NS}}}symbol", {
+            "id": f"sym-{name}",
+            # keep the source viewBox (windowed renders start below y=0)
+            "viewBox": root.get("viewBox") or f"0 0 {_fmt(width)} {_fmt(height)}",
+        })
+        symbol.extend(list(root))
+
+        ET.SubElement(sprite, f"{{{SVG_NS}}}view", {
+            "id": name,
+            "viewBox": f"0 {_fmt(y)} {_fmt(width)} {_fmt(height)}",
+        })
+        ET.SubElement(sprite, f"{{{SVG_NS}}}use", {
+            "href": f"#sym-{name}",
+            "x": "0",
+            "y": _fmt(y),
+            "width": _fmt(width),
+            "height": _fmt(height),
+        })
+        items[name] = {"y": y, "width": width, "height": height}
+        y += height
+        max_width = max(max_width, width)
+
+    # No width/height on the root: a #view fragment then sizes the image
+    sprite.set("viewBox", f"0 0 {_fmt(max_width)} {_fmt(y)}")
+    return ET.tostring(sprite, encoding="unicode"), items
+
+
+def build_json_bundle(paths: List[Path]) -> Tuple[str, Dict[str, Dict[str, float]]]:
+    """{"version", "items": {name: {"svg", "width", "height"}}} as compact JSON."""
+    items: Dict[str, Dict[str, Any]] = {}
+    sizes: Dict[str, Dict[str, float]] = {}
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        width, height = svg_size(ET.fromstring(text))
+        items[path.stem] = {"svg": text, "width": width, "height": height}
+        sizes[path.stem] = {"width": width, "height": height}
+    payload = {"version": BUNDLE_VERSION, "items": items}
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=False), sizes
+
+
+BUILDERS = {"svg": build_sprite, "json": build_json_bundle}
+
+
+# ----------------------------
+#  Index + driver
+# ----------------------------
+
+def load_index(bundle_dir: Path) -> Dict[str, Any]:
+    path = bundle_dir / INDEX_NAME
+    if path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == BUNDLE_VERSION:
+                return index
+        except (OSError, ValueError):
+            print(f"Warning: unreadable index {path}, rebuilding.")
+    return {"version": BUNDLE_VERSION, "bundles": {}}
+
+
+def write_index(bundle_dir: Path, index: Dict[str, Any]) -> bool:
+    path = bundle_dir / INDEX_NAME
+    text = json.dumps(index, indent=1, sort_keys=True, ensure_ascii=False) + "\n"
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return False
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def build_bundle(
+    name: str,
+    paths: List[Path],
+    bundle_dir: Path,
+    fmt: str,
+    index: Dict[str, Any],
+) -> Optional[Path]:
+    """Build one bundle unless its inputs are unchanged. Returns the path if written."""
+    out = bundle_dir / f"{name}.{fmt}"
+    key = f"{name}.{fmt}"
+    digest = inputs_hash(paths, fmt)
+    old = index["bundles"].get(key)
+    if old is not None and old.get("hash") == digest and out.exists():
+        return None
+
+    text, items = BUILDERS[fmt](paths)
+    out.write_text(text, encoding="utf-8")
+    index["bundles"][key] = {
+        "hash": digest,
+        "bytes": len(text.encode("utf-8")),
+        "items": items,
+    }
+    return out
+
+
+def remove_stale_bundles(bundle_dir: Path, index: Dict[str, Any], chapters: List[str]) -> List[Path]:
+    """Delete chapter bundles (and index entries) for chapters not in chapters; returns the files removed."""
+    removed: List[Path] = []
+    for key in sorted(index["bundles"]):
+        m = _CHAPTER_BUNDLE_RE.match(key)
+        if m and m.group(1) not in chapters:
+            del index["bundles"][key]
+            out = bundle_dir / key
+            if out.exists():
+                out.unlink()
+                removed.append(out)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Bundle table and overlay SVGs into per-chapter sprites or JSON bundles."
+    )
+    parser.add_argument("svg_files", nargs="*", help="SVG files (default: tablejsons/svg/*.svg)")
+    parser.add_argument("--name", help="Bundle all given files under this name instead of by chapter")
+    parser.add_argument(
+        "--format",
+        choices=["svg", "json", "both"],
+        default="svg",
+        help="Sprite SVG, JSON bundle, or both (default: svg)",
+    )
+    parser.add_argument("--out", help="Bundle directory (default: <svg dir>/bundles)")
+    parser.add_argument("--push", action="store_true", help="Commit + push the bundle folder if anything changed")
+    args = parser.parse_args()
+
+    if args.svg_files:
+        paths = [Path(p) for p in args.svg_files]
+    else:
+        paths = sorted(p for p in DEFAULT_SVG_DIR.glob("*.svg") if not is_versioned_copy(p))
+    if not paths and args.name:
+        print("No SVG files to bundle.")
+        return
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"SVG file not found: {path}")
+
+    groups = {args.name: sorted(paths)} if args.name else group_by_chapter(paths)
+    bundle_dir = Path(args.out) if args.out else (paths[0].parent if paths else DEFAULT_SVG_DIR) / BUNDLE_DIR_NAME
+    bundle_dir.mkdir(parents=True, exist_ok=True)
+    index = load_index(bundle_dir)
+    formats = ["svg", "json"] if args.format == "both" else [args.format]
+
+    removed: List[Path] = []
+    if not args.svg_files and not args.name:
+        removed = remove_stale_bundles(bundle_dir, index, list(groups))
+        for out in removed:
+            print(f"Removed stale bundle: {out}")
+
+    written = unchanged = 0
+    for name, members in groups.items():
+        for fmt in formats:
+            out = build_bundle(name, members, bundle_dir, fmt, index)
+            if out is None:
+                unchanged += 1
+            else:
+                written += 1
+                print(f"Bundle saved to: {out} ({len(members)} items)")
+
+    if write_index(bundle_dir, index):
+        print(f"Index written to: {bundle_dir / INDEX_NAME}")
+    print(f"{written} bundles written, {unchanged} unchanged, {len(removed)} removed")
+
+    if args.push and (written or removed):
+        from SVG4 import autopush_svgs
+        autopush_svgs(bundle_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+#!/usr/bin/env python3
+"""
+Pre-render line charts from chartjsons/ as static SVG, styled like the SVG
+tables from SVG4.py (same palette, Montserrat, white text, Cadet rules).
+
+Pages can show the static SVG immediately and only hydrate the live chart if
+the reader needs interaction. The root <svg> carries data-figure="<name>" so a
+page can find the figure to hydrate.
+
+Usage examples (from repo root):
+
+  # Render every figure in chapter 18 to chartjsons/svg/
+  python chartSVG.py chartjsons/Ch18.json
+
+  # Render one figure at a given size, in Cinnabar, on Oxford Blue
+  python chartSVG.py chartjsons/Ch18.json --figure Fig18_1a --size 1000 500 --color Cinnabar --bgoxford
+
+Each series is drawn as a single <path>. Before drawing, points are reduced to
+the output resolution: within each horizontal pixel only the first, lowest,
+highest and last points are kept, which leaves the rendered line unchanged.
+The path is then simplified at --tolerance px (RDP or Visvalingam) and written
+as relative commands at --precision decimals (see svgGeometry.py).
+"""
+
+import argparse
+import json
+import math
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from SVG4 import PALETTE, _escape_xml, _pts_to_px, color_from_name, format_value, unique_path
+from splitCharts import _is_number, figure_keys, figure_series, safe_figure_name
+from svgGeometry import fmt_num, path_data, simplify
+
+# Series colours, in order, for multi-series figures
+SERIES_COLORS = ["robin", "cinnabar", "tea", "cadet", "columbia", "alabaster"]
+
+Point = Tuple[float, float]
+
+
+# ----------------------------
+#  Scales and ticks
+# ----------------------------
+
+def _nice_step(span: float, target_ticks: int) -> float:
+    """Round span / target_ticks to 1, 2, 2.5 or 5 x 10^k."""
+    if span <= 0:
+        return 1.0
+    raw = span / max(target_ticks, 1)
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for mult in (1, 2, 2.5, 5, 10):
+        if raw <= mult * magnitude:
+            return mult * magnitude
+    return 10 * magnitude
+
+
+def nice_ticks(lo: float, hi: float, target_ticks: int = 5) -> List[float]:
+    """Evenly spaced 'nice' tick values covering [lo, hi]."""
+    if hi < lo:
+        lo, hi = hi, lo
+    if hi == lo:
+        pad = abs(lo) * 0.1 or 1.0
+        lo, hi = lo - pad, hi + pad
+    step = _nice_step(hi - lo, target_ticks)
+    start = math.floor(lo / step) * step
+    stop = math.ceil(hi / step) * step
+    count = int(round((stop - start) / step))
+    return [start + i * step for i in range(count + 1)]
+
+
+def _tick_format(ticks: Sequence[float]) -> str:
+    """Pick the SVG4 Dec format with enough decimals for the tick step."""
+    if len(ticks) < 2:
+        return "dec2"
+    step = abs(ticks[1] - ticks[0])
+    decimals = max(0, -math.floor(math.log10(step))) if step > 0 else 2
+    if decimals == 0:
+        return "dec0"
+    if decimals <= 2:
+        return "dec2"
+    return "dec4"
+
+
+# ----------------------------
+#  Resolution-aware simplification
+# ----------------------------
+
+def decimate_to_pixels(points: Sequence[Point]) -> List[Point]:
+    """
+    Keep only the first, min-y, max-y and last point within each horizontal
+    pixel column (x in output px). The drawn polyline looks identical at the
+    output resolution, but dense series collapse to ~4 points per pixel.
+    """
+    if len(points) <= 4:
+        return list(points)
+
+    kept: List[Point] = []
+    bucket: List[Point] = []
+    bucket_px = None
+
+    def flush():
+        if not bucket:
+            return
+        lo = min(bucket, key=lambda p: p[1])
+        hi = max(bucket, key=lambda p: p[1])
+        chosen = {id(bucket[0]): bucket[0], id(lo): lo, id(hi): hi, id(bucket[-1]): bucket[-1]}
+        kept.extend(p for p in bucket if id(p) in chosen)
+
+    for p in points:
+        px = int(math.floor(p[0]))
+        if px != bucket_px:
+            flush()
+            bucket = []
+            bucket_px = px
+        bucket.append(p)
+    flush()
+    return kept
+
+
+# ----------------------------
+#  Chart generator
+# ----------------------------
+
+def generate_svg_line_chart(
+    x_values: Sequence[Any],
+    series: Sequence[Sequence[Any]],
+    series_names: Optional[Sequence[str]] = None,
+    font_size_pt: int = 12,
+    svg_size: Tuple[int, int] = (800, 500),
+    colors: Optional[Sequence[str]] = None,
+    background_color: Optional[str] = None,   # None = transparent
+    figure_name: Optional[str] = None,
+    tolerance: float = 0.5,
+    simplify_method: str = "rdp",
+    precision: int = 1,
+) -> str:
+    """
+    Generate a static SVG line chart with axes from x values and one or more
+    y series. Numeric x is drawn on a linear scale; anything else (dates,
+    labels) is drawn as evenly spaced categories, like the live charts.
+    Missing / non-numeric y values break the line.
+
+    Series paths are simplified to `tolerance` px (see svgGeometry) and all
+    geometry is written with `precision` decimals.
+    """
+    if not series or not any(len(s) for s in series):
+        raise ValueError("series must contain at least one non-empty list of values.")
+
+    svg_width, svg_height = svg_size
+    num_points = max(len(x_values), max(len(s) for s in series))
+
+    COLORS = {
+        "persian_red": PALETTE["persianred"],
+        "cadet": PALETTE["cadet"],
+        "white": "rgb(255,255,255)",
+    }
+    stroke_colors = list(colors) if colors else [PALETTE[c] for c in SERIES_COLORS]
+
+    font_size_px = _pts_to_px(font_size_pt)
+    char_width_factor = 0.6
+    inner_pad = 5
+
+    # --------- Scales ----------
+    numeric_x = len(x_values) > 0 and all(_is_number(v) for v in x_values)
+    if numeric_x:
+        x_positions = [float(v) for v in x_values]
+        x_ticks = nice_ticks(min(x_positions), max(x_positions), 6)
+        x_lo, x_hi = x_ticks[0], x_ticks[-1]
+    else:
+        x_positions = [float(i) for i in range(num_points)]
+        x_lo, x_hi = 0.0, float(max(num_points - 1, 1))
+
+    y_numbers = [float(v) for s in series for v in s if _is_number(v)]
+    if not y_numbers:
+        raise ValueError("series has no numeric y values.")
+    y_ticks = nice_ticks(min(y_numbers), max(y_numbers), 5)
+    y_lo, y_hi = y_ticks[0], y_ticks[-1]
+    y_fmt = _tick_format(y_ticks)
+    y_labels = [format_value(t, y_fmt) for t in y_ticks]
+
+    # --------- Plot area ----------
+    longest_y_label = max(len(s) for s in y_labels)
+    plot_left = longest_y_label * char_width_factor * font_size_px + 2 * inner_pad
+    plot_right = svg_width - inner_pad - font_size_px
+    plot_top = font_size_px
+    plot_bottom = svg_height - 2 * font_size_px - inner_pad
+    if len(series) > 1 and series_names:
+        plot_top += 1.5 * font_size_px  # room for the legend row
+    plot_w = max(plot_right - plot_left, 1.0)
+    plot_h = max(plot_bottom - plot_top, 1.0)
+
+    def sx(v: float) -> float:
+        return plot_left + (v - x_lo) / ((x_hi - x_lo) or 1.0) * plot_w
+
+    def sy(v: float) -> float:
+        return plot_bottom - (v - y_lo) / ((y_hi - y_lo) or 1.0) * plot_h
+
+    # x tick positions + labels
+    if numeric_x:
+        x_fmt = _tick_format(x_ticks)
+        x_tick_items = [(sx(t), format_value(t, x_fmt)) for t in x_ticks]
+    else:
+        max_label_chars = max((len(str(v)) for v in x_values), default=1) or 1
+        label_px = max_label_chars * char_width_factor * font_size_px + 2 * inner_pad
+        target = max(2, min(8, int(plot_w // label_px)))
+        step = max(1, int(math.ceil((num_points - 1) / (target - 1)))) if num_points > 1 else 1
+        idxs = list(range(0, num_points, step))
+        x_tick_items = [
+            (sx(float(i)), str(x_values[i]) if i < len(x_values) else "")
+            for i in idxs
+        ]
+
+    def n(value: float) -> str:
+        return fmt_num(value, precision)
+
+    parts: List[str] = []
+
+    # SVG root
+    figure_attr = f' data-figure="{_escape_xml(figure_name)}"' if figure_name else ""
+    parts.append(
+        f'<svg width="{svg_width}" height="{svg_height}" '
+        f'viewBox="0 0 {svg_width} {svg_height}" '
+        f'xmlns="http://www.w3.org/2000/svg"{figure_attr}>'
+    )
+
+    if background_color:
+        parts.append(
+            f'<rect x="0" y="0" width="{svg_width}" height="{svg_height}" '
+            f'fill="{background_color}"/>'
+        )
+
+    # Styles
+    parts.append(
+        f"""
+  <style>
+    .tick {{
+      font-family: "Montserrat", sans-serif;
+      font-size: {n(font_size_px)}px;
+      font-weight: 400;
+      fill: {COLORS["white"]};
+      dominant-baseline: middle;
+    }}
+    .legend {{
+      font-family: "Montserrat", sans-serif;
+      font-size: {n(font_size_px)}px;
+      font-weight: 700;
+      fill: {COLORS["white"]};
+      dominant-baseline: middle;
+    }}
+    .series {{
+      fill: none;
+      stroke-width: {n(_pts_to_px(1.5))};
+      stroke-linejoin: round;
+      stroke-linecap: round;
+    }}
+  </style>
+"""
+    )
+
+    grid_stroke_width = n(_pts_to_px(0.5))
+    axis_stroke_width = n(_pts_to_px(1))
+
+    # Horizontal gridlines + y tick labels
+    for t, label in zip(y_ticks, y_labels):
+        y = n(sy(t))
+        parts.append(
+            f'<line x1="{n(plot_left)}" y1="{y}" x2="{n(plot_right)}" y2="{y}" '
+            f'stroke="{COLORS["cadet"]}" stroke-width="{grid_stroke_width}" stroke-opacity="0.4"/>'
+        )
+        parts.append(
+            f'<text x="{n(plot_left - inner_pad)}" y="{y}" class="tick" '
+            f'text-anchor="end">{_escape_xml(label)}</text>'
+        )
+
+    # x tick labels
+    x_label_y = n(plot_bottom + font_size_px)
+    for x, label in x_tick_items:
+        parts.append(
+            f'<text x="{n(x)}" y="{x_label_y}" class="tick" '
+            f'text-anchor="middle">{_escape_xml(label)}</text>'
+        )
+
+    # Axes: Cadet y axis, Persian Red baseline (matches the table's bottom rule)
+    parts.append(
+        f'<line x1="{n(plot_left)}" y1="{n(plot_top)}" x2="{n(plot_left)}" y2="{n(plot_bottom)}" '
+        f'stroke="{COLORS["cadet"]}" stroke-width="{axis_stroke_width}"/>'
+    )
+    parts.append(
+        f'<line x1="{n(plot_left)}" y1="{n(plot_bottom)}" x2="{n(plot_right)}" y2="{n(plot_bottom)}" '
+        f'stroke="{COLORS["persian_red"]}" stroke-width="{axis_stroke_width}"/>'
+    )
+
+    # Series paths
+    for s_index, values in enumerate(series):
+        segments: List[List[Point]] = []
+        current: List[Point] = []
+        for i, v in enumerate(values):
+            if i >= len(x_positions) or not _is_number(v):
+                if current:
+                    segments.append(current)
+                    current = []
+                continue
+            current.append((sx(x_positions[i]), sy(float(v))))
+        if current:
+            segments.append(current)
+
+        segments = [
+            simplify(decimate_to_pixels(seg), tolerance, simplify_method)
+            for seg in segments
+        ]
+        color = stroke_colors[s_index % len(stroke_colors)]
+        parts.append(
+            f'<path d="{path_data(segments, precision)}" class="series" stroke="{color}"/>'
+        )
+
+    # Legend (multi-series only)
+    if len(series) > 1 and series_names:
+        legend_y = font_size_px
+        x = plot_left
+        swatch = font_size_px
+        for s_index, name in enumerate(series_names[: len(series)]):
+            color = stroke_colors[s_index % len(stroke_colors)]
+            parts.append(
+                f'<rect x="{n(x)}" y="{n(legend_y - swatch / 2)}" width="{n(swatch)}" '
+                f'height="{n(swatch)}" fill="{color}"/>'
+            )
+            parts.append(
+                f'<text x="{n(x + swatch + inner_pad)}" y="{n(legend_y)}" class="legend" '
+                f'text-anchor="start">{_escape_xml(name)}</text>'
+            )
+            x += swatch + 2 * inner_pad + len(str(name)) * char_width_factor * font_size_px
+
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def generate_figure_svg(
+    figure,
+    figure_name: Optional[str] = None,
+    **kwargs,
+) -> str:
+    """Render one figure from a chartjsons/ chapter file (any supported shape)."""
+    x_values, series = figure_series(figure)
+    _, series_names = figure_keys(figure)  # same rule as the data, so legend and lines line up
+    return generate_svg_line_chart(
+        x_values, series, series_names=series_names, figure_name=figure_name, **kwargs
+    )
+
+
+# ----------------------------
+#  CLI handling
+# ----------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pre-render chart figures from a chartjsons/ chapter file as static SVG line charts."
+    )
+    parser.add_argument("json_file", help="Chapter JSON file (e.g., chartjsons/Ch18.json)")
+    parser.add_argument("--figure", nargs="*", help="Figure names to render (default: all)")
+    parser.add_argument("--fontsize", type=int, default=12, help="Font size in pt (default: 12)")
+    parser.add_argument(
+        "--size",
+        nargs=2,
+        type=int,
+        metavar=("WIDTH", "HEIGHT"),
+        default=[800, 500],
+        help="SVG size, e.g. --size 1000 500",
+    )
+    parser.add_argument(
+        "--color",
+        help="Line color name for single-series figures (default: Robin). Options: "
+             + ", ".join(sorted(PALETTE.keys())),
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Path simplification tolerance in px (default: 0.5; 0 disables)",
+    )
+    parser.add_argument(
+        "--simplify",
+        choices=["rdp", "visvalingam", "none"],
+        default="rdp",
+        help="Path simplification method (default: rdp)",
+    )
+    parser.add_argument(
+        "--precision",
+        type=int,
+        default=1,
+        help="Decimals written for coordinates (default: 1)",
+    )
+    parser.add_argument(
+        "--bgoxford",
+        action="store_true",
+        help="If set, draw an Oxford Blue background (otherwise transparent).",
+    )
+    args = parser.parse_args()
+
+    json_path = Path(args.json_file)
+    if not json_path.exists():
+        raise FileNotFoundError(f"JSON file not found: {json_path}")
+
+    with open(json_path, "r", encoding="utf-8") as f:
+        figures: Dict[str, Any] = json.load(f)
+    if not isinstance(figures, dict):
+        raise ValueError(f"{json_path} must be an object mapping figure names to data.")
+
+    names = args.figure or list(figures.keys())
+    missing = [n for n in names if n not in figures]
+    if missing:
+        raise ValueError(f"Unknown figure(s): {', '.join(missing)}")
+
+    colors = None
+    if args.color:
+        first = color_from_name(args.color)
+        colors = [first] + [PALETTE[c] for c in SERIES_COLORS if PALETTE[c] != first]
+    bg_color = color_from_name("oxford") if args.bgoxford else None
+
+    output_dir = json_path.parent / "svg"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for name in names:
+        figure = figures[name]
+        if not isinstance(figure, (list, dict)):
+            print(f"Warning: {name} is not chart data, skipping.")
+            continue
+        if not safe_figure_name(name):
+            print(f"Warning: figure name {name!r} is not a plain file name, skipping.")
+            continue
+        svg = generate_figure_svg(
+            figure,
+            figure_name=name,
+            font_size_pt=args.fontsize,
+            svg_size=(args.size[0], args.size[1]),
+            colors=colors,
+            background_color=bg_color,
+            tolerance=args.tolerance,
+            simplify_method=args.simplify,
+            precision=args.precision,
+        )
+        path = unique_path(output_dir / f"{name}.svg")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(svg)
+        print(f"Chart saved to: {path}")
+
+
+if __name__ == "__main__":
+    main()
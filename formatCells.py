@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Pre-format table cells at build time, exactly as the web pages' JS
+window.formatFunctions (globalAssets.js) would, so browsers can show the
+strings directly instead of formatting every cell on each render.
+
+Usage examples (from repo root):
+
+  # Write payloads for every web spec with a "source" in the manifest
+  python formatCells.py
+
+  # Just one spec; exit 1 if any payload is out of date
+  python formatCells.py IOFInt --check
+
+Payloads are built from the manifest "web" specs (see tableSpecsJS.py),
+since those are the columns and formats the pages apply, one per spec that
+names a "source". Output goes next to the source, in
+tablejsons/formatted/<web spec>.json:
+
+  {"fields": ["ID", "Weight"], "formats": ["Text", "Perc2"],
+   "rows": [["US1001", "4.95%"], ...]}
+
+Format codes are resolved to formatFunctions names (perc2 -> Perc2). No
+page reads the payloads yet; they are checked against the JS formatters
+with --check.
+
+Formatting follows the browser semantics in the en-US locale:
+toLocaleString rounds the shortest decimal form half away from zero and
+keeps the sign of negative zero, toFixed rounds the exact binary value,
+Number() / String() conversions match JS. Where the JS formatter would
+throw, payloads fall back to "" for null or missing cells and to the
+value's string form otherwise (e.g. SpecialDate on a number).
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Context, Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from renderManifest import DEFAULT_MANIFEST
+from SVG4 import _table_data
+from tableColumns import load_table
+from tableSpecsJS import js_format_name, load_web_specs
+
+FORMATTED_DIR_NAME = "formatted"
+
+_MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+_DECIMAL_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+_RADIX_RE = re.compile(r"^0([xXoObB])([0-9a-fA-F]+)$")
+_DECIMAL_CONTEXT = Context(prec=400)  # room for any double's integer digits
+_MDY_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{2,4})\b")
+_YMD_RE = re.compile(r"^(\d{4})/(\d{1,2})/(\d{1,2})\b")
+
+
+# ----------------------------
+#  JS conversions
+# ----------------------------
+
+def js_number_to_string(x: float) -> str:
+    """String(x) for a JS number: 1.0 -> "1", 1e16 -> "10000000000000000", 1e21 -> "1e+21"."""
+    if math.isnan(x):
+        return "NaN"
+    if math.isinf(x):
+        return "Infinity" if x > 0 else "-Infinity"
+    if x == 0:
+        return "0"
+    sign = "-" if x < 0 else ""
+    # Shortest round-trip digits, same as JS
+    _, digits_t, exp = Decimal(repr(abs(x))).normalize().as_tuple()
+    digits = "".join(str(d) for d in digits_t)
+    k = len(digits)
+    n = exp + k  # value = 0.digits * 10^n
+    if k <= n <= 21:
+        s = digits + "0" * (n - k)
+    elif 0 < n <= 21:
+        s = digits[:n] + "." + digits[n:]
+    elif -6 < n <= 0:
+        s = "0." + "0" * (-n) + digits
+    else:
+        e = n - 1
+        mantissa = digits if k == 1 else digits[0] + "." + digits[1:]
+        s = f"{mantissa}e{'+' if e >= 0 else '-'}{abs(e)}"
+    return sign + s
+
+
+def js_to_string(value: Any) -> str:
+    """String(value) for a JSON-decoded value."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return js_number_to_string(float(value))
+    if isinstance(value, list):
+        return ",".join("" if v is None else js_to_string(v) for v in value)
+    if isinstance(value, dict):
+        return "[object Object]"
+    return str(value)
+
+
+def js_to_number(value: Any) -> float:
+    """Number(value) for a JSON-decoded value."""
+    if value is None:
+        return 0.0
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, dict):
+        return math.nan
+    if isinstance(value, list):
+        return js_to_number(js_to_string(value))
+    s = str(value).strip()
+    if s == "":
+        return 0.0
+    if _DECIMAL_RE.match(s):
+        return float(s)
+    if s in ("Infinity", "+Infinity"):
+        return math.inf
+    if s == "-Infinity":
+        return -math.inf
+    m = _RADIX_RE.match(s)
+    if m:
+        base = {"x": 16, "o": 8, "b": 2}[m.group(1).lower()]
+        try:
+            return float(int(m.group(2), base))
+        except ValueError:
+            return math.nan
+    return math.nan
+
+
+def _is_falsy(value: Any) -> bool:
+    if value is None or value is False or value == "":
+        return True
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value == 0 or math.isnan(value)
+    return False
+
+
+# ----------------------------
+#  Number formatting
+# ----------------------------
+
+def to_locale_fixed(x: float, digits: int) -> str:
+    """x.toLocaleString("en-US", {minimumFractionDigits: d, maximumFractionDigits: d})"""
+    if math.isnan(x):
+        return "NaN"
+    if math.isinf(x):
+        return "∞" if x > 0 else "-∞"
+    q = Decimal(repr(abs(x))).quantize(
+        Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP, context=_DECIMAL_CONTEXT
+    )
+    sign = "-" if math.copysign(1.0, x) < 0 else ""
+    return sign + f"{q:,.{digits}f}"
+
+
+def to_fixed(x: float, digits: int) -> str:
+    """x.toFixed(d): rounds the exact binary value; -0 prints without a sign."""
+    if math.isnan(x) or math.isinf(x) or abs(x) >= 1e21:
+        return js_number_to_string(x)
+    q = Decimal(abs(x)).quantize(Decimal(1).scaleb(-digits), rounding=ROUND_HALF_UP)
+    return ("-" if x < 0 else "") + f"{q:.{digits}f}"
+
+
+def _special_date(value: Any) -> str:
+    """
+    formatFunctions.SpecialDate: "9/30/2021" -> "Sep 30th". Numeric M/D/Y and
+    Y/M/D dates are parsed the way V8 does; V8's heuristics for free text
+    that merely contains a "/" are not reproduced.
+    """
+    if _is_falsy(value):
+        return ""
+    s = js_to_string(value)
+    if "/" not in s:
+        return s
+
+    m = _YMD_RE.match(s)
+    if m:
+        year, month, day = int(m.group(1)), int(m.group(2)), int(m.group(3))
+    else:
+        m = _MDY_RE.match(s)
+        if not m:
+            return "Invalid Date NaNth"
+        month, day, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        if len(m.group(3)) == 2:
+            year += 2000 if year < 50 else 1900
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return "Invalid Date NaNth"
+    # V8 rolls day overflow into the next month (2/30 -> Mar 2)
+    d = date(year, month, 1) + timedelta(days=day - 1)
+
+    suffix = "th"
+    if d.day in (1, 21, 31):
+        suffix = "st"
+    if d.day in (2, 22):
+        suffix = "nd"
+    if d.day in (3, 23):
+        suffix = "rd"
+    return f"{_MONTHS[d.month - 1]} {d.day}{suffix}"
+
+
+# ----------------------------
+#  formatFunctions port
+# ----------------------------
+
+def _dollar(digits: int, keep_strings: bool) -> Callable[[Any], str]:
+    def fmt(value):
+        if keep_strings and isinstance(value, str):
+            return value
+        return "$" + to_locale_fixed(js_to_number(value), digits)
+    return fmt
+
+
+def _perc(digits: int) -> Callable[[Any], str]:
+    def fmt(value):
+        if isinstance(value, str):
+            return value
+        return to_fixed(js_to_number(value) * 100, digits) + "%"
+    return fmt
+
+
+def _dec(digits: int) -> Callable[[Any], str]:
+    def fmt(value):
+        # toLocaleString on a non-number is just its string form; arrays
+        # format each element with the same options
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return to_locale_fixed(float(value), digits)
+        if isinstance(value, list):
+            return ",".join("" if v is None else fmt(v) for v in value)
+        return js_to_string(value)
+    return fmt
+
+
+JS_FORMATTERS: Dict[str, Callable[[Any], str]] = {
+    "Dollar0": _dollar(0, keep_strings=False),
+    "Dollar2": _dollar(2, keep_strings=True),
+    "Dollar4": _dollar(4, keep_strings=False),
+    "Perc0": _perc(0),
+    "Perc2": _perc(2),
+    "Perc4": _perc(4),
+    "Text": lambda value: "" if _is_falsy(value) else js_to_string(value),
+    "TextTest": lambda value: ("" if _is_falsy(value) else js_to_string(value)) + "*",
+    "Dec0": _dec(0),
+    "Dec2": _dec(2),
+    "Dec4": _dec(4),
+    "SpecialDate": _special_date,
+}
+
+
+def js_format(value: Any, fmt: str) -> str:
+    """Format one cell like window.formatFunctions[fmt] (unknown names fall back to Text)."""
+    if value is None:
+        return ""
+    return JS_FORMATTERS.get(fmt, JS_FORMATTERS["Text"])(value)
+
+
+# ----------------------------
+#  Payloads
+# ----------------------------
+
+def build_payload(
+    data: List[Dict],
+    fields: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """{"fields", "formats", "rows"} with every cell pre-formatted (Text if no formats)."""
+    fields = fields or list(data[0].keys())
+    formats = formats or ["Text"] * len(fields)
+    if len(formats) != len(fields):
+        raise ValueError(f"{len(formats)} formats for {len(fields)} fields")
+    js_formats = [f if f in JS_FORMATTERS else js_format_name(f) for f in formats]
+    fns = [JS_FORMATTERS.get(f, JS_FORMATTERS["Text"]) for f in js_formats]
+
+    rows = []
+    for row in data:
+        out = []
+        for field, fn in zip(fields, fns):
+            value = row.get(field)
+            out.append("" if value is None else fn(value))
+        rows.append(out)
+    return {"fields": fields, "formats": js_formats, "rows": rows}
+
+
+def payload_path(name: str, spec: Dict[str, Any]) -> Path:
+    return Path(spec["source"]).parent / FORMATTED_DIR_NAME / f"{name}.json"
+
+
+def write_payload(name: str, spec: Dict[str, Any], check: bool = False) -> Tuple[str, Path]:
+    """Build and write one web spec's payload; returns (status, path)."""
+    data = _table_data(load_table(spec["source"]))
+    payload = build_payload(data, spec.get("cols"), spec.get("format"))
+    text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
+
+    path = payload_path(name, spec)
+    if path.exists() and path.read_text(encoding="utf-8") == text:
+        return "unchanged", path
+    if check:
+        return "stale", path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return "written", path
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write pre-formatted cell payloads for the web tables."
+    )
+    parser.add_argument("specs", nargs="*", help="Web spec names (default: all with a \"source\")")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="Render manifest path")
+    parser.add_argument("--check", action="store_true", help="Write nothing; exit 1 if any payload is stale")
+    args = parser.parse_args()
+
+    specs = {name: spec for name, spec in load_web_specs(Path(args.manifest)).items() if "source" in spec}
+    if args.specs:
+        unknown = [s for s in args.specs if s not in specs]
+        if unknown:
+            raise ValueError(f"Web specs without a source in the manifest: {unknown}")
+        specs = {s: specs[s] for s in args.specs}
+
+    stale = 0
+    for name, spec in specs.items():
+        status, path = write_payload(name, spec, check=args.check)
+        if status == "written":
+            print(f"Formatted cells saved to: {path}")
+        elif status == "stale":
+            print(f"STALE: {path}")
+            stale += 1
+
+    if stale:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -264,6 +264,35 @@ function insertSvgIntoShape(shapeName, svgUrl) {
     targetShape.appendChild(img);
 }
 
+// Bundled SVGs (bundleSVG.py --format json): one fetch per bundle, shared by
+// every shape that shows one of its items.
+const _svgBundles = {};
+
+function insertBundledSvgIntoShape(shapeName, bundleUrl, itemName) {
+    if (!_svgBundles[bundleUrl]) {
+        _svgBundles[bundleUrl] = fetch(bundleUrl).then(response => {
+            if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+            return response.json();
+        });
+    }
+    _svgBundles[bundleUrl]
+        .then(bundle => {
+            const item = bundle.items[itemName];
+            if (!item) {
+                console.warn(`insertBundledSvgIntoShape: '${itemName}' not in ${bundleUrl}.`);
+                return;
+            }
+            if (!item.url) {
+                item.url = URL.createObjectURL(new Blob([item.svg], { type: "image/svg+xml" }));
+            }
+            insertSvgIntoShape(shapeName, item.url);
+        })
+        .catch(error => {
+            delete _svgBundles[bundleUrl]; // allow a retry
+            console.error("insertBundledSvgIntoShape: failed to load bundle:", error);
+        });
+}
+
 
 
 
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Golden-output regression check for SVG4.py.
+
+Renders every table in tablejsons/ with its recorded options and compares the
+result against the stored golden SVG in tablejsons/golden/. Only tables whose
+output differs are reported.
+
+Usage examples (from repo root):
+
+  # Compare everything (exit 1 if any table differs)
+  python goldenSVG.py
+
+  # Accept the current output as the new goldens (only changed files are written)
+  python goldenSVG.py --update
+
+  # Check a few tables, with 8 worker processes
+  python goldenSVG.py Table14_1a Table3_1 --jobs 8
+
+The comparison is structural: both SVGs are parsed and compared element by
+element (tag, attributes, text), with numbers rounded to --places decimals so
+float noise like 47.98799999999999 vs 47.988 is not a difference. Identical
+bytes short-circuit the parse.
+
+Recorded options and queries come from the render manifest
+(tablejsons/manifest.json, see renderManifest.py); tables not listed there
+render with the defaults.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from SVG4 import generate_svg_table
+from renderManifest import DEFAULT_MANIFEST, load_manifest, spec_rows, spec_to_kwargs
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_TABLE_DIR = REPO_DIR / "tablejsons"
+DEFAULT_GOLDEN_DIR = DEFAULT_TABLE_DIR / "golden"
+
+_NUMBER_RE = re.compile(r"-?\d+\.\d+|-?\d+")
+
+
+# ----------------------------
+#  Rendering
+# ----------------------------
+
+def load_options(manifest_path: Path) -> Dict[str, Dict]:
+    """Validated render manifest spec per table ({} if there is no manifest)."""
+    if not manifest_path.exists():
+        return {}
+    return load_manifest(manifest_path)
+
+
+def list_tables(table_dir: Path, names: Optional[List[str]] = None) -> List[Path]:
+    if names:
+        return [table_dir / f"{name}.json" for name in names]
+    return sorted(table_dir.glob("*.json"))
+
+
+def render_table(json_path: Path, spec: Optional[Dict]) -> Optional[str]:
+    """
+    Render one table as its manifest spec does (query, then options), or with
+    the defaults if it has none; None if the file is not a table (not a list
+    of rows).
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except ValueError:
+            return None
+    if not isinstance(data, list) or not data or not all(isinstance(r, dict) for r in data):
+        return None
+    if spec is None:
+        return generate_svg_table(data)
+    return generate_svg_table(spec_rows(spec, data), **spec_to_kwargs(spec))
+
+
+# ----------------------------
+#  Structural comparison
+# ----------------------------
+
+def _normalize_numbers(text: str, places: int) -> str:
+    def repl(m):
+        value = round(float(m.group(0)), places)
+        if value == 0:
+            value = 0.0  # fold -0.0
+        return repr(value)
+    return _NUMBER_RE.sub(repl, text)
+
+
+def _normalize_text(text: Optional[str], places: int) -> str:
+    return _normalize_numbers(" ".join((text or "").split()), places)
+
+
+def compare_svg(actual: str, expected: str, places: int = 3) -> Optional[str]:
+    """None if the SVGs are structurally equal, else a description of the first difference."""
+    if actual == expected:
+        return None
+    try:
+        a_root = ET.fromstring(actual)
+        e_root = ET.fromstring(expected)
+    except ET.ParseError as e:
+        return f"parse error: {e}"
+
+    stack: List[Tuple[ET.Element, ET.Element, str]] = [(a_root, e_root, "svg")]
+    while stack:
+        a, e, path = stack.pop()
+        if a.tag != e.tag:
+            return f"{path}: tag {a.tag!r} != {e.tag!r}"
+        a_attrs = {k: _normalize_text(v, places) for k, v in a.attrib.items()}
+        e_attrs = {k: _normalize_text(v, places) for k, v in e.attrib.items()}
+        if a_attrs != e_attrs:
+            keys = sorted(set(a_attrs) | set(e_attrs))
+            for k in keys:
+                if a_attrs.get(k) != e_attrs.get(k):
+                    return f"{path}: @{k} {a.attrib.get(k)!r} != {e.attrib.get(k)!r}"
+        if _normalize_text(a.text, places) != _normalize_text(e.text, places):
+            return f"{path}: text {(a.text or '').strip()[:40]!r} != {(e.text or '').strip()[:40]!r}"
+        a_children = list(a)
+        e_children = list(e)
+        if len(a_children) != len(e_children):
+            return f"{path}: {len(a_children)} children != {len(e_children)}"
+        for i, (ac, ec) in enumerate(zip(a_children, e_children)):
+            tag = ac.tag.split("}")[-1]
+            stack.append((ac, ec, f"{path}/{tag}[{i}]"))
+    return None
+
+
+# ----------------------------
+#  Workers
+# ----------------------------
+
+def check_table(job: Tuple[str, str, Optional[Dict], int, bool]) -> Tuple[str, str, Optional[str]]:
+    """
+    Worker: render one table and compare (or update) its golden.
+    Returns (name, status, detail) where status is one of
+    "same", "differs", "missing", "updated", "skipped", "error".
+    """
+    json_path_str, golden_dir_str, spec, places, update = job
+    json_path = Path(json_path_str)
+    name = json_path.stem
+    golden_path = Path(golden_dir_str) / f"{name}.svg"
+    try:
+        svg = render_table(json_path, spec)
+    except Exception as e:
+        return name, "error", f"{type(e).__name__}: {e}"
+    if svg is None:
+        return name, "skipped", None
+
+    expected = golden_path.read_text(encoding="utf-8") if golden_path.exists() else None
+
+    if update:
+        if expected != svg:
+            golden_path.write_text(svg, encoding="utf-8")
+            return name, "updated", None
+        return name, "same", None
+
+    if expected is None:
+        return name, "missing", None
+    diff = compare_svg(svg, expected, places)
+    if diff is None:
+        return name, "same", None
+    return name, "differs", diff
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare rendered table SVGs against stored golden outputs."
+    )
+    parser.add_argument("tables", nargs="*", help="Table names (default: every tablejsons/*.json)")
+    parser.add_argument("--update", action="store_true", help="Write current output as the goldens")
+    parser.add_argument(
+        "--places",
+        type=int,
+        default=3,
+        help="Decimals kept when comparing numbers (default: 3)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument("--golden-dir", default=str(DEFAULT_GOLDEN_DIR), help="Golden SVG directory")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="Render manifest with per-table options")
+    args = parser.parse_args()
+
+    golden_dir = Path(args.golden_dir)
+    golden_dir.mkdir(parents=True, exist_ok=True)
+    options = load_options(Path(args.manifest))
+
+    paths = list_tables(DEFAULT_TABLE_DIR, args.tables)
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"Table not found: {path}")
+
+    jobs = [
+        (str(path), str(golden_dir), options.get(path.stem), args.places, args.update)
+        for path in paths
+    ]
+
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            results = list(pool.map(check_table, jobs, chunksize=8))
+    else:
+        results = [check_table(job) for job in jobs]
+
+    counts: Dict[str, int] = {}
+    for name, status, detail in results:
+        counts[status] = counts.get(status, 0) + 1
+        if status in ("differs", "error"):
+            print(f"{status.upper()}: {name}: {detail}")
+        elif status in ("missing", "updated"):
+            print(f"{status.upper()}: {name}")
+
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    print(f"{len(results)} tables: {summary}")
+
+    if not args.update and (counts.get("differs") or counts.get("error") or counts.get("missing")):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Heatmap layer for a table: a background fill per cell, scaled by value along
+a ramp of PALETTE colours, written as one overlay SVG that sits on the table
+like the highlight overlays.
+
+Usage examples (from repo root):
+
+  # Every numeric column of MarketImpact, Alabaster -> Tea -> Robin
+  python heatmapSVG.py tablejsons/MarketImpact.json
+
+  # Just PercADV and MI, Tea -> Cinnabar in 5 steps, one scale for both columns
+  python heatmapSVG.py tablejsons/MarketImpact.json --columns PercADV MI --ramp Tea Cinnabar --steps 5 --scale table
+
+  # Diverging around zero (negative Robin, positive Cinnabar)
+  python heatmapSVG.py tablejsons/MarketImpact.json --columns IndexTrade --ramp Robin Alabaster Cinnabar --center 0
+
+  # A manifest table (layout from its spec)
+  python heatmapSVG.py Table14_1b --columns Weight IndexValue
+
+Colours are quantized to --steps levels (evenly spaced along the ramp), so
+neighbouring cells often share a colour: runs of same-colour cells down a
+column become one <rect>, runs matching across adjacent columns are merged
+sideways too, and rects are grouped in one <g fill> per colour. Empty and
+non-numeric cells are left unfilled.
+
+Values are scaled per column by default (each column spans the whole ramp),
+or across all selected columns with --scale table. With --center the ramp's
+middle is pinned to that value and the scale is symmetric around it.
+
+The layout is the table's own (renderManifest.table_layout); output goes to
+the table's svg/ folder as <table>_heatmap.svg (or --out), only written when
+it changes.
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from highlightRules import Columns, add_layout_args, layout_overrides, load_rows, resolve_table
+from renderManifest import output_path, table_layout
+from SVG4 import color_from_name
+from svgGeometry import fmt_num
+
+DEFAULT_RAMP = ["Alabaster", "Tea", "Robin"]
+DEFAULT_STEPS = 7
+
+_RGB_RE = re.compile(r"rgb\((\d+),\s*(\d+),\s*(\d+)\)")
+
+Rect = Tuple[float, float, float, float]
+
+
+# ----------------------------
+#  Colour ramp
+# ----------------------------
+
+def _rgb(color: str) -> Tuple[int, int, int]:
+    m = _RGB_RE.fullmatch(color)
+    if not m:
+        raise ValueError(f"Expected an rgb(r,g,b) colour, got {color!r}")
+    return int(m.group(1)), int(m.group(2)), int(m.group(3))
+
+
+def ramp_colors(names: List[str], steps: int) -> List[str]:
+    """steps colours evenly spaced along the palette colours in names (linear RGB blend)."""
+    if steps < 2:
+        raise ValueError("steps must be at least 2")
+    stops = [_rgb(color_from_name(n)) for n in names]
+    if len(stops) == 1:
+        return [f"rgb{stops[0]}".replace(" ", "")] * steps
+
+    colors = []
+    for k in range(steps):
+        t = k / (steps - 1) * (len(stops) - 1)
+        i = min(int(t), len(stops) - 2)
+        f = t - i
+        a, b = stops[i], stops[i + 1]
+        r, g, bl = (round(a[c] + (b[c] - a[c]) * f) for c in range(3))
+        colors.append(f"rgb({r},{g},{bl})")
+    return colors
+
+
+# ----------------------------
+#  Binning
+# ----------------------------
+
+def _bounds(values: List[Optional[float]], center: Optional[float]) -> Optional[Tuple[float, float]]:
+    present = [v for v in values if v is not None]
+    if not present:
+        return None
+    lo, hi = min(present), max(present)
+    if center is not None:
+        half = max(abs(lo - center), abs(hi - center))
+        lo, hi = center - half, center + half
+    return lo, hi
+
+
+def bin_values(
+    values: List[Optional[float]],
+    bounds: Optional[Tuple[float, float]],
+    steps: int,
+) -> List[Optional[int]]:
+    """Ramp step (0 .. steps-1) per value, None for missing values."""
+    if bounds is None:
+        return [None] * len(values)
+    lo, hi = bounds
+    if hi <= lo:
+        mid = (steps - 1) // 2
+        return [None if v is None else mid for v in values]
+    scale = steps / (hi - lo)
+    top = steps - 1
+    return [None if v is None else min(top, max(0, int((v - lo) * scale))) for v in values]
+
+
+# ----------------------------
+#  Rect merging
+# ----------------------------
+
+def column_runs(bins: List[Optional[int]]) -> List[Tuple[int, int, int]]:
+    """(first row, length, step) for each run of equal, non-missing steps down a column."""
+    runs: List[Tuple[int, int, int]] = []
+    start = 0
+    for i in range(1, len(bins) + 1):
+        if i == len(bins) or bins[i] != bins[start]:
+            if bins[start] is not None:
+                runs.append((start, i - start, bins[start]))
+            start = i
+    return runs
+
+
+def merged_rects(
+    bins_by_col: List[Tuple[int, List[Optional[int]]]],
+    layout: Dict,
+) -> Dict[int, List[Rect]]:
+    """
+    {step: [rect]} for the binned cells. Vertical runs are merged first; a
+    run identical to one in the column just left of it widens that rect.
+    bins_by_col is [(col_index, bins)] in column order.
+    """
+    header_divider_y = layout["header_divider_y"]
+    row_height = layout["row_height"]
+    col_start_x = layout["col_start_x"]
+    col_end_x = layout["col_end_x"]
+
+    # (start, length, step) -> [x0, x1, last col] of the rect still open on the right
+    open_rects: Dict[Tuple[int, int, int], List[float]] = {}
+    done: List[Tuple[int, Tuple[int, int, int], List[float]]] = []
+    for col, bins in bins_by_col:
+        still_open: Dict[Tuple[int, int, int], List[float]] = {}
+        for run in column_runs(bins):
+            prev = open_rects.get(run)
+            if prev is not None and prev[2] == col - 1:
+                del open_rects[run]
+                prev[1], prev[2] = col_end_x[col], col
+                still_open[run] = prev
+            else:
+                still_open[run] = [col_start_x[col], col_end_x[col], col]
+        done.extend((run[2], run, r) for run, r in open_rects.items())
+        open_rects = still_open
+    done.extend((run[2], run, r) for run, r in open_rects.items())
+
+    rects: Dict[int, List[Rect]] = {}
+    for step, (start, length, _), (x0, x1, _) in sorted(done, key=lambda d: (d[0], d[1][0], d[2][0])):
+        y = header_divider_y + row_height * start
+        rects.setdefault(step, []).append((x0, y, x1 - x0, row_height * length))
+    return rects
+
+
+def heatmap_svg(
+    layout: Dict,
+    rects: Dict[int, List[Rect]],
+    colors: List[str],
+    opacity: float,
+    precision: Optional[int] = None,
+) -> str:
+    svg_width = layout["svg_width"]
+    svg_height = layout["svg_height"]
+    parts = [
+        f'<svg width="{svg_width}" height="{svg_height}" '
+        f'viewBox="0 0 {svg_width} {svg_height}" xmlns="http://www.w3.org/2000/svg">\n'
+    ]
+    for step in sorted(rects):
+        parts.append(f'  <g fill="{colors[step]}" fill-opacity="{opacity}">\n')
+        for x, y, width, height in rects[step]:
+            parts.append(
+                f'    <rect x="{fmt_num(x, precision)}" y="{fmt_num(y, precision)}" '
+                f'width="{fmt_num(width, precision)}" height="{fmt_num(height, precision)}" />\n'
+            )
+        parts.append("  </g>\n")
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+# ----------------------------
+#  Generator
+# ----------------------------
+
+def generate_heatmap(
+    spec: Dict[str, Any],
+    data: List[Dict],
+    columns: Optional[List[str]] = None,
+    ramp: Optional[List[str]] = None,
+    steps: int = DEFAULT_STEPS,
+    scale: str = "column",
+    center: Optional[float] = None,
+    opacity: float = 0.5,
+) -> Tuple[str, int]:
+    """
+    (svg, rect count) of the heatmap layer for the shown columns in
+    columns (default: every shown column with numeric values).
+    """
+    if scale not in ("column", "table"):
+        raise ValueError("scale must be 'column' or 'table'.")
+    colors = ramp_colors(ramp or DEFAULT_RAMP, steps)
+    col_keys, _, _, _, layout = table_layout(spec, data)
+    values = Columns(data)
+
+    if columns:
+        hidden = [c for c in columns if c not in col_keys]
+        if hidden:
+            raise ValueError(f"Columns not shown in the table: {hidden}")
+        selected = [c for c in col_keys if c in columns]
+    else:
+        selected = [c for c in col_keys if any(v is not None for v in values.numbers(c))]
+    if not selected or not any(v is not None for c in selected for v in values.numbers(c)):
+        raise ValueError("No numeric values to shade.")
+
+    numbers = {c: values.numbers(c) for c in selected}
+    if scale == "table":
+        shared = _bounds([v for c in selected for v in numbers[c]], center)
+        bounds = {c: shared for c in selected}
+    else:
+        bounds = {c: _bounds(numbers[c], center) for c in selected}
+
+    bins_by_col = [
+        (col_keys.index(c), bin_values(numbers[c], bounds[c], steps)) for c in selected
+    ]
+    rects = merged_rects(bins_by_col, layout)
+    precision = spec.get("precision")
+    if spec.get("minify") and precision is None:
+        precision = 2
+    svg = heatmap_svg(layout, rects, colors, opacity, precision)
+    return svg, sum(len(r) for r in rects.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write a heatmap layer (value-scaled cell fills) for a table."
+    )
+    parser.add_argument("table", help="Manifest table name or a JSON / CSV / TSV file (e.g., tablejsons/MarketImpact.json)")
+    parser.add_argument("--columns", nargs="+", help="Columns to shade (default: every numeric column shown)")
+    parser.add_argument(
+        "--ramp",
+        nargs="+",
+        default=DEFAULT_RAMP,
+        metavar="COLOR_NAME",
+        help=f"Palette colours from low to high (default: {' '.join(DEFAULT_RAMP)})",
+    )
+    parser.add_argument("--steps", type=int, default=DEFAULT_STEPS, help=f"Colour levels (default: {DEFAULT_STEPS})")
+    parser.add_argument(
+        "--scale",
+        choices=["column", "table"],
+        default="column",
+        help="Scale each column separately, or all selected columns together (default: column)",
+    )
+    parser.add_argument("--center", type=float, help="Value pinned to the middle of the ramp (diverging)")
+    parser.add_argument("--opacity", type=float, default=0.5, help="Fill opacity (default: 0.5)")
+    parser.add_argument("--out", help="Output SVG path (default: <svg dir>/<table>_heatmap.svg)")
+    add_layout_args(parser)
+    args = parser.parse_args()
+
+    name, spec = resolve_table(args.table, Path(args.manifest), layout_overrides(args))
+    data = load_rows(spec)
+    try:
+        svg, n_rects = generate_heatmap(
+            spec,
+            data,
+            columns=args.columns,
+            ramp=args.ramp,
+            steps=args.steps,
+            scale=args.scale,
+            center=args.center,
+            opacity=args.opacity,
+        )
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    path = Path(args.out) if args.out else output_path(name, spec).parent / f"{name}_heatmap.svg"
+    if path.exists() and path.read_text(encoding="utf-8") == svg:
+        print(f"Unchanged: {path}")
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(svg, encoding="utf-8")
+    print(f"Heatmap saved to: {path} ({n_rects} rects)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Rule-based highlight overlays: pick the rows / cells to highlight from the
+data ("rows where Weight > 5%", "the largest MC") instead of finding the
+indices by hand for --rowhighlight or overlaySVG.py --rows.
+
+Usage examples (from repo root):
+
+  # Rows with Weight over 5% in Robin, the largest IndexValue cell in Tea
+  python highlightRules.py tablejsons/Table4_1b.json --rule "Weight > 5%" row Robin --rule "max IndexValue" cell Tea
+
+  # A manifest table (layout from its spec), the 5 largest weights
+  python highlightRules.py Table14_1b --rule "top 5 Weight" row Cinnabar
+
+  # JSON files not in the manifest take the usual SVG4.py layout options
+  python highlightRules.py tablejsons/Table9_1.json --size 1000 700 --rule "Unrealized < 0" cell Cinnabar
+
+Rules (one column each; column names may contain spaces):
+
+  Weight > 5%        comparison: >, >=, <, <=, ==, !=
+  Ticker == AAPL     non-numeric values compare as text (== and != only)
+  max MC / min MC    every row holding the column max / min
+  top 10 Weight      the N largest / smallest values
+  bottom 3 Weight
+
+Numbers compare against the raw JSON values (strings like "$1,200" are
+read as numbers); a trailing % divides the threshold by 100, so
+"Weight > 5%" matches a Weight of 0.0512. Cells that are empty or not
+numeric never match a numeric rule.
+
+Targets: "row" highlights whole rows (the rule's column need not be shown);
+"cell" highlights the matching cells of the rule's column.
+
+Each rule is evaluated once over the whole column (values are converted once
+per column and shared between rules), and all its matches go into a single
+overlay SVG; consecutive matching rows are merged into one <rect>. The layout
+is the table's own (see renderManifest.table_layout), so overlays line up
+with the SVG4.py / renderManifest.py output. Files are written to the table's
+svg/ folder as <table>_<target>s_<rule>_<Color>.svg, only when they change.
+"""
+
+import argparse
+import heapq
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from renderManifest import DEFAULT_MANIFEST, SPEC_DEFAULTS, load_manifest, output_path, spec_rows, table_layout
+from SVG4 import (
+    _CONDITION_RE,
+    QUERY_OPS,
+    _highlight_rect,
+    _overlay_rects_svg,
+    _table_data,
+    _to_number,
+    color_from_name,
+    parse_condition,
+)
+from tableColumns import load_table
+
+TARGETS = ("row", "cell")
+
+_OP_SLUGS = {">=": "ge", "<=": "le", "==": "eq", "!=": "ne", ">": "gt", "<": "lt"}
+
+_RANK_RE = re.compile(r"^(top|bottom)\s+(\d+)\s+(.+)$", re.IGNORECASE)
+_EXTREME_RE = re.compile(r"^(max|min)\s+(.+)$", re.IGNORECASE)
+
+
+# ----------------------------
+#  Rule parsing
+# ----------------------------
+
+def parse_rule(text: str) -> Dict[str, Any]:
+    """
+    "Weight > 5%" -> {"kind": "compare", "column": "Weight", "op": ">", "value": 0.05}.
+    Kinds: compare, max, min, top, bottom. Raises ValueError if unparseable.
+    """
+    text = text.strip()
+    m = _RANK_RE.match(text)
+    if m:
+        return {"kind": m.group(1).lower(), "n": int(m.group(2)), "column": m.group(3).strip()}
+    m = _EXTREME_RE.match(text)
+    if m:
+        return {"kind": m.group(1).lower(), "column": m.group(2).strip()}
+    if _CONDITION_RE.match(text):
+        column, op, value = parse_condition(text)  # same syntax as SVG4.py --where
+        return {"kind": "compare", "column": column, "op": op, "value": value}
+    raise ValueError(
+        f"Cannot parse rule {text!r}; use e.g. \"Weight > 5%\", \"max MC\" or \"top 5 Weight\""
+    )
+
+
+def rule_slug(text: str) -> str:
+    """File-name form of a rule: "Weight > 5%" -> "Weight_gt_5pct"."""
+    s = text.strip()
+    for op in QUERY_OPS:  # two-character operators first
+        s = s.replace(op, f" {_OP_SLUGS[op]} ")
+    s = s.replace("%", "pct")
+    return re.sub(r"[^A-Za-z0-9.-]+", "_", s).strip("_")
+
+
+# ----------------------------
+#  Column-wise evaluation
+# ----------------------------
+
+class Columns:
+    """Per-column value lists for a table, converted once and shared by every rule."""
+
+    def __init__(self, data: List[Dict]):
+        self.data = data
+        self._numbers: Dict[str, List[Optional[float]]] = {}
+        self._texts: Dict[str, List[str]] = {}
+
+    def _check(self, column: str):
+        if column not in self.data[0]:
+            raise ValueError(f"Column {column!r} not in data (have: {list(self.data[0])})")
+
+    def numbers(self, column: str) -> List[Optional[float]]:
+        """Numeric value per row (None if empty / not numeric)."""
+        if column not in self._numbers:
+            self._check(column)
+            self._numbers[column] = [_to_number(row.get(column)) for row in self.data]
+        return self._numbers[column]
+
+    def texts(self, column: str) -> List[str]:
+        if column not in self._texts:
+            self._check(column)
+            self._texts[column] = ["" if row.get(column) is None else str(row.get(column)) for row in self.data]
+        return self._texts[column]
+
+
+def evaluate(rule: Dict[str, Any], columns: Columns) -> List[int]:
+    """Sorted row indices matching a parsed rule."""
+    kind = rule["kind"]
+    column = rule["column"]
+
+    if kind == "compare" and isinstance(rule["value"], str):
+        target = rule["value"]
+        texts = columns.texts(column)
+        if rule["op"] == "==":
+            return [i for i, v in enumerate(texts) if v == target]
+        return [i for i, v in enumerate(texts) if v != target]
+
+    values = columns.numbers(column)
+    present = [i for i, v in enumerate(values) if v is not None]
+    if not present:
+        return []
+
+    if kind == "compare":
+        op, x = QUERY_OPS[rule["op"]], rule["value"]
+        return [i for i in present if op(values[i], x)]
+    if kind in ("max", "min"):
+        best = (max if kind == "max" else min)(values[i] for i in present)
+        return [i for i in present if values[i] == best]
+    pick = heapq.nlargest if kind == "top" else heapq.nsmallest
+    return sorted(pick(rule["n"], present, key=values.__getitem__))
+
+
+def row_runs(indices: List[int]) -> List[Tuple[int, int]]:
+    """[2, 3, 4, 7] -> [(2, 3), (7, 1)]: (first row, run length) of consecutive rows."""
+    runs: List[Tuple[int, int]] = []
+    for i in indices:
+        if runs and runs[-1][0] + runs[-1][1] == i:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((i, 1))
+    return runs
+
+
+def rule_rects(
+    indices: List[int],
+    target: str,
+    layout: Dict,
+    num_rows: int,
+    col_index: Optional[int] = None,
+) -> List[Tuple[float, float, float, float]]:
+    """One rect per run of consecutive matching rows (whole rows, or cells of one column)."""
+    kind = "row" if target == "row" else "cell"
+    rects = []
+    for start, length in row_runs(indices):
+        x, y, width, height = _highlight_rect(kind, layout, num_rows, start, col_index)
+        rects.append((x, y, width, height * length))
+    return rects
+
+
+# ----------------------------
+#  Table + overlays
+# ----------------------------
+
+def resolve_table(
+    table: str,
+    manifest_path: Path = DEFAULT_MANIFEST,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    (name, spec) for a manifest table name, or for a table file (manifest spec
+    if its stem is listed, else defaults plus overrides).
+    """
+    specs = load_manifest(manifest_path, check_sources=False) if Path(manifest_path).exists() else {}
+    if table in specs:
+        return table, specs[table]
+    path = Path(table)
+    if not path.exists():
+        raise FileNotFoundError(f"Not a manifest table or table file: {table}")
+    if path.stem in specs and specs[path.stem]["source"] == str(path.resolve()):
+        return path.stem, specs[path.stem]
+    spec = dict(SPEC_DEFAULTS)
+    spec.update({k: v for k, v in (overrides or {}).items() if v is not None})
+    spec["source"] = str(path.resolve())
+    return path.stem, spec
+
+
+def add_layout_args(parser: argparse.ArgumentParser):
+    """Layout options for JSON files not in the manifest (as SVG4.py)."""
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="Render manifest path")
+    parser.add_argument("--cols", nargs="*", help="Column keys to include (default: all keys from first row)")
+    parser.add_argument("--headers", nargs="*", help="Custom header labels (must match number of cols)")
+    parser.add_argument("--format", nargs="*", metavar="FMT", help="Per-column format codes")
+    parser.add_argument("--colwidths", nargs="*", type=float, help="Relative column widths (will be scaled)")
+    parser.add_argument("--fontsize", type=int, help="Font size in pt (default: 14)")
+    parser.add_argument("--size", nargs=2, type=int, metavar=("WIDTH", "HEIGHT"), help="SVG size")
+    parser.add_argument("--precision", type=int, help="Round geometry to this many decimals")
+
+
+def layout_overrides(args) -> Dict[str, Any]:
+    return {
+        "cols": args.cols,
+        "headers": args.headers,
+        "format": args.format,
+        "colwidths": args.colwidths,
+        "fontsize": args.fontsize,
+        "size": args.size,
+        "precision": args.precision,
+    }
+
+
+def load_rows(spec: Dict[str, Any]) -> List[Dict]:
+    """The rows a spec renders, from its JSON or CSV / TSV source."""
+    return spec_rows(spec, _table_data(load_table(spec["source"])))
+
+
+def generate_rule_overlays(
+    name: str,
+    spec: Dict[str, Any],
+    data: List[Dict],
+    rules: List[Tuple[str, str, str]],
+    opacity: float = 0.5,
+) -> List[Tuple[Path, str, int]]:
+    """
+    [(path, svg, matched rows)] for each (rule text, target, color name).
+    The layout is computed once for all rules.
+    """
+    data = _table_data(data)
+    parsed = []
+    for text, target, color in rules:
+        if target not in TARGETS:
+            raise ValueError(f"Rule {text!r}: target must be one of {list(TARGETS)}")
+        parsed.append((text, parse_rule(text), target, color_from_name(color), color.replace(" ", "")))
+
+    col_keys, _, _, _, layout = table_layout(spec, data)
+    columns = Columns(data)
+    precision = spec.get("precision")
+    if spec.get("minify") and precision is None:
+        precision = 2
+    out_dir = output_path(name, spec).parent
+
+    outputs = []
+    for text, rule, target, color_rgb, color_name in parsed:
+        col_index = None
+        if target == "cell":
+            if rule["column"] not in col_keys:
+                raise ValueError(f"Rule {text!r}: column {rule['column']!r} is not shown, so no cells to highlight")
+            col_index = col_keys.index(rule["column"])
+        indices = evaluate(rule, columns)
+        rects = rule_rects(indices, target, layout, len(data), col_index)
+        svg = _overlay_rects_svg(layout, rects, color_rgb, opacity, precision)
+        path = out_dir / f"{name}_{target}s_{rule_slug(text)}_{color_name}.svg"
+        outputs.append((path, svg, len(indices)))
+    return outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Write highlight overlays for the rows / cells matching data rules."
+    )
+    parser.add_argument("table", help="Manifest table name (e.g., Table3_1) or a JSON / CSV / TSV file")
+    parser.add_argument(
+        "--rule",
+        nargs=3,
+        action="append",
+        required=True,
+        metavar=("RULE", "TARGET", "COLOR_NAME"),
+        help='A rule, "row" or "cell", and a color, e.g. --rule "Weight > 5%%" row Robin',
+    )
+    parser.add_argument("--opacity", type=float, default=0.5, help="Fill opacity (default: 0.5)")
+    add_layout_args(parser)
+    args = parser.parse_args()
+
+    name, spec = resolve_table(args.table, Path(args.manifest), layout_overrides(args))
+    data = load_rows(spec)
+
+    try:
+        outputs = generate_rule_overlays(name, spec, data, [tuple(r) for r in args.rule], args.opacity)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    for (text, target, _), (path, svg, matched) in zip(args.rule, outputs):
+        if matched == 0:
+            print(f"No {target}s match {text!r}; nothing written.")
+            continue
+        if path.exists() and path.read_text(encoding="utf-8") == svg:
+            print(f"Unchanged: {path} ({matched} {target}s)")
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(svg, encoding="utf-8")
+        print(f"Rule highlight saved to: {path} ({matched} {target}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,14 +17,36 @@ Usage examples (from repo root):
   # Highlight specific cells (row,col pairs)
   python highlightSVG.py Scott.svg --cell 2 3 --cell 4 1 --color Robin
 
+  # Many overlays from a spec file (geometry detected once per base SVG)
+  python overlaySVG.py --batch overlays.json --jobs 8
+
 The output is an SVG with the SAME width/height/viewBox, but containing ONLY
 the highlight <rect> overlays (no original lines/text/etc.).
+
+A batch spec is a JSON list of overlays; svg paths resolve like the
+positional argument (relative to tablejsons/svg), and every key except
+"svg" is optional (color defaults to Tea, opacity to 0.5):
+
+  [
+    {"svg": "Table3_1.svg", "rows": [2, 4], "color": "Robin"},
+    {"svg": "Table3_1.svg", "cols": [1], "color": "Tea", "opacity": 0.3},
+    {"svg": "Table14_1b.svg", "cells": [[2, 3], [4, 1]], "color": "Cinnabar"}
+  ]
+
+Overlays whose output is byte-identical to the existing file are not
+rewritten. Entries that would write the same file (same svg, rows, cols,
+cells and color) are rejected before anything is written.
 """
 
 import argparse
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import xml.etree.ElementTree as ET
-from typing import List, Tuple, Dict, Optional
+from typing import Any, List, Tuple, Dict, Optional
 
 # --- Color palette (same naming as your generator) ------------------------
 
@@ -54,6 +76,10 @@ def resolve_color(name: str) -> str:
 
 SVG_NS = "http://www.w3.org/2000/svg"
 NS = {"svg": SVG_NS}
+ET.register_namespace("", SVG_NS)  # ensure xmlns is written exactly once
+
+DEFAULT_SVG_DIR = Path(__file__).resolve().parent / "tablejsons" / "svg"
+BATCH_KEYS = {"svg", "rows", "cols", "cells", "color", "opacity"}
 
 
 def _parse_float(val: Optional[str]) -> float:
@@ -261,6 +287,93 @@ def add_cell_overlays(
         root.append(rect)
 
 
+# --- Geometry + overlay assembly ------------------------------------------
+
+def detect_geometry(svg_path: Path) -> Dict[str, Any]:
+    """Parse a base table SVG once and infer everything overlays need."""
+    orig_root = ET.parse(svg_path).getroot()
+
+    svg_width, svg_height, view_box = detect_svg_size_and_viewbox(orig_root)
+    if svg_width <= 0 or svg_height <= 0:
+        raise RuntimeError("Unable to determine SVG width/height.")
+
+    header_divider_y, row_height, num_rows = detect_row_layout(orig_root)
+    col_start_x, col_end_x = detect_column_boundaries(orig_root, svg_width)
+    return {
+        "svg_width": svg_width,
+        "svg_height": svg_height,
+        "view_box": view_box,
+        "header_divider_y": header_divider_y,
+        "row_height": row_height,
+        "num_rows": num_rows,
+        "col_start_x": col_start_x,
+        "col_end_x": col_end_x,
+    }
+
+
+def build_overlay(
+    geometry: Dict[str, Any],
+    rows: List[int],
+    cols: List[int],
+    cells: List[Tuple[int, int]],
+    color_rgb: str,
+    opacity: float = 0.5,
+) -> bytes:
+    """A new overlay-only SVG (as written to disk) on a detected geometry."""
+    g = geometry
+    overlay_root = ET.Element(
+        f"{{{SVG_NS}}}svg",
+        {
+            "width": str(g["svg_width"]),
+            "height": str(g["svg_height"]),
+        },
+    )
+    if g["view_box"]:
+        overlay_root.set("viewBox", g["view_box"])
+
+    if rows:
+        add_row_overlays(
+            overlay_root,
+            rows,
+            color_rgb,
+            g["header_divider_y"],
+            g["row_height"],
+            g["num_rows"],
+            g["svg_width"],
+            opacity=opacity,
+        )
+
+    if cols:
+        add_column_overlays(
+            overlay_root,
+            cols,
+            color_rgb,
+            g["header_divider_y"],
+            g["row_height"],
+            g["num_rows"],
+            g["col_start_x"],
+            g["col_end_x"],
+            opacity=opacity,
+        )
+
+    if cells:
+        add_cell_overlays(
+            overlay_root,
+            cells,
+            color_rgb,
+            g["header_divider_y"],
+            g["row_height"],
+            g["num_rows"],
+            g["col_start_x"],
+            g["col_end_x"],
+            opacity=opacity,
+        )
+
+    buf = io.BytesIO()
+    ET.ElementTree(overlay_root).write(buf, encoding="utf-8", xml_declaration=True)
+    return buf.getvalue()
+
+
 # --- Naming and CLI -------------------------------------------------------
 
 def build_output_name(
@@ -289,11 +402,117 @@ def build_output_name(
     return base_svg.with_name(name)
 
 
+# --- Batch mode -----------------------------------------------------------
+
+def load_batch(spec_path: Path) -> Dict[Path, List[Dict[str, Any]]]:
+    """
+    Validate a batch spec and group its entries by base SVG (in first-seen
+    order). Raises ValueError listing every problem found, including entries
+    that would write the same output file, before anything is written.
+    """
+    with open(spec_path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"{spec_path}: expected a list of overlay entries")
+
+    groups: Dict[Path, List[Dict[str, Any]]] = {}
+    outputs: Dict[Path, str] = {}
+    errors: List[str] = []
+    for i, entry in enumerate(entries):
+        label = f"entry {i}"
+        if not isinstance(entry, dict) or "svg" not in entry:
+            errors.append(f"{label}: must be an object with an \"svg\" path")
+            continue
+        unknown = sorted(set(entry) - BATCH_KEYS)
+        if unknown:
+            errors.append(f"{label}: unknown keys {unknown}")
+
+        try:
+            rows = [int(r) for r in entry.get("rows", [])]
+            cols = [int(c) for c in entry.get("cols", [])]
+            cells = [(int(r), int(c)) for r, c in entry.get("cells", [])]
+            opacity = float(entry.get("opacity", 0.5))
+        except (TypeError, ValueError):
+            errors.append(f"{label}: rows/cols must be integers, cells [row, col] pairs, opacity a number")
+            continue
+        if not rows and not cols and not cells:
+            errors.append(f"{label}: needs at least one of rows, cols or cells")
+        color = str(entry.get("color", "Tea"))
+        try:
+            resolve_color(color)
+        except ValueError as e:
+            errors.append(f"{label}: {e}")
+
+        svg_path = DEFAULT_SVG_DIR / entry["svg"]
+        if not svg_path.exists():
+            errors.append(f"{label}: SVG file not found: {svg_path}")
+        groups.setdefault(svg_path, []).append({
+            "rows": rows, "cols": cols, "cells": cells, "color": color, "opacity": opacity,
+        })
+
+        # Two entries with the same name would overwrite each other's overlay
+        out_path = build_output_name(svg_path, rows, cols, cells, color.replace(" ", ""))
+        first = outputs.setdefault(out_path.resolve(), label)
+        if first != label:
+            errors.append(f"{label}: same output file as {first}: {out_path}")
+
+    if errors:
+        raise ValueError(f"Invalid batch spec {spec_path}:\n  " + "\n  ".join(errors))
+    return groups
+
+
+def overlay_file(job: Tuple[str, List[Dict[str, Any]]]) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    Worker: detect one base SVG's geometry, then write each of its overlays.
+    Returns [(output or svg path, status, detail)] with status "written",
+    "unchanged" or "error".
+    """
+    svg_file, entries = job
+    svg_path = Path(svg_file)
+    try:
+        geometry = detect_geometry(svg_path)
+    except Exception as e:
+        return [(svg_file, "error", f"{type(e).__name__}: {e}")]
+
+    results = []
+    for entry in entries:
+        color_name = entry["color"].replace(" ", "")
+        out_path = build_output_name(svg_path, entry["rows"], entry["cols"], entry["cells"], color_name)
+        try:
+            svg = build_overlay(
+                geometry,
+                entry["rows"],
+                entry["cols"],
+                entry["cells"],
+                resolve_color(entry["color"]),
+                opacity=entry["opacity"],
+            )
+            if out_path.exists() and out_path.read_bytes() == svg:
+                results.append((str(out_path), "unchanged", None))
+                continue
+            out_path.write_bytes(svg)
+            results.append((str(out_path), "written", None))
+        except Exception as e:
+            results.append((str(out_path), "error", f"{type(e).__name__}: {e}"))
+    return results
+
+
+def run_batch(spec_path: Path, jobs: int = 1) -> List[Tuple[str, str, Optional[str]]]:
+    """All overlays in a batch spec, one job per base SVG (in a process pool if jobs > 1)."""
+    work = [(str(p), entries) for p, entries in load_batch(spec_path).items()]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            per_file = list(pool.map(overlay_file, work))
+    else:
+        per_file = [overlay_file(job) for job in work]
+    return [r for results in per_file for r in results]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Create a highlight overlay SVG (rectangles only) for an existing table SVG."
     )
-    parser.add_argument("svg_file", help="Input base SVG file (e.g., Scott.svg)")
+    parser.add_argument("svg_file", nargs="?", help="Input base SVG file (e.g., Scott.svg)")
 
     parser.add_argument(
         "--rows",
@@ -324,13 +543,40 @@ def main():
         "--opacity",
         type=float,
         default=0.5,
-        help="Fill opacity for overlays (default: 0.5 for 50%).",
+        help="Fill opacity for overlays (default: 0.5 for 50%%).",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="SPEC_JSON",
+        help="Write every overlay listed in a JSON spec file instead of a single one",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --batch (default: CPU count)",
     )
 
     args = parser.parse_args()
 
-    # Default base SVG folder: repo_root/tablejsons/svg
-    DEFAULT_SVG_DIR = Path(__file__).resolve().parent / "tablejsons" / "svg"
+    if args.batch:
+        if args.svg_file:
+            parser.error("give either an SVG file or --batch, not both")
+        results = run_batch(Path(args.batch), jobs=args.jobs)
+        counts = {"written": 0, "unchanged": 0, "error": 0}
+        for path, status, detail in results:
+            counts[status] += 1
+            if status == "written":
+                print(f"Overlay-only SVG written to: {path}")
+            elif status == "error":
+                print(f"ERROR: {path}: {detail}")
+        print(f"{len(results)} overlays: {counts['written']} written, "
+              f"{counts['unchanged']} unchanged, {counts['error']} failed")
+        if counts["error"]:
+            sys.exit(1)
+        return
+    if not args.svg_file:
+        parser.error("an SVG file (or --batch SPEC_JSON) is required")
 
     svg_arg = args.svg_file
     svg_path = DEFAULT_SVG_DIR / svg_arg
@@ -352,72 +598,13 @@ def main():
     color_rgb = resolve_color(args.color)
     color_name_clean = args.color.replace(" ", "")
 
-    # Parse the ORIGINAL SVG (for geometry only)
-    ET.register_namespace("", SVG_NS)  # ensure xmlns is written exactly once
-    tree = ET.parse(svg_path)
-    orig_root = tree.getroot()
-
-    svg_width, svg_height, view_box = detect_svg_size_and_viewbox(orig_root)
-    if svg_width <= 0 or svg_height <= 0:
-        raise RuntimeError("Unable to determine SVG width/height.")
-
-    header_divider_y, row_height, num_rows = detect_row_layout(orig_root)
-    col_start_x, col_end_x = detect_column_boundaries(orig_root, svg_width)
-
-    # Create a NEW SVG root that only contains overlays
-    overlay_root = ET.Element(
-        f"{{{SVG_NS}}}svg",
-        {
-            "width": str(svg_width),
-            "height": str(svg_height),
-        },
-    )
-    if view_box:
-        overlay_root.set("viewBox", view_box)
-
-    # Add overlay rectangles
-    if rows:
-        add_row_overlays(
-            overlay_root,
-            rows,
-            color_rgb,
-            header_divider_y,
-            row_height,
-            num_rows,
-            svg_width,
-            opacity=args.opacity,
-        )
-
-    if cols:
-        add_column_overlays(
-            overlay_root,
-            cols,
-            color_rgb,
-            header_divider_y,
-            row_height,
-            num_rows,
-            col_start_x,
-            col_end_x,
-            opacity=args.opacity,
-        )
-
-    if cells:
-        add_cell_overlays(
-            overlay_root,
-            cells,
-            color_rgb,
-            header_divider_y,
-            row_height,
-            num_rows,
-            col_start_x,
-            col_end_x,
-            opacity=args.opacity,
-        )
+    # Parse the ORIGINAL SVG (for geometry only), then build the overlay
+    geometry = detect_geometry(svg_path)
+    svg = build_overlay(geometry, rows, cols, cells, color_rgb, opacity=args.opacity)
 
     # Build output filename in the same folder as the base SVG
     out_path = build_output_name(svg_path, rows, cols, cells, color_name_clean)
-    overlay_tree = ET.ElementTree(overlay_root)
-    overlay_tree.write(out_path, encoding="utf-8", xml_declaration=True)
+    out_path.write_bytes(svg)
     print(f"Overlay-only SVG written to: {out_path}")
 
 
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Rasterize generated SVGs to PNG, with a content-addressed cache so an
+unchanged SVG is never rasterized twice.
+
+Usage examples (from repo root):
+
+  # Every SVG in tablejsons/svg/ -> tablejsons/svg/png/*.png
+  python rasterSVG.py
+
+  # A few files at 2x, 8 worker processes
+  python rasterSVG.py tablejsons/svg/Table3_1.svg tablejsons/svg/Table14_1b.svg --scale 2 --jobs 8
+
+Rasterizer backends (whichever is installed, in this order):
+
+  cairosvg      pip install cairosvg
+  rsvg          the rsvg-convert command (librsvg)
+
+The cache (.rastercache/ at the repo root by default) keys each PNG by a
+hash of the SVG bytes, the backend and the scale. A cache hit is a file copy,
+and an output PNG is only rewritten when its bytes change.
+
+SVG4.py and renderManifest.py call this module when run with --png.
+"""
+
+import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_SVG_DIR = REPO_DIR / "tablejsons" / "svg"
+DEFAULT_CACHE_DIR = REPO_DIR / ".rastercache"
+PNG_DIR_NAME = "png"
+
+
+# ----------------------------
+#  Backends
+# ----------------------------
+
+def _cairosvg_version() -> Optional[str]:
+    try:
+        import cairosvg
+    except (ImportError, OSError):  # OSError: cairosvg installed but libcairo missing
+        return None
+    return getattr(cairosvg, "__version__", "unknown")
+
+
+def _rsvg_version() -> Optional[str]:
+    exe = shutil.which("rsvg-convert")
+    if exe is None:
+        return None
+    try:
+        out = subprocess.run([exe, "--version"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or "unknown"
+
+
+def _rasterize_cairosvg(svg: bytes, scale: float) -> bytes:
+    import cairosvg
+    return cairosvg.svg2png(bytestring=svg, scale=scale)
+
+
+def _rasterize_rsvg(svg: bytes, scale: float) -> bytes:
+    out = subprocess.run(
+        ["rsvg-convert", "--format", "png", "--zoom", str(scale)],
+        input=svg,
+        capture_output=True,
+        check=True,
+    )
+    return out.stdout
+
+
+# name -> (version probe, rasterize function)
+BACKENDS: Dict[str, Tuple[Callable[[], Optional[str]], Callable[[bytes, float], bytes]]] = {
+    "cairosvg": (_cairosvg_version, _rasterize_cairosvg),
+    "rsvg": (_rsvg_version, _rasterize_rsvg),
+}
+
+
+def find_backend(name: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Return (backend name, version) for the requested backend, or the first
+    installed one. Raises RuntimeError if none is available.
+    """
+    names = [name] if name else list(BACKENDS)
+    for candidate in names:
+        if candidate not in BACKENDS:
+            raise ValueError(f"Unknown backend {candidate!r}; choose from {list(BACKENDS)}")
+        version = BACKENDS[candidate][0]()
+        if version is not None:
+            return candidate, version
+    raise RuntimeError(
+        "No SVG rasterizer available: pip install cairosvg, or install rsvg-convert (librsvg)."
+    )
+
+
+# ----------------------------
+#  Cached rasterization
+# ----------------------------
+
+def cache_key(svg: bytes, backend: str, version: str, scale: float) -> str:
+    h = hashlib.sha256()
+    h.update(f"{backend}\0{version}\0{scale!r}\0".encode("utf-8"))
+    h.update(svg)
+    return h.hexdigest()[:24]
+
+
+def png_path_for(svg_path: Path, out_dir: Optional[Path] = None) -> Path:
+    """tablejsons/svg/X.svg -> tablejsons/svg/png/X.png (or out_dir/X.png)."""
+    out_dir = out_dir if out_dir is not None else svg_path.parent / PNG_DIR_NAME
+    return out_dir / f"{svg_path.stem}.png"
+
+
+def rasterize_file(
+    job: Tuple[str, str, float, str, str, str],
+) -> Tuple[str, str, Optional[str]]:
+    """
+    Worker: rasterize one SVG file through the cache.
+    job = (svg_path, png_path, scale, backend, version, cache_dir).
+    Returns (svg_path, status, detail); status is "rendered", "cached",
+    "unchanged" or "error".
+    """
+    svg_path, png_path, scale, backend, version, cache_dir = job
+    try:
+        svg = Path(svg_path).read_bytes()
+        key = cache_key(svg, backend, version, scale)
+        cached = Path(cache_dir) / key[:2] / f"{key}.png"
+
+        if cached.exists():
+            png = cached.read_bytes()
+            status = "cached"
+        else:
+            png = BACKENDS[backend][1](svg, scale)
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(png)
+            tmp.replace(cached)  # atomic, so concurrent workers never see half a file
+            status = "rendered"
+
+        out = Path(png_path)
+        if out.exists() and out.read_bytes() == png:
+            return svg_path, "unchanged" if status == "cached" else status, None
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_bytes(png)
+        return svg_path, status, str(out)
+    except Exception as e:
+        return svg_path, "error", f"{type(e).__name__}: {e}"
+
+
+def rasterize_files(
+    svg_paths: List[Path],
+    scale: float = 1.0,
+    out_dir: Optional[Path] = None,
+    backend: Optional[str] = None,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+    jobs: int = 1,
+) -> List[Tuple[str, str, Optional[str]]]:
+    """Rasterize many SVGs (in a process pool if jobs > 1); results keep input order."""
+    backend, version = find_backend(backend)
+    work = [
+        (str(p), str(png_path_for(Path(p), out_dir)), scale, backend, version, str(cache_dir))
+        for p in svg_paths
+    ]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(rasterize_file, work, chunksize=4))
+    return [rasterize_file(job) for job in work]
+
+
+def print_results(results: List[Tuple[str, str, Optional[str]]]) -> int:
+    """Print written PNGs and errors plus a summary; return the error count."""
+    counts: Dict[str, int] = {}
+    for svg_path, status, detail in results:
+        counts[status] = counts.get(status, 0) + 1
+        if status == "error":
+            print(f"ERROR: {svg_path}: {detail}")
+        elif detail:
+            print(f"PNG saved to: {detail}")
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    print(f"{len(results)} SVGs: {summary}")
+    return counts.get("error", 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rasterize SVGs to PNG through a content-addressed cache."
+    )
+    parser.add_argument("svg_files", nargs="*", help="SVG files (default: tablejsons/svg/*.svg)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Pixel scale factor (default: 1)")
+    parser.add_argument("--out", help="Output directory (default: <svg dir>/png)")
+    parser.add_argument("--backend", choices=list(BACKENDS), help="Rasterizer (default: first installed)")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_DIR), help="Cache directory")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    args = parser.parse_args()
+
+    if args.svg_files:
+        paths = [Path(p) for p in args.svg_files]
+    else:
+        paths = sorted(DEFAULT_SVG_DIR.glob("*.svg"))
+    for path in paths:
+        if not path.exists():
+            raise FileNotFoundError(f"SVG file not found: {path}")
+
+    try:
+        results = rasterize_files(
+            paths,
+            scale=args.scale,
+            out_dir=Path(args.out) if args.out else None,
+            backend=args.backend,
+            cache_dir=Path(args.cache),
+            jobs=args.jobs,
+        )
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
+
+    if print_results(results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,544 @@
+#!/usr/bin/env python3
+"""
+Declarative render manifest for SVG4.py tables.
+
+tablejsons/manifest.json records the render options for each table, so a
+full rebuild is one command instead of a hand-typed SVG4.py call per table.
+Every spec is validated up front (keys, types, list lengths, format codes,
+source files and column names) before anything is rendered.
+
+Usage examples (from repo root):
+
+  # Check the manifest without rendering
+  python renderManifest.py --check
+
+  # Rebuild every table in the manifest (parallel)
+  python renderManifest.py
+
+  # Rebuild a few tables, then commit + push the svg folder
+  python renderManifest.py Table14_1a Table3_1 --push
+
+Manifest format (keys mirror the SVG4.py flags):
+
+  {
+    "version": 1,
+    "defaults": {"fontsize": 14, "size": [800, 500]},
+    "tables": {
+      "Table14_1b": {
+        "cols": ["ID", "Ticker", "Weight"],
+        "headers": ["ID", "Ticker", "Weight"],
+        "justify": ["L", "L", "R"],
+        "format": ["text", "text", "Perc2"],
+        "colwidths": [1, 1, 1],
+        "size": [1680, 640],
+        "bgoxford": true
+      }
+    }
+  }
+
+"source" (a JSON, CSV or TSV path relative to the manifest) defaults to
+<table>.json.
+Output goes to <source dir>/svg/<table>.svg and is overwritten in place (no
+_vN versions), so rebuilds are deterministic; unchanged files are not
+rewritten.
+
+"highlights" lists overlays rendered against the same layout as the table
+(row only = row, col only = column, both = cell; opacity defaults to 0.5):
+
+  "highlights": [{"row": 16, "color": "Robin"}, {"row": 8, "col": 4, "color": "Cinnabar"}]
+
+They are written with the SVG4.py names, e.g. <table>_row_16_Robin.svg.
+
+"query" renders a subset of the source, like SVG4.py's query flags (all keys
+optional; highlight rows count from the first row left):
+
+  "query": {"select": ["Ticker", "MC"], "where": ["MC > 1000"], "sort": "MC", "desc": true, "limit": 10}
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from SVG4 import (
+    VALID_FORMATS,
+    _compute_table_layout,
+    _highlight_rect,
+    _overlay_svg,
+    _render_table_svg,
+    _resolve_table_columns,
+    _table_data,
+    autopush_svgs,
+    color_from_name,
+    parse_condition,
+    query_table,
+)
+from tableColumns import DELIMITERS, ColumnTable, load_table
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_MANIFEST = REPO_DIR / "tablejsons" / "manifest.json"
+MANIFEST_VERSION = 1
+
+_LIST_KEYS = ("cols", "headers", "justify", "format", "colwidths")
+SPEC_KEYS = set(_LIST_KEYS) | {
+    "source", "fontsize", "size", "bgoxford", "precision", "minify", "groupcols", "highlights", "query",
+}
+HIGHLIGHT_KEYS = {"row", "col", "color", "opacity"}
+QUERY_KEYS = {"select", "where", "sort", "desc", "limit"}
+DEFAULT_OPACITY = 0.5
+SPEC_DEFAULTS: Dict[str, Any] = {
+    "fontsize": 14,
+    "size": [800, 500],
+    "bgoxford": False,
+    "precision": None,
+    "minify": False,
+    "groupcols": False,
+    "highlights": [],
+}
+
+
+# ----------------------------
+#  Loading + validation
+# ----------------------------
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _column_errors(name: str, spec: Dict[str, Any]) -> List[str]:
+    """Problems with a spec's per-column lists (cols, headers, justify, format, colwidths)."""
+    errors: List[str] = []
+    for key in _LIST_KEYS:
+        value = spec.get(key)
+        if value is not None and not isinstance(value, list):
+            errors.append(f"{name}: {key} must be a list")
+
+    cols = spec.get("cols")
+    if isinstance(cols, list):
+        if not cols or not all(isinstance(c, str) for c in cols):
+            errors.append(f"{name}: cols must be a non-empty list of strings")
+        for key in ("headers", "justify", "format", "colwidths"):
+            value = spec.get(key)
+            if isinstance(value, list) and len(value) != len(cols):
+                errors.append(f"{name}: {key} has {len(value)} entries for {len(cols)} cols")
+
+    justify = spec.get("justify")
+    if isinstance(justify, list):
+        bad = [j for j in justify if str(j).upper() not in ("L", "C", "R")]
+        if bad:
+            errors.append(f"{name}: justify codes must be L, C or R (got {bad})")
+
+    formats = spec.get("format")
+    if isinstance(formats, list):
+        bad = [f for f in formats if str(f).replace(" ", "").lower() not in VALID_FORMATS]
+        if bad:
+            errors.append(f"{name}: unknown format codes {bad}")
+
+    colwidths = spec.get("colwidths")
+    if isinstance(colwidths, list) and not all(_is_number(w) and w > 0 for w in colwidths):
+        errors.append(f"{name}: colwidths must be positive numbers")
+
+    return errors
+
+
+def _spec_errors(name: str, spec: Dict[str, Any]) -> List[str]:
+    """Problems with one (defaults-merged) spec, without reading its data."""
+    errors: List[str] = []
+    unknown = sorted(set(spec) - SPEC_KEYS)
+    if unknown:
+        errors.append(f"{name}: unknown keys {unknown}")
+    errors.extend(_column_errors(name, spec))
+
+    size = spec.get("size")
+    if not (isinstance(size, list) and len(size) == 2 and all(_is_number(v) and v > 0 for v in size)):
+        errors.append(f"{name}: size must be [WIDTH, HEIGHT]")
+
+    if not (_is_number(spec.get("fontsize")) and spec["fontsize"] > 0):
+        errors.append(f"{name}: fontsize must be a positive number")
+
+    precision = spec.get("precision")
+    if precision is not None and not (isinstance(precision, int) and precision >= 0):
+        errors.append(f"{name}: precision must be a non-negative integer")
+
+    for key in ("bgoxford", "minify", "groupcols"):
+        if not isinstance(spec.get(key), bool):
+            errors.append(f"{name}: {key} must be true or false")
+
+    errors.extend(_query_errors(name, spec.get("query")))
+
+    highlights = spec.get("highlights")
+    if not isinstance(highlights, list):
+        errors.append(f"{name}: highlights must be a list")
+        return errors
+    for i, hl in enumerate(highlights):
+        label = f"{name}: highlights[{i}]"
+        if not isinstance(hl, dict):
+            errors.append(f"{label} must be an object")
+            continue
+        unknown = sorted(set(hl) - HIGHLIGHT_KEYS)
+        if unknown:
+            errors.append(f"{label}: unknown keys {unknown}")
+        if "row" not in hl and "col" not in hl:
+            errors.append(f"{label}: needs a row, a col, or both")
+        for key in ("row", "col"):
+            if key in hl and not (isinstance(hl[key], int) and not isinstance(hl[key], bool) and hl[key] >= 0):
+                errors.append(f"{label}: {key} must be a non-negative integer")
+        try:
+            color_from_name(str(hl.get("color", "")))
+        except ValueError as e:
+            errors.append(f"{label}: {e}")
+        opacity = hl.get("opacity", DEFAULT_OPACITY)
+        if not (_is_number(opacity) and 0 <= opacity <= 1):
+            errors.append(f"{label}: opacity must be between 0 and 1")
+
+    return errors
+
+
+def _query_errors(name: str, query) -> List[str]:
+    """Problems with a spec's "query" (shape and condition syntax; columns are checked with the data)."""
+    if query is None:
+        return []
+    if not isinstance(query, dict):
+        return [f"{name}: query must be an object"]
+    errors: List[str] = []
+    unknown = sorted(set(query) - QUERY_KEYS)
+    if unknown:
+        errors.append(f"{name}: query has unknown keys {unknown}")
+    for key in ("select", "where"):
+        value = query.get(key)
+        if value is not None and not (isinstance(value, list) and value and all(isinstance(v, str) for v in value)):
+            errors.append(f"{name}: query.{key} must be a non-empty list of strings")
+    for condition in query.get("where") or []:
+        try:
+            parse_condition(str(condition))
+        except ValueError as e:
+            errors.append(f"{name}: query.where: {e}")
+    if query.get("sort") is not None and not isinstance(query["sort"], str):
+        errors.append(f"{name}: query.sort must be a column name")
+    if not isinstance(query.get("desc", False), bool):
+        errors.append(f"{name}: query.desc must be true or false")
+    limit = query.get("limit")
+    if limit is not None and not (isinstance(limit, int) and not isinstance(limit, bool) and limit > 0):
+        errors.append(f"{name}: query.limit must be a positive integer")
+    return errors
+
+
+def _source_errors(name: str, spec: Dict[str, Any]) -> List[str]:
+    """Problems with a spec's data file: missing, not a table, or missing columns."""
+    source = Path(spec["source"])
+    if not source.exists():
+        return [f"{name}: source not found: {source}"]
+    try:
+        data = load_table(source)
+    except ValueError as e:
+        kind = "CSV / TSV" if source.suffix.lower() in DELIMITERS else "JSON"
+        return [f"{name}: {source.name} is not valid {kind} ({e})"]
+    rows = isinstance(data, list) and data and all(isinstance(r, dict) for r in data)
+    if not (rows or isinstance(data, ColumnTable)):
+        return [f"{name}: {source.name} is not a non-empty list of row objects"]
+    try:
+        data = spec_rows(spec, data)
+    except ValueError as e:
+        return [f"{name}: query on {source.name}: {e}"]
+    cols = spec.get("cols")
+    if cols:
+        missing = [c for c in cols if c not in data[0]]
+        if missing:
+            return [f"{name}: columns not in {source.name}: {missing}"]
+    num_cols = len(cols) if cols else len(data[0])
+    errors: List[str] = []
+    for i, hl in enumerate(spec.get("highlights", [])):
+        if hl.get("row", 0) >= len(data):
+            errors.append(f"{name}: highlights[{i}]: row {hl['row']} out of range ({len(data)} rows)")
+        if hl.get("col", 0) >= num_cols:
+            errors.append(f"{name}: highlights[{i}]: col {hl['col']} out of range ({num_cols} cols)")
+    return errors
+
+
+def load_manifest(path: Path = DEFAULT_MANIFEST, check_sources: bool = True) -> Dict[str, Dict[str, Any]]:
+    """
+    Load and validate a manifest. Returns {table: spec} with defaults merged
+    in and "source" resolved to an absolute path. Raises ValueError listing
+    every problem found, so nothing is rendered from a half-valid manifest.
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{path}: expected an object with \"version\": {MANIFEST_VERSION}")
+    defaults = manifest.get("defaults", {})
+    tables = manifest.get("tables", {})
+    if not isinstance(defaults, dict) or not isinstance(tables, dict):
+        raise ValueError(f"{path}: \"defaults\" and \"tables\" must be objects")
+
+    specs: Dict[str, Dict[str, Any]] = {}
+    errors: List[str] = []
+    for name in sorted(tables):
+        entry = tables[name]
+        if not isinstance(entry, dict):
+            errors.append(f"{name}: spec must be an object")
+            continue
+        spec = dict(SPEC_DEFAULTS)
+        spec.update(defaults)
+        spec.update(entry)
+        spec["source"] = str((path.parent / spec.get("source", f"{name}.json")).resolve())
+        spec_errors = _spec_errors(name, spec)
+        if not spec_errors and check_sources:
+            spec_errors = _source_errors(name, spec)
+        errors.extend(spec_errors)
+        specs[name] = spec
+
+    if errors:
+        raise ValueError(f"Invalid manifest {path}:\n  " + "\n  ".join(errors))
+    return specs
+
+
+def spec_to_kwargs(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """generate_svg_table keyword arguments for a validated spec."""
+    precision = spec.get("precision")
+    if spec.get("minify") and precision is None:
+        precision = 2
+    return {
+        "cols": spec.get("cols"),
+        "headers": spec.get("headers"),
+        "formats": spec.get("format"),
+        "justifications": spec.get("justify"),
+        "col_widths": spec.get("colwidths"),
+        "font_size_pt": spec["fontsize"],
+        "svg_size": tuple(spec["size"]),
+        "background_color": color_from_name("oxford") if spec.get("bgoxford") else None,
+        "precision": precision,
+        "minify": spec.get("minify", False),
+        "group_columns": spec.get("groupcols", False),
+    }
+
+
+# ----------------------------
+#  Rendering
+# ----------------------------
+
+def spec_rows(spec: Dict[str, Any], data: List[Dict]) -> List[Dict]:
+    """The rows a spec renders: its "query" applied to the source data (if any)."""
+    query = spec.get("query")
+    if not query:
+        return data
+    return query_table(
+        data,
+        select=query.get("select"),
+        where=query.get("where"),
+        sort_by=query.get("sort"),
+        descending=query.get("desc", False),
+        limit=query.get("limit"),
+    )
+
+
+def output_path(name: str, spec: Dict[str, Any]) -> Path:
+    return Path(spec["source"]).parent / "svg" / f"{name}.svg"
+
+
+def highlight_name(name: str, hl: Dict[str, Any]) -> str:
+    """Overlay file name, as SVG4.py writes it: Table3_1_cell_8_4_Cinnabar.svg."""
+    color = hl.get("color", "")
+    if "row" in hl and "col" in hl:
+        return f"{name}_cell_{hl['row']}_{hl['col']}_{color}.svg"
+    if "row" in hl:
+        return f"{name}_row_{hl['row']}_{color}.svg"
+    return f"{name}_col_{hl['col']}_{color}.svg"
+
+
+def layout_key(spec: Dict[str, Any]) -> Tuple:
+    """The spec fields the table layout depends on (for callers caching layouts by source data)."""
+    return tuple(
+        json.dumps(spec.get(k), sort_keys=True)
+        for k in ("cols", "headers", "format", "colwidths", "fontsize", "size", "query")
+    )
+
+
+def table_layout(spec: Dict[str, Any], data: List[Dict]) -> Tuple[List[str], List[str], List[str], List[str], Dict]:
+    """Resolve columns and fit the layout once; returns (col_keys, headers, formats, just, layout)."""
+    kwargs = spec_to_kwargs(spec)
+    col_keys, header_labels, fmt_list, just = _resolve_table_columns(
+        data, kwargs["cols"], kwargs["headers"], kwargs["formats"], kwargs["justifications"]
+    )
+    layout = _compute_table_layout(
+        data=data,
+        col_keys=col_keys,
+        headers=header_labels,
+        formats=fmt_list,
+        svg_size=kwargs["svg_size"],
+        font_size_pt=kwargs["font_size_pt"],
+        col_widths=kwargs["col_widths"],
+    )
+    return col_keys, header_labels, fmt_list, just, layout
+
+
+def render_outputs(
+    name: str,
+    spec: Dict[str, Any],
+    data: List[Dict],
+    resolved: Optional[Tuple] = None,
+) -> List[Tuple[Path, str]]:
+    """
+    [(path, svg)] for the table and each of its highlights, all drawn on one
+    layout. Output matches generate_svg_table / generate_highlight_overlay
+    byte for byte. resolved is a table_layout() result to reuse, if any.
+    """
+    data = _table_data(data)
+    kwargs = spec_to_kwargs(spec)
+    col_keys, header_labels, fmt_list, just, layout = resolved or table_layout(spec, data)
+
+    out = output_path(name, spec)
+    outputs = [(out, _render_table_svg(
+        data,
+        col_keys,
+        header_labels,
+        fmt_list,
+        just,
+        layout,
+        background_color=kwargs["background_color"],
+        precision=kwargs["precision"],
+        minify=kwargs["minify"],
+        group_columns=kwargs["group_columns"],
+    ))]
+    for hl in spec.get("highlights", []):
+        kind = "cell" if "row" in hl and "col" in hl else "row" if "row" in hl else "column"
+        rect = _highlight_rect(kind, layout, len(data), hl.get("row"), hl.get("col"))
+        svg = _overlay_svg(
+            layout,
+            rect,
+            color_from_name(hl.get("color", "")),
+            hl.get("opacity", DEFAULT_OPACITY),
+            kwargs["precision"],
+        )
+        outputs.append((out.parent / highlight_name(name, hl), svg))
+    return outputs
+
+
+def write_outputs(outputs: List[Tuple[Path, str]]) -> List[Path]:
+    """Write each (path, svg) whose content changed; returns the paths written."""
+    written: List[Path] = []
+    for path, svg in outputs:
+        if path.exists() and path.read_text(encoding="utf-8") == svg:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(svg, encoding="utf-8")
+        written.append(path)
+    return written
+
+
+def render_spec(job: Tuple[str, Dict[str, Any]]) -> Tuple[str, str, Optional[str]]:
+    """
+    Worker: render one table (plus its highlights) and write what changed.
+    Returns (name, status, detail) with status "written", "unchanged" or "error".
+    """
+    name, spec = job
+    try:
+        data = spec_rows(spec, _table_data(load_table(spec["source"])))
+        written = write_outputs(render_outputs(name, spec, data))
+    except Exception as e:
+        return name, "error", f"{type(e).__name__}: {e}"
+
+    if not written:
+        return name, "unchanged", None
+    return name, "written", ", ".join(str(p) for p in written)
+
+
+def rebuild(
+    specs: Dict[str, Dict[str, Any]],
+    jobs: int = 1,
+) -> List[Tuple[str, str, Optional[str]]]:
+    """Render every spec (in name order, results in the same order)."""
+    work = [(name, specs[name]) for name in sorted(specs)]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(render_spec, work, chunksize=4))
+    return [render_spec(job) for job in work]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render every table listed in the render manifest."
+    )
+    parser.add_argument("tables", nargs="*", help="Table names to render (default: all in the manifest)")
+    parser.add_argument(
+        "--manifest",
+        default=str(DEFAULT_MANIFEST),
+        help=f"Manifest path (default: {DEFAULT_MANIFEST.relative_to(REPO_DIR)})",
+    )
+    parser.add_argument("--check", action="store_true", help="Validate the manifest and exit")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--png",
+        nargs="?",
+        type=float,
+        const=1.0,
+        metavar="SCALE",
+        help="Also write PNGs to <svg dir>/png via rasterSVG.py (cached; optional scale, default 1)",
+    )
+    parser.add_argument(
+        "--push",
+        action="store_true",
+        help="Commit + push the svg folder(s) after rendering",
+    )
+    args = parser.parse_args()
+
+    specs = load_manifest(Path(args.manifest))
+    if args.tables:
+        unknown = [t for t in args.tables if t not in specs]
+        if unknown:
+            raise ValueError(f"Tables not in manifest: {unknown}")
+        specs = {t: specs[t] for t in args.tables}
+
+    if args.check:
+        print(f"Manifest OK: {len(specs)} tables.")
+        return
+
+    results = rebuild(specs, jobs=args.jobs)
+    counts = {"written": 0, "unchanged": 0, "error": 0}
+    for name, status, detail in results:
+        counts[status] += 1
+        if status == "written":
+            for path in detail.split(", "):
+                print(f"Table SVG saved to: {path}")
+        elif status == "error":
+            print(f"ERROR: {name}: {detail}")
+    print(f"{len(results)} tables: {counts['written']} written, "
+          f"{counts['unchanged']} unchanged, {counts['error']} failed")
+
+    changed_dirs = {output_path(n, specs[n]).parent for n, s, _ in results if s == "written"}
+
+    if args.png:
+        from rasterSVG import print_results, rasterize_files
+
+        svg_paths = [
+            output_path(n, specs[n]).parent / f
+            for n, s, _ in results if s != "error"
+            for f in [f"{n}.svg"] + [highlight_name(n, hl) for hl in specs[n]["highlights"]]
+        ]
+        try:
+            png_results = rasterize_files(svg_paths, scale=args.png, jobs=args.jobs)
+        except RuntimeError as e:
+            print(f"PNG export skipped: {e}")
+        else:
+            counts["error"] += print_results(png_results)
+            changed_dirs |= {Path(p).parent for p, s, d in png_results if d and s != "error"}
+
+    if args.push and changed_dirs:
+        for out_dir in sorted(changed_dirs):
+            autopush_svgs(out_dir)
+
+    if counts["error"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
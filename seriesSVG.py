@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Render a family of snapshot tables (the same table at several dates) on one
+shared layout, so font size, column widths and row height do not jump from
+slide to slide.
+
+Usage examples (from repo root):
+
+  # Three snapshots, same geometry
+  python seriesSVG.py tablejsons/Dec2018.json tablejsons/Jan2019.json tablejsons/Mar2020.json
+
+  # Every monthly calendar, with the usual SVG4.py layout options
+  python seriesSVG.py tablejsons/{Jan,Feb,Mar,Apr,May,Jun,Jul,Aug,Sep,Oct,Nov,Dec}.json --fontsize 16 --minify
+
+  # Fewer worker processes, then commit + push the svg folder
+  python seriesSVG.py tablejsons/Sep30_Index_a.json tablejsons/Sep30_Index_b.json --jobs 2 --push
+
+Columns come from --cols or the first member's first row; a member missing
+a column leaves those cells blank. Every member is measured once (in
+parallel) and the per-column maxima and the largest row count are fitted to
+--size as one layout, which every member is then rendered against (in
+parallel). Shorter members keep the shared row height and leave the rest of
+the SVG empty.
+
+Members can be JSON arrays or CSV / TSV files. Output goes to each member's
+svg/ folder as <member>.svg, overwritten in place and only written when it
+changes.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from SVG4 import (
+    _fit_table_layout,
+    _measure_columns,
+    _render_table_svg,
+    _resolve_table_columns,
+    _table_data,
+    autopush_svgs,
+    color_from_name,
+)
+from tableColumns import load_table
+
+
+# ----------------------------
+#  Shared layout
+# ----------------------------
+
+def measure_member(job: Tuple[str, List[str], List[str], List[str]]) -> Tuple[int, List[int]]:
+    """Worker: (row count, longest formatted string per column) of one member."""
+    path, col_keys, header_labels, fmt_list = job
+    data = _table_data(load_table(path))
+    return len(data), _measure_columns(data, col_keys, header_labels, fmt_list)
+
+
+def series_layout(
+    paths: List[Path],
+    col_keys: List[str],
+    header_labels: List[str],
+    fmt_list: List[str],
+    font_size_pt: int = 14,
+    svg_size: Tuple[int, int] = (800, 500),
+    col_widths: Optional[List[float]] = None,
+    jobs: int = 1,
+) -> Tuple[Dict, List[int]]:
+    """
+    One layout for every member: column maxima and row count taken over the
+    whole family, fitted once. Returns (layout, row count per member).
+    """
+    work = [(str(p), col_keys, header_labels, fmt_list) for p in paths]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            stats = list(pool.map(measure_member, work))
+    else:
+        stats = [measure_member(job) for job in work]
+
+    row_counts = [num_rows for num_rows, _ in stats]
+    max_chars_per_col = [max(col) for col in zip(*(chars for _, chars in stats))]
+    layout = _fit_table_layout(
+        max_chars_per_col,
+        num_rows=max(row_counts),
+        svg_size=svg_size,
+        font_size_pt=font_size_pt,
+        col_widths=col_widths,
+    )
+    return layout, row_counts
+
+
+# ----------------------------
+#  Rendering
+# ----------------------------
+
+def output_path(member: Path) -> Path:
+    return member.parent / "svg" / f"{member.stem}.svg"
+
+
+def render_member(job: Tuple[str, Dict[str, Any]]) -> Tuple[str, str, Optional[str]]:
+    """
+    Worker: render one member against the shared layout and write it if it
+    changed. Returns (member, status, detail) with status "written",
+    "unchanged" or "error".
+    """
+    path, kwargs = job
+    try:
+        data = _table_data(load_table(path))
+        svg = _render_table_svg(data, **kwargs)
+        out = output_path(Path(path))
+        if out.exists() and out.read_text(encoding="utf-8") == svg:
+            return path, "unchanged", None
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(svg, encoding="utf-8")
+    except Exception as e:
+        return path, "error", f"{type(e).__name__}: {e}"
+    return path, "written", str(out)
+
+
+def render_series(
+    paths: List[Path],
+    cols: Optional[List[str]] = None,
+    headers: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    justifications: Optional[List[str]] = None,
+    font_size_pt: int = 14,
+    svg_size: Tuple[int, int] = (800, 500),
+    col_widths: Optional[List[float]] = None,
+    background_color: Optional[str] = None,
+    precision: Optional[int] = None,
+    minify: bool = False,
+    group_columns: bool = False,
+    jobs: int = 1,
+) -> Tuple[Dict, List[Tuple[str, str, Optional[str]]]]:
+    """Fit the shared layout, then render every member; returns (layout, results in input order)."""
+    first = _table_data(load_table(paths[0]))
+    col_keys, header_labels, fmt_list, just = _resolve_table_columns(
+        first, cols, headers, formats, justifications
+    )
+    layout, _ = series_layout(
+        paths, col_keys, header_labels, fmt_list, font_size_pt, svg_size, col_widths, jobs
+    )
+
+    shared = {
+        "col_keys": col_keys,
+        "header_labels": header_labels,
+        "fmt_list": fmt_list,
+        "just": just,
+        "layout": layout,
+        "background_color": background_color,
+        "precision": precision,
+        "minify": minify,
+        "group_columns": group_columns,
+    }
+    work = [(str(p), shared) for p in paths]
+    if jobs > 1 and len(work) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            return layout, list(pool.map(render_member, work))
+    return layout, [render_member(job) for job in work]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Render snapshot tables of one family on a shared layout."
+    )
+    parser.add_argument("members", nargs="+", help="JSON (or CSV / TSV) files of the family, e.g. tablejsons/Jan2019.json")
+    parser.add_argument("--cols", nargs="*", help="Column keys to include (default: all keys of the first member's first row)")
+    parser.add_argument("--headers", nargs="*", help="Custom header labels (must match number of cols)")
+    parser.add_argument("--justify", nargs="*", help="Per-column alignment codes: L, C, R")
+    parser.add_argument("--format", nargs="*", metavar="FMT", help="Per-column format (see SVG4.py)")
+    parser.add_argument("--colwidths", nargs="*", type=float, help="Relative column widths (will be scaled)")
+    parser.add_argument("--fontsize", type=int, default=14, help="Font size in pt (default: 14)")
+    parser.add_argument(
+        "--size",
+        nargs=2,
+        type=int,
+        metavar=("WIDTH", "HEIGHT"),
+        default=[800, 500],
+        help="SVG size, e.g. --size 1400 820",
+    )
+    parser.add_argument("--precision", type=int, help="Round geometry to this many decimals")
+    parser.add_argument("--minify", action="store_true", help="Compact output (see SVG4.py --minify)")
+    parser.add_argument("--groupcols", action="store_true", help="Group each column's cells (see SVG4.py --groupcols)")
+    parser.add_argument("--bgoxford", action="store_true", help="Draw an Oxford Blue background")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument("--push", action="store_true", help="Commit + push the svg folder(s) after rendering")
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.members]
+    missing = [str(p) for p in paths if not p.exists()]
+    if missing:
+        raise FileNotFoundError(f"Member files not found: {missing}")
+
+    try:
+        layout, results = render_series(
+            paths,
+            cols=args.cols,
+            headers=args.headers,
+            formats=args.format,
+            justifications=args.justify,
+            font_size_pt=args.fontsize,
+            svg_size=tuple(args.size),
+            col_widths=args.colwidths,
+            background_color=color_from_name("oxford") if args.bgoxford else None,
+            precision=args.precision,
+            minify=args.minify,
+            group_columns=args.groupcols,
+            jobs=args.jobs,
+        )
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    counts = {"written": 0, "unchanged": 0, "error": 0}
+    for member, status, detail in results:
+        counts[status] += 1
+        if status == "written":
+            print(f"Table SVG saved to: {detail}")
+        elif status == "error":
+            print(f"ERROR: {member}: {detail}")
+    print(
+        f"Shared layout: font {layout['font_size_px']:.2f}px, row height {layout['row_height']:.2f}px, "
+        f"{layout['num_rows']} rows max"
+    )
+    print(f"{len(results)} tables: {counts['written']} written, "
+          f"{counts['unchanged']} unchanged, {counts['error']} failed")
+
+    if args.push:
+        for out_dir in sorted({output_path(Path(m)).parent for m, s, _ in results if s == "written"}):
+            autopush_svgs(out_dir)
+
+    if counts["error"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
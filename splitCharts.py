@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Split chapter chart files (chartjsons/Ch18.json, ...) into one JSON file per
+figure, plus a small index manifest that pages can fetch first.
+
+Usage examples (from repo root):
+
+  # Split every chapter file in chartjsons/
+  python splitCharts.py
+
+  # Split just chapter 18
+  python splitCharts.py chartjsons/Ch18.json
+
+Output layout:
+
+  chartjsons/figures/index.json          <- manifest for all chapters
+  chartjsons/figures/Ch18/Fig18_1a.json  <- compact JSON, one figure each
+
+Each manifest entry records the figure's file, byte size, point count, number
+of series, x/y ranges and a content hash, so a page can lazy-load a figure and
+cache it by hash. Runs are incremental: a figure file is only rewritten when
+its data (and therefore its hash) changed. Figure names become file names,
+so a name that is not a plain file name (contains "/", "\\" or "..") is
+skipped with a warning. A run over the default glob also drops the files
+and index entries of chapters whose source file is gone.
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_CHART_DIR = REPO_DIR / "chartjsons"
+DEFAULT_OUT_DIR = DEFAULT_CHART_DIR / "figures"
+INDEX_NAME = "index.json"
+INDEX_VERSION = 1
+
+
+# ----------------------------
+#  Figure statistics
+# ----------------------------
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _value_range(values: List[Any]) -> Optional[list]:
+    """
+    [min, max] if every value is numeric, else [first, last]
+    (dates and labels keep their source order). None if empty.
+    """
+    values = [v for v in values if v is not None and v != ""]
+    if not values:
+        return None
+    if all(_is_number(v) for v in values):
+        return [min(values), max(values)]
+    return [values[0], values[-1]]
+
+
+def figure_keys(figure) -> Tuple[Optional[str], List[str]]:
+    """
+    Return (x key, [series keys]) for the figure shapes used in chartjsons/:
+
+    - [{"x": ..., "y": ...}, ...]           one series of points
+    - [{"Time": ..., "A": ..., "B": ...}]   first key is x, the rest are series
+    - {"Labels": [...], "Series": [...]}    column-oriented, Labels (or else
+                                            the first key) is x
+    """
+    if isinstance(figure, dict):
+        x_key = "Labels" if "Labels" in figure else next(iter(figure), None)
+        return x_key, [
+            key for key, values in figure.items()
+            if key != x_key and isinstance(values, list)
+        ]
+
+    rows = [row for row in figure if isinstance(row, dict)]
+    if not rows:
+        return None, []
+    keys = list(rows[0].keys())
+    x_key = "x" if "x" in keys else keys[0]
+    if "y" in keys:
+        return x_key, ["y"]
+    return x_key, [k for k in keys if k != x_key and _is_number(rows[0].get(k))]
+
+
+def figure_series(figure) -> Tuple[List[Any], List[List[Any]]]:
+    """Return (x_values, [y_values per series]), keyed as figure_keys says."""
+    x_key, y_keys = figure_keys(figure)
+    if isinstance(figure, dict):
+        x_values = list(figure.get(x_key) or []) if x_key is not None else []
+        return x_values, [list(figure[key]) for key in y_keys]
+
+    rows = [row for row in figure if isinstance(row, dict)]
+    x_values = [row.get(x_key) for row in rows]
+    series = [[row.get(k) for row in rows] for k in y_keys]
+    return x_values, series
+
+
+def figure_stats(figure) -> Dict[str, Any]:
+    x_values, series = figure_series(figure)
+    y_values = [v for values in series for v in values if _is_number(v)]
+    return {
+        "points": max([len(x_values)] + [len(values) for values in series]),
+        "series": len(series),
+        "x_range": _value_range(x_values),
+        "y_range": _value_range(y_values),
+    }
+
+
+def safe_figure_name(name: str) -> bool:
+    """True if name can be used as-is for a file in its chapter folder."""
+    return bool(name) and "/" not in name and "\\" not in name and ".." not in name
+
+
+def serialize_figure(figure) -> bytes:
+    """Compact, deterministic JSON for a single figure."""
+    return json.dumps(figure, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def content_hash(payload: bytes) -> str:
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+# ----------------------------
+#  Manifest handling
+# ----------------------------
+
+def load_index(out_dir: Path) -> Dict[str, Any]:
+    index_path = out_dir / INDEX_NAME
+    if index_path.exists():
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                return index
+        except (OSError, ValueError):
+            print(f"Warning: unreadable index {index_path}, rebuilding.")
+    return {"version": INDEX_VERSION, "chapters": {}}
+
+
+def write_index(out_dir: Path, index: Dict[str, Any]) -> bool:
+    """Write the manifest only if its content changed. Return True if written."""
+    index_path = out_dir / INDEX_NAME
+    text = json.dumps(index, indent=1, sort_keys=True, ensure_ascii=False) + "\n"
+    if index_path.exists() and index_path.read_text(encoding="utf-8") == text:
+        return False
+    index_path.write_text(text, encoding="utf-8")
+    return True
+
+
+# ----------------------------
+#  Splitting
+# ----------------------------
+
+def split_chapter(
+    source: Path,
+    out_dir: Path,
+    index: Dict[str, Any],
+) -> Dict[str, int]:
+    """
+    Split one chapter file into per-figure files under out_dir/<chapter>/ and
+    update its entry in index (in place). Returns counts of written, unchanged
+    and removed figure files.
+    """
+    counts = {"written": 0, "unchanged": 0, "removed": 0}
+    chapter = source.stem
+
+    try:
+        with open(source, "r", encoding="utf-8") as f:
+            figures = json.load(f)
+    except ValueError as e:
+        print(f"Warning: {source} is not valid JSON ({e}), skipping.")
+        return counts
+
+    if not isinstance(figures, dict):
+        print(f"Warning: {source} is not an object of figures, skipping.")
+        return counts
+
+    old_entries = index["chapters"].get(chapter, {}).get("figures", {})
+    chapter_dir = out_dir / chapter
+    new_entries: Dict[str, Any] = {}
+
+    for name, figure in figures.items():
+        if not isinstance(figure, (list, dict)):
+            print(f"Warning: {chapter}/{name} is not chart data, skipping.")
+            continue
+        if not safe_figure_name(name):
+            print(f"Warning: {chapter}: figure name {name!r} is not a plain file name, skipping.")
+            continue
+
+        payload = serialize_figure(figure)
+        digest = content_hash(payload)
+        rel_file = f"{chapter}/{name}.json"
+        fig_path = out_dir / rel_file
+
+        old = old_entries.get(name)
+        if (
+            old is not None
+            and old.get("hash") == digest
+            and fig_path.exists()
+            and fig_path.stat().st_size == len(payload)
+        ):
+            counts["unchanged"] += 1
+        else:
+            chapter_dir.mkdir(parents=True, exist_ok=True)
+            fig_path.write_bytes(payload)
+            counts["written"] += 1
+
+        entry = {"file": rel_file, "bytes": len(payload), "hash": digest}
+        entry.update(figure_stats(figure))
+        new_entries[name] = entry
+
+    # Drop files for figures that no longer exist in the chapter
+    for name, old in old_entries.items():
+        if name not in new_entries:
+            stale = out_dir / old.get("file", f"{chapter}/{name}.json")
+            if stale.exists():
+                stale.unlink()
+            counts["removed"] += 1
+
+    index["chapters"][chapter] = {"source": source.name, "figures": new_entries}
+    return counts
+
+
+def remove_chapter(out_dir: Path, index: Dict[str, Any], chapter: str) -> int:
+    """Drop a chapter's figure files and index entry (in place). Returns the files removed."""
+    entry = index["chapters"].pop(chapter, {})
+    removed = 0
+    for name, fig in entry.get("figures", {}).items():
+        stale = out_dir / fig.get("file", f"{chapter}/{name}.json")
+        if stale.exists():
+            stale.unlink()
+            removed += 1
+    chapter_dir = out_dir / chapter
+    if chapter_dir.is_dir() and not any(chapter_dir.iterdir()):
+        chapter_dir.rmdir()
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Split chapter chart JSON files into per-figure files plus an index manifest."
+    )
+    parser.add_argument(
+        "sources",
+        nargs="*",
+        help="Chapter JSON files (default: chartjsons/Ch*.json)",
+    )
+    parser.add_argument(
+        "--out",
+        default=str(DEFAULT_OUT_DIR),
+        help=f"Output directory (default: {DEFAULT_OUT_DIR.relative_to(REPO_DIR)})",
+    )
+    args = parser.parse_args()
+
+    if args.sources:
+        sources = [Path(s) for s in args.sources]
+    else:
+        sources = sorted(DEFAULT_CHART_DIR.glob("Ch*.json"))
+
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index = load_index(out_dir)
+
+    totals = {"written": 0, "unchanged": 0, "removed": 0}
+    for source in sources:
+        if not source.exists():
+            raise FileNotFoundError(f"Chart file not found: {source}")
+        counts = split_chapter(source, out_dir, index)
+        for key, n in counts.items():
+            totals[key] += n
+        if any(counts.values()):
+            print(
+                f"{source.name}: {counts['written']} written, "
+                f"{counts['unchanged']} unchanged, {counts['removed']} removed"
+            )
+
+    if not args.sources:
+        # Chapters whose source file was deleted or renamed
+        for chapter in sorted(set(index["chapters"]) - {s.stem for s in sources}):
+            removed = remove_chapter(out_dir, index, chapter)
+            totals["removed"] += removed
+            print(f"{chapter}: source gone, {removed} removed")
+
+    if write_index(out_dir, index):
+        print(f"Index written to: {out_dir / INDEX_NAME}")
+    else:
+        print("Index unchanged.")
+    print(
+        f"Total: {totals['written']} written, {totals['unchanged']} unchanged, "
+        f"{totals['removed']} removed"
+    )
+
+
+if __name__ == "__main__":
+    main()
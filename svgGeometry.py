@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Geometry post-processing for generated SVG: polyline simplification at a pixel
+tolerance, fixed-precision coordinate output and compact relative path data.
+
+  from svgGeometry import simplify, path_data
+
+  pts = simplify(points, tolerance=0.5, method="rdp")
+  d = path_data([pts], precision=1)      # "M12.5 300l3.1-2.4 3.1 .8..."
+
+All coordinates are in output pixels, so a tolerance of 0.5 (half a pixel)
+and a precision of 1 decimal are visually lossless at 1x.
+"""
+
+import heapq
+from typing import List, Literal, Optional, Sequence, Tuple
+
+Point = Tuple[float, float]
+
+
+# ----------------------------
+#  Number output
+# ----------------------------
+
+def fmt_num(value: float, precision: Optional[int] = 2) -> str:
+    """
+    Format a coordinate with at most `precision` decimals, dropping trailing
+    zeros: 47.98799999999999 -> "47.99", 165.0 -> "165", -0.0 -> "0".
+    precision=None returns str(value) unchanged (the historical output).
+    """
+    if precision is None:
+        return str(value)
+    s = f"{value:.{precision}f}"
+    if "." in s:
+        s = s.rstrip("0").rstrip(".")
+    if s in ("-0", ""):
+        s = "0"
+    return s
+
+
+def _compact_num(s: str) -> str:
+    """Drop the leading zero of a fraction for path data: 0.5 -> .5, -0.5 -> -.5"""
+    if s.startswith("0."):
+        return s[1:]
+    if s.startswith("-0."):
+        return "-" + s[2:]
+    return s
+
+
+# ----------------------------
+#  Simplification
+# ----------------------------
+
+def _segment_distance_sq(p: Point, a: Point, b: Point) -> float:
+    """Squared distance from p to segment a-b."""
+    ax, ay = a
+    dx = b[0] - ax
+    dy = b[1] - ay
+    if dx == 0 and dy == 0:
+        return (p[0] - ax) ** 2 + (p[1] - ay) ** 2
+    t = ((p[0] - ax) * dx + (p[1] - ay) * dy) / (dx * dx + dy * dy)
+    t = max(0.0, min(1.0, t))
+    cx = ax + t * dx
+    cy = ay + t * dy
+    return (p[0] - cx) ** 2 + (p[1] - cy) ** 2
+
+
+def rdp(points: Sequence[Point], tolerance: float) -> List[Point]:
+    """
+    Ramer-Douglas-Peucker simplification: drop points that lie within
+    `tolerance` px of the simplified line. Iterative, so long series do not
+    hit the recursion limit.
+    """
+    n = len(points)
+    if n <= 2 or tolerance <= 0:
+        return list(points)
+
+    tol_sq = tolerance * tolerance
+    keep = [False] * n
+    keep[0] = keep[n - 1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        max_d = -1.0
+        index = -1
+        a, b = points[first], points[last]
+        for i in range(first + 1, last):
+            d = _segment_distance_sq(points[i], a, b)
+            if d > max_d:
+                max_d = d
+                index = i
+        if index != -1 and max_d > tol_sq:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _triangle_area(a: Point, b: Point, c: Point) -> float:
+    return abs((b[0] - a[0]) * (c[1] - a[1]) - (c[0] - a[0]) * (b[1] - a[1])) / 2.0
+
+
+def visvalingam(points: Sequence[Point], tolerance: float) -> List[Point]:
+    """
+    Visvalingam-Whyatt simplification: repeatedly drop the point whose
+    triangle with its neighbours has the smallest area, until every remaining
+    triangle is at least tolerance^2 / 2 px^2 (a spike of height `tolerance`
+    on a 1 px base).
+    """
+    n = len(points)
+    if n <= 2 or tolerance <= 0:
+        return list(points)
+
+    min_area = tolerance * tolerance / 2.0
+    prev = list(range(-1, n - 1))
+    nxt = list(range(1, n + 1))
+    removed = [False] * n
+    areas = [float("inf")] * n
+    heap: List[Tuple[float, int]] = []
+    for i in range(1, n - 1):
+        areas[i] = _triangle_area(points[i - 1], points[i], points[i + 1])
+        heap.append((areas[i], i))
+    heapq.heapify(heap)
+
+    while heap:
+        area, i = heapq.heappop(heap)
+        if removed[i] or area != areas[i]:
+            continue  # stale heap entry
+        if area >= min_area:
+            break
+        removed[i] = True
+        p, q = prev[i], nxt[i]
+        nxt[p] = q
+        prev[q] = p
+        # Neighbours' areas change; an area never drops below the one just removed
+        for j in (p, q):
+            if 0 < j < n - 1:
+                a = max(_triangle_area(points[prev[j]], points[j], points[nxt[j]]), area)
+                areas[j] = a
+                heapq.heappush(heap, (a, j))
+
+    return [p for p, r in zip(points, removed) if not r]
+
+
+def simplify(
+    points: Sequence[Point],
+    tolerance: float = 0.5,
+    method: Literal["rdp", "visvalingam", "none"] = "rdp",
+) -> List[Point]:
+    if method == "rdp":
+        return rdp(points, tolerance)
+    if method == "visvalingam":
+        return visvalingam(points, tolerance)
+    if method == "none":
+        return list(points)
+    raise ValueError("method must be 'rdp', 'visvalingam', or 'none'.")
+
+
+# ----------------------------
+#  Path data
+# ----------------------------
+
+def path_data(
+    segments: Sequence[Sequence[Point]],
+    precision: int = 1,
+    relative: bool = True,
+) -> str:
+    """
+    Build SVG path data for one or more polylines.
+
+    Coordinates are snapped to the precision grid first, and relative offsets
+    are taken between snapped points, so rounding never accumulates along the
+    path. Relative mode uses l/h/v commands, omits zero-length steps and
+    separators where a minus sign already separates numbers.
+    """
+    scale = 10 ** precision
+    out: List[str] = []
+
+    def num(units: int) -> str:
+        return _compact_num(fmt_num(units / scale, precision))
+
+    def join(nums: List[str]) -> str:
+        s = nums[0]
+        for t in nums[1:]:
+            s += t if t.startswith("-") else " " + t
+        return s
+
+    for seg in segments:
+        if not seg:
+            continue
+        snapped = [(round(x * scale), round(y * scale)) for (x, y) in seg]
+        x0, y0 = snapped[0]
+        out.append("M" + join([num(x0), num(y0)]))
+
+        if not relative:
+            last = (x0, y0)
+            for (x, y) in snapped[1:]:
+                if (x, y) == last:
+                    continue
+                out.append("L" + join([num(x), num(y)]))
+                last = (x, y)
+            continue
+
+        cmd = ""
+        px, py = x0, y0
+        for (x, y) in snapped[1:]:
+            dx, dy = x - px, y - py
+            if dx == 0 and dy == 0:
+                continue
+            if dy == 0:
+                c, nums = "h", [num(dx)]
+            elif dx == 0:
+                c, nums = "v", [num(dy)]
+            else:
+                c, nums = "l", [num(dx), num(dy)]
+            # Repeated commands can be implied by the previous one
+            if c == cmd:
+                body = join(nums)
+                out.append(body if body.startswith("-") else " " + body)
+            else:
+                out.append(c + join(nums))
+                cmd = c
+            px, py = x, y
+        if len(snapped) == 1 or all(p == snapped[0] for p in snapped[1:]):
+            out.append("h0")  # keep a visible dot for a single point
+
+    return "".join(out)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Column-oriented table input for SVG4.py: a ColumnTable holds one list of
+values per column instead of one dict per row, and CSV / TSV files stream
+straight into one (no JSON round-trip, no per-row dicts).
+
+  from tableColumns import read_delimited
+  from SVG4 import generate_svg_table
+
+  table = read_delimited("tablejsons/Holdings.csv")     # .tsv / .tab -> tabs
+  svg = generate_svg_table(table, cols=["Ticker", "Weight"], formats=["text", "Perc2"])
+
+SVG4.py takes a .csv / .tsv file wherever it takes a JSON file:
+
+  python SVG4.py tablejsons/Holdings.csv --format text Perc2
+
+The generators also take DataFrames as they come (see as_table): pandas and
+polars DataFrames, Arrow tables / record batches, anything implementing the
+DataFrame interchange protocol (__dataframe__) and {column: values} mappings
+are read a column at a time, with no to_dict("records"):
+
+  svg = generate_svg_table(df, cols=["Ticker", "Weight"], formats=["text", "Perc2"])
+
+None of those libraries is imported here; objects are recognized by their
+methods.
+
+Columns are typed once they are read: a cell becomes an int or float only if
+it prints back exactly as written ("12", "0.0495"), so text formats show the
+CSV text unchanged, while "1.50", "007" or "1e5" stay strings (numeric
+formats still parse them). Empty cells are "". A column with any other
+non-numeric cell is kept as text throughout, whatever the row order, so each
+column has one type.
+"""
+
+import csv
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+DELIMITERS = {".csv": ",", ".tsv": "\t", ".tab": "\t"}
+
+
+# ----------------------------
+#  Column-oriented table
+# ----------------------------
+
+class ColumnTable:
+    """
+    A table stored as {column: [values]}, every column the same length.
+
+    SVG4.py reads whole columns through column(). Everything else sees a
+    read-only list of row dicts: len(), table[0].keys(), table[a:b] (another
+    ColumnTable) and iteration, which builds each row dict only when asked.
+    """
+
+    __slots__ = ("columns", "num_rows")
+
+    def __init__(self, columns: Dict[str, Sequence[Any]]):
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        self.columns = columns
+        self.num_rows = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def keys(self) -> List[str]:
+        return list(self.columns)
+
+    def column(self, key: str) -> Sequence[Any]:
+        """The values of one column ("" for every row if there is no such column)."""
+        values = self.columns.get(key)
+        return values if values is not None else [""] * self.num_rows
+
+    def row(self, index: int) -> Dict[str, Any]:
+        return {key: values[index] for key, values in self.columns.items()}
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return ColumnTable({key: values[index] for key, values in self.columns.items()})
+        if index < 0:
+            index += self.num_rows
+        if not 0 <= index < self.num_rows:
+            raise IndexError("ColumnTable row index out of range")
+        return self.row(index)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self.num_rows):
+            yield self.row(index)
+
+    def __repr__(self) -> str:
+        return f"ColumnTable({self.num_rows} rows x {len(self.columns)} columns: {self.keys()})"
+
+
+# ----------------------------
+#  DataFrame adapters
+# ----------------------------
+
+def _values(seq) -> List[Any]:
+    """One column as a list of plain Python values (numpy / Arrow scalars converted)."""
+    if isinstance(seq, list):
+        return seq
+    for method in ("to_pylist", "tolist", "to_list"):
+        convert = getattr(seq, method, None)
+        if convert is not None:
+            return convert()
+    return list(seq)
+
+
+def _named_columns(names: List[Any], column) -> ColumnTable:
+    duplicates = sorted({str(n) for n in names if names.count(n) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate column names: {duplicates}")
+    return ColumnTable({name: _values(column(j, name)) for j, name in enumerate(names)})
+
+
+def _from_interchange(data) -> Any:
+    """An interchange-protocol object as an Arrow table (or pandas DataFrame)."""
+    try:
+        from pyarrow.interchange import from_dataframe
+    except ImportError:
+        try:
+            from pandas.api.interchange import from_dataframe
+        except ImportError:
+            raise RuntimeError(
+                "Reading a __dataframe__ object needs pyarrow or pandas: pip install pyarrow"
+            ) from None
+    return from_dataframe(data)
+
+
+def as_table(data):
+    """
+    data in a form the SVG4.py generators read: a list of row dicts or a
+    ColumnTable is returned as is; a pandas / polars DataFrame, an Arrow
+    Table / RecordBatch, a __dataframe__ object or a {column: values}
+    mapping becomes a ColumnTable of one Python list per column (values as
+    to_dict("records") would give them, so the SVG is the same). Anything
+    else is returned unchanged for the caller to reject.
+    """
+    if isinstance(data, (list, ColumnTable)):
+        return data
+    if isinstance(data, Mapping):
+        return ColumnTable({name: _values(values) for name, values in data.items()})
+    if hasattr(data, "iloc") and hasattr(data, "columns"):  # pandas
+        return _named_columns(list(data.columns), lambda j, _: data.iloc[:, j])
+    if hasattr(data, "get_column") and hasattr(data, "columns"):  # polars
+        return _named_columns(list(data.columns), lambda _, name: data.get_column(name))
+    if hasattr(data, "column_names") and hasattr(data, "column"):  # pyarrow
+        return _named_columns(list(data.column_names), lambda j, _: data.column(j))
+    if hasattr(data, "__dataframe__"):
+        return as_table(_from_interchange(data))
+    return data
+
+
+# ----------------------------
+#  CSV / TSV ingestion
+# ----------------------------
+
+def parse_cell(text: str):
+    """
+    "12" -> 12, "0.0495" -> 0.0495, anything that would not print back the
+    same (or is not a number) -> the text itself.
+    """
+    if text == "":
+        return ""
+    first = text[0]
+    if not (first.isdigit() or first == "-"):
+        return text
+    try:
+        number = int(text)
+    except ValueError:
+        try:
+            value = float(text)
+        except ValueError:
+            return text
+        return value if repr(value) == text else text
+    return number if str(number) == text else text
+
+
+def _typed_column(texts: List[str]) -> List[Any]:
+    """The column's cells as numbers (see parse_cell), or texts unchanged if any cell is not one."""
+    values = []
+    for text in texts:
+        value = parse_cell(text)
+        if isinstance(value, str) and text:
+            return texts
+        values.append(value)
+    return values
+
+
+def delimiter_for(path: Path) -> str:
+    """"," for .csv, tab for .tsv / .tab."""
+    try:
+        return DELIMITERS[Path(path).suffix.lower()]
+    except KeyError:
+        raise ValueError(
+            f"Not a delimited file: {path} (expected one of {', '.join(sorted(DELIMITERS))})"
+        ) from None
+
+
+def read_delimited(path: Union[str, Path], delimiter: Optional[str] = None) -> ColumnTable:
+    """
+    Stream a CSV / TSV file (first line = header) into a ColumnTable, then
+    type each column as a whole (see parse_cell). Short rows are padded with
+    ""; a row longer than the header is an error.
+    """
+    path = Path(path)
+    if delimiter is None:
+        delimiter = delimiter_for(path)
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if not header:
+            raise ValueError(f"{path} has no header row")
+        duplicates = sorted({h for h in header if header.count(h) > 1})
+        if duplicates:
+            raise ValueError(f"{path}: duplicate column names {duplicates}")
+
+        num_cols = len(header)
+        values: List[List[str]] = [[] for _ in header]
+        for cells in reader:
+            if not cells:
+                continue  # blank line
+            if len(cells) > num_cols:
+                raise ValueError(
+                    f"{path}, line {reader.line_num}: {len(cells)} cells for {num_cols} columns"
+                )
+            for j, text in enumerate(cells):
+                values[j].append(text)
+            for j in range(len(cells), num_cols):
+                values[j].append("")
+
+    if not values[0]:
+        raise ValueError(f"{path} has no data rows")
+    return ColumnTable({name: _typed_column(texts) for name, texts in zip(header, values)})
+
+
+def load_table(path: Union[str, Path]):
+    """Rows from a JSON file (list of row dicts) or a CSV / TSV file (ColumnTable)."""
+    path = Path(path)
+    if path.suffix.lower() in DELIMITERS:
+        return read_delimited(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
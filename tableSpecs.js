@@ -1,3 +1,59 @@
+// Generated by tableSpecsJS.py from tablejsons/manifest.json -- edit the
+// manifest (or tableSpecsCustom.js), not this file.
+window.tableSpecData = {
+    IOF: {"layout":"fitColumns","columns":[["ID","ID","Text"],["Ticker","Ticker","Text"],["BasePrice","Base Price","Dollar2"],["Weight","Weight","Perc2"],["IndexShares","Index Shares","Dec4"],["IndexValue","Index Value","Dec4"]]},
+    IOFInt: {"layout":"fitColumns","columns":[["ID","ID","Text"],["Ticker","Ticker","Text"],["Country","Country","Text"],["LocalPrice","Local Price","Dec2"],["Currency","Currency","Text"],["FX","FX","Dec2"],["BasePrice","Base Price","Dollar2"],["Weight","Weight","Perc2"],["IndexShares","Index Shares","Dec4"],["IndexValue","Index Value","Dec4"]]},
+    JustText2: {"layout":"fitDataStretch","columns":[["Col1","","Text"],["Col2","","Text"]],"compact":true},
+    JustText5: {"layout":"fitColumns","columns":[["Col1","","Text"],["Col2","","Text"],["Col3","","Text"],["Col4","","Text"],["Col5","","Text"]],"compact":true},
+    MC2: {"layout":"fitColumns","columns":[["Col1","Quantity","Dec0"],["Col2","Name","Text"],["Col3","Unit Price","Dollar2"],["Col4","Discount","Dec0"],["Col5","Category","Text"],["Col6","Total","Dollar0"]]},
+    MarketCap: {"layout":"fitDataStretch","columns":[["Ticker","Ticker","Text"],["MC","Market Cap","Dollar0","right"]],"compact":true,"lineHeight":"1"},
+    TwoColDec4: {"layout":"fitDataStretch","columns":[["Col1","","Text"],["Col2","","Dec4","right"]],"compact":true}
+};
+
+(function () {
+    // Build a Tabulator definition from its data-only spec
+    function buildDefinition(spec) {
+        const columnDefaults = { headerSort: false };
+        const tableOptions = { layout: spec.layout, columnDefaults };
+        if (spec.compact) {
+            const lineHeight = spec.lineHeight || "1.2";
+            columnDefaults.resizable = false;
+            tableOptions.rowFormatter = row => {
+                const el = row.getElement();
+                el.style.height = "18px";
+                el.style.lineHeight = lineHeight;
+                el.style.fontSize = "12px";
+                el.style.padding = "0";
+                el.style.margin = "0";
+            };
+        }
+        const columns = spec.columns.map(([field, title, format, align]) => {
+            const fn = window.formatFunctions[format] || window.formatFunctions.Text;
+            const column = { title, field, headerSort: false, formatter: cell => fn(cell.getValue()) };
+            if (align) column.hozAlign = align;
+            return column;
+        });
+        return { tableOptions, columns };
+    }
+
+    const definitions = window.tableDefinitions = window.tableDefinitions || {};
+    Object.keys(window.tableSpecData).forEach(name => {
+        Object.defineProperty(definitions, name, {
+            configurable: true,
+            enumerable: true,
+            get() {
+                const value = buildDefinition(window.tableSpecData[name]);
+                Object.defineProperty(definitions, name, { value, writable: true, enumerable: true });
+                return value;
+            },
+        });
+    });
+})();
+
+// ---- Hand-written specs (tableSpecsCustom.js) ----
+// Hand-written table specs that need custom formatter closures.
+// tableSpecsJS.py appends this file to the generated tableSpecs.js.
+
 const calFormatter = function(cell) {
     const value = cell.getValue();
     if (value === "") return "";  // If no value, return empty string to avoid rendering
@@ -15,59 +71,7 @@ const calFormatter = function(cell) {
     ">${Math.round(value)}</span>`;
 }
 
-window.tableDefinitions = {
-    IOFInt: {
-        tableOptions: {
-            layout: "fitColumns", 
-            columnDefaults: {
-                headerSort: false
-            }
-        },
-        columns: [
-            { title: "ID", field: "ID", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Ticker", field: "Ticker", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Country", field: "Country", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Local Price", field: "LocalPrice", headerSort: false, formatter: cell => formatFunctions.Dec2(cell.getValue()) },
-            { title: "Currency", field: "Currency", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "FX", field: "FX", headerSort: false, formatter: cell => formatFunctions.Dec2(cell.getValue()) },
-            { title: "Base Price", field: "BasePrice", headerSort: false, formatter: cell => formatFunctions.Dollar2(cell.getValue()) },
-            { title: "Weight", field: "Weight", headerSort: false, formatter: cell => formatFunctions.Perc2(cell.getValue()) },
-            { title: "Index Shares", field: "IndexShares", headerSort: false, formatter: cell => formatFunctions.Dec4(cell.getValue()) },
-            { title: "Index Value", field: "IndexValue", headerSort: false, formatter: cell => formatFunctions.Dec4(cell.getValue()) }
-        ]
-    },
-    IOF: {
-        tableOptions: {
-            layout: "fitColumns", 
-            columnDefaults: {
-                headerSort: false
-            }
-        },
-        columns: [
-            { title: "ID", field: "ID", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Ticker", field: "Ticker", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Base Price", field: "BasePrice", headerSort: false, formatter: cell => formatFunctions.Dollar2(cell.getValue()) },
-            { title: "Weight", field: "Weight", headerSort: false, formatter: cell => formatFunctions.Perc2(cell.getValue()) },
-            { title: "Index Shares", field: "IndexShares", headerSort: false, formatter: cell => formatFunctions.Dec4(cell.getValue()) },
-            { title: "Index Value", field: "IndexValue", headerSort: false, formatter: cell => formatFunctions.Dec4(cell.getValue()) }
-        ]
-    },
-    MC2: {
-        tableOptions: {
-            layout: "fitColumns", 
-            columnDefaults: {
-                headerSort: false
-            }
-        },
-        columns: [
-            { title: "Quantity", field: "Col1", headerSort: false, formatter: cell => formatFunctions.Dec0(cell.getValue()) },
-            { title: "Name", field: "Col2", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Unit Price", field: "Col3", headerSort: false, formatter: cell => formatFunctions.Dollar2(cell.getValue()) },
-            { title: "Discount", field: "Col4", headerSort: false, formatter: cell => formatFunctions.Dec0(cell.getValue()) },
-            { title: "Category", field: "Col5", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Total", field: "Col6", headerSort: false, formatter: cell => formatFunctions.Dollar0(cell.getValue()) }
-        ]
-    },
+Object.assign(window.tableDefinitions, {
     TwoColCustom: {
         tableOptions: {
             layout: "fitColumns",
@@ -89,27 +93,6 @@ window.tableDefinitions = {
             }
         ]
     },
-    TwoColDec4: {
-        columns: [
-            { field: "Col1", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { field: "Col2", headerSort: false, formatter: cell => formatFunctions.Dec4(cell.getValue()), hozAlign: "right" }
-        ],
-        tableOptions: {
-            layout: "fitDataStretch",
-            rowFormatter: function(row) {
-                const el = row.getElement();
-                el.style.height = "18px";
-                el.style.lineHeight = "1.2";
-                el.style.fontSize = "12px";
-                el.style.padding = "0";
-                el.style.margin = "0";
-            },
-            columnDefaults: {
-                headerSort: false,
-                resizable: false
-            }
-        }
-    },
     PCFa: {
         columns: [
             { title: "ID", field: "ID", headerSort: false },
@@ -136,7 +119,6 @@ window.tableDefinitions = {
             },
         },
     },
-
     PCFb: {
         columns: [
             { title: "", field: "Col1", headerSort: false },
@@ -247,72 +229,5 @@ window.tableDefinitions = {
                 resizable: false
             }
         }
-    },
-    MarketCap: {
-        columns: [
-            { title: "Ticker", field: "Ticker", headerSort: false, formatter: cell => formatFunctions.Text(cell.getValue()) },
-            { title: "Market Cap", field: "MC", headerSort: false, hozAlign: "right", formatter: cell => formatFunctions.Dollar0(cell.getValue()) }
-        ],
-        tableOptions: {
-            layout: "fitDataStretch",
-            rowFormatter: row => {
-                const el = row.getElement();
-                el.style.height = "18px";
-                el.style.lineHeight = "1";
-                el.style.fontSize = "12px";
-                el.style.padding = "0";
-                el.style.margin = "0";
-            },
-            columnDefaults: {
-                headerSort: false,
-                resizable: false
-            }
-        }
-    },
-    JustText5: {
-        columns: Array.from({ length: 5 }, (_, i) => ({
-            title: "",
-            field: `Col${i + 1}`,
-            headerSort: false,
-            formatter: cell => formatFunctions.Text(cell.getValue())
-        })),
-        tableOptions: {
-            layout: "fitColumns",
-            rowFormatter: row => {
-                const el = row.getElement();
-                el.style.height = "18px";
-                el.style.lineHeight = "1.2";
-                el.style.fontSize = "12px";
-                el.style.padding = "0";
-                el.style.margin = "0";
-            },
-            columnDefaults: {
-                headerSort: false,
-                resizable: false
-            }
-        }
-    },
-    JustText2: {
-        columns: Array.from({ length: 2 }, (_, i) => ({
-            title: "",
-            field: `Col${i + 1}`,
-            headerSort: false,
-            formatter: cell => formatFunctions.Text(cell.getValue())
-        })),
-        tableOptions: {
-            layout: "fitDataStretch",
-            rowFormatter: row => {
-                const el = row.getElement();
-                el.style.height = "18px";
-                el.style.lineHeight = "1.2";
-                el.style.fontSize = "12px";
-                el.style.padding = "0";
-                el.style.margin = "0";
-            },
-            columnDefaults: {
-                headerSort: false,
-                resizable: false
-            }
-        }
     }
-};
+});
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Generate tableSpecs.js (window.tableDefinitions for the web tables) from the
+render manifest, instead of maintaining one formatter closure per column by
+hand.
+
+Usage examples (from repo root):
+
+  # Regenerate tableSpecs.js (only written if it changed)
+  python tableSpecsJS.py
+
+  # Exit 1 if tableSpecs.js is out of date (e.g. before committing)
+  python tableSpecsJS.py --check
+
+Web specs live in the "web" section of tablejsons/manifest.json and use the
+same column keys as the SVG specs (cols, headers, format, justify). They are
+table types, not tables: pages pass any data URL to initFormattedTable with
+a type name, and the format codes are window.formatFunctions names (Perc*
+multiplies by 100 where SVG4's divides), so they are listed here on their
+own rather than derived from the SVG table specs.
+
+An optional "source" (a JSON path relative to the manifest) names data a
+page shows with the type; formatCells.py writes a pre-formatted payload
+for each spec that has one. It is not written to tableSpecs.js.
+
+  "web": {
+    "MarketCap": {
+      "cols": ["Ticker", "MC"],
+      "headers": ["Ticker", "Market Cap"],
+      "format": ["Text", "Dollar0"],
+      "justify": ["L", "R"],
+      "layout": "fitDataStretch",
+      "compact": true,
+      "lineHeight": "1"
+    }
+  }
+
+The generated file holds each spec as data ([field, title, format, align]
+per column) plus a small resolver that builds the Tabulator definition the
+first time a spec is used, looking formatters up in window.formatFunctions
+by name. Specs that need bespoke closures (row-dependent formatters, the
+calendar) stay hand-written in tableSpecsCustom.js, which is appended as is.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from renderManifest import DEFAULT_MANIFEST, _column_errors
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = REPO_DIR / "tableSpecs.js"
+CUSTOM_SPECS = REPO_DIR / "tableSpecsCustom.js"
+
+WEB_KEYS = {"source", "cols", "headers", "format", "justify", "layout", "compact", "lineHeight"}
+WEB_LAYOUTS = ("fitColumns", "fitDataStretch", "fitData")
+DEFAULT_LINE_HEIGHT = "1.2"
+
+# SVG4 justify codes -> Tabulator hozAlign (left is the default)
+_JS_ALIGN = {"L": None, "C": "center", "R": "right"}
+
+
+def js_format_name(fmt: str) -> str:
+    """window.formatFunctions key for an SVG4 format code: perc2 -> Perc2, text -> Text."""
+    key = str(fmt or "text").replace(" ", "").lower()
+    return key[0].upper() + key[1:]
+
+
+# ----------------------------
+#  Spec loading
+# ----------------------------
+
+def load_web_specs(manifest_path: Path = DEFAULT_MANIFEST) -> Dict[str, Dict[str, Any]]:
+    """
+    Validated web specs from the manifest's "web" section. Raises ValueError
+    listing every problem.
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        web = json.load(f).get("web", {})
+    if not isinstance(web, dict):
+        raise ValueError(f"{manifest_path}: \"web\" must be an object")
+
+    specs: Dict[str, Dict[str, Any]] = {}
+    errors: List[str] = []
+    for name in sorted(web):
+        entry = web[name]
+        if not isinstance(entry, dict):
+            errors.append(f"web.{name}: spec must be an object")
+            continue
+        unknown = sorted(set(entry) - WEB_KEYS)
+        if unknown:
+            errors.append(f"web.{name}: unknown keys {unknown}")
+
+        spec = dict(entry)
+        if "source" in spec:
+            spec["source"] = str((Path(manifest_path).parent / spec["source"]).resolve())
+            if not Path(spec["source"]).exists():
+                errors.append(f"web.{name}: source not found: {spec['source']}")
+        if not spec.get("cols"):
+            errors.append(f"web.{name}: cols are required")
+            continue
+        errors.extend(f"web.{e}" for e in _column_errors(name, spec))
+        if spec.get("layout", "fitColumns") not in WEB_LAYOUTS:
+            errors.append(f"web.{name}: layout must be one of {list(WEB_LAYOUTS)}")
+        if not isinstance(spec.get("compact", False), bool):
+            errors.append(f"web.{name}: compact must be true or false")
+        specs[name] = spec
+
+    if errors:
+        raise ValueError(f"Invalid web specs in {manifest_path}:\n  " + "\n  ".join(errors))
+    return specs
+
+
+def compact_spec(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """Data-only form written to the page: columns as [field, title, format(, align)]."""
+    cols = spec["cols"]
+    headers = spec.get("headers") or cols
+    formats = spec.get("format") or ["text"] * len(cols)
+    justify = spec.get("justify") or ["L"] * len(cols)
+
+    columns = []
+    for field, title, fmt, just in zip(cols, headers, formats, justify):
+        column = [field, title, js_format_name(fmt)]
+        align = _JS_ALIGN[str(just).upper()]
+        if align:
+            column.append(align)
+        columns.append(column)
+
+    out: Dict[str, Any] = {"layout": spec.get("layout", "fitColumns"), "columns": columns}
+    if spec.get("compact"):
+        out["compact"] = True
+        if spec.get("lineHeight", DEFAULT_LINE_HEIGHT) != DEFAULT_LINE_HEIGHT:
+            out["lineHeight"] = spec["lineHeight"]
+    return out
+
+
+# ----------------------------
+#  JS output
+# ----------------------------
+
+_RESOLVER_JS = """\
+(function () {
+    // Build a Tabulator definition from its data-only spec
+    function buildDefinition(spec) {
+        const columnDefaults = { headerSort: false };
+        const tableOptions = { layout: spec.layout, columnDefaults };
+        if (spec.compact) {
+            const lineHeight = spec.lineHeight || "%(line_height)s";
+            columnDefaults.resizable = false;
+            tableOptions.rowFormatter = row => {
+                const el = row.getElement();
+                el.style.height = "18px";
+                el.style.lineHeight = lineHeight;
+                el.style.fontSize = "12px";
+                el.style.padding = "0";
+                el.style.margin = "0";
+            };
+        }
+        const columns = spec.columns.map(([field, title, format, align]) => {
+            const fn = window.formatFunctions[format] || window.formatFunctions.Text;
+            const column = { title, field, headerSort: false, formatter: cell => fn(cell.getValue()) };
+            if (align) column.hozAlign = align;
+            return column;
+        });
+        return { tableOptions, columns };
+    }
+
+    const definitions = window.tableDefinitions = window.tableDefinitions || {};
+    Object.keys(window.tableSpecData).forEach(name => {
+        Object.defineProperty(definitions, name, {
+            configurable: true,
+            enumerable: true,
+            get() {
+                const value = buildDefinition(window.tableSpecData[name]);
+                Object.defineProperty(definitions, name, { value, writable: true, enumerable: true });
+                return value;
+            },
+        });
+    });
+})();
+"""
+
+
+def build_js(specs: Dict[str, Dict[str, Any]], custom_js: str = "") -> str:
+    data = {name: compact_spec(spec) for name, spec in specs.items()}
+    lines = [
+        "// Generated by tableSpecsJS.py from tablejsons/manifest.json -- edit the",
+        "// manifest (or tableSpecsCustom.js), not this file.",
+        "window.tableSpecData = {",
+    ]
+    items = [
+        f"    {name}: {json.dumps(spec, separators=(',', ':'), ensure_ascii=False)}"
+        for name, spec in data.items()
+    ]
+    lines.append(",\n".join(items))
+    lines.append("};")
+    lines.append("")
+    js = "\n".join(lines) + "\n" + _RESOLVER_JS % {"line_height": DEFAULT_LINE_HEIGHT}
+    if custom_js:
+        js += "\n// ---- Hand-written specs (tableSpecsCustom.js) ----\n" + custom_js
+    return js
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate tableSpecs.js from the render manifest."
+    )
+    parser.add_argument(
+        "--manifest",
+        default=str(DEFAULT_MANIFEST),
+        help=f"Manifest path (default: {DEFAULT_MANIFEST.relative_to(REPO_DIR)})",
+    )
+    parser.add_argument("--out", default=str(DEFAULT_OUTPUT), help="Output JS path (default: tableSpecs.js)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the output is out of date")
+    args = parser.parse_args()
+
+    specs = load_web_specs(Path(args.manifest))
+    custom_js = CUSTOM_SPECS.read_text(encoding="utf-8") if CUSTOM_SPECS.exists() else ""
+    js = build_js(specs, custom_js)
+
+    out = Path(args.out)
+    current = out.read_text(encoding="utf-8") if out.exists() else None
+    if current == js:
+        print(f"{out.name} is up to date ({len(specs)} generated specs).")
+        return
+    if args.check:
+        print(f"{out.name} is out of date; run python tableSpecsJS.py")
+        sys.exit(1)
+    out.write_text(js, encoding="utf-8")
+    print(f"Table specs saved to: {out} ({len(specs)} generated specs, {len(js):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
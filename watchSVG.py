@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Watch tablejsons/ and chartjsons/ and re-render as the JSON (or CSV / TSV)
+changes, instead of re-running SVG4.py by hand after every edit.
+
+Usage examples (from repo root):
+
+  # Watch with inotify (Linux), re-rendering manifest tables and overlays
+  python watchSVG.py
+
+  # Poll every half second instead (other platforms, network drives)
+  python watchSVG.py --poll 0.5
+
+  # Wait for 1s of quiet after a burst of saves, then commit + push
+  python watchSVG.py --debounce 1 --push
+
+What gets re-rendered:
+
+  tablejsons/manifest.json   tables whose spec changed (added, edited)
+  tablejsons/<X>.json        every manifest table (and its highlights)
+  (or <X>.csv / .tsv)        whose "source" is that file
+  chartjsons/Ch<N>.json      that chapter's figure files, as splitCharts.py
+
+Parsed tables and their fitted layouts stay in memory between edits: a file
+is only re-parsed when its mtime or size changes, and a layout is only
+recomputed when the data or a layout field (cols, headers, format,
+colwidths, fontsize, size) changes, so editing a highlight or the
+background re-emits the SVG without re-measuring every cell. As with
+renderManifest.py, outputs are overwritten in place and only rewritten
+when their content changes.
+
+Bursts of events (editors often write a temp file, rename it, then touch it
+again) are collected until --debounce seconds pass without a new one, then
+handled as one batch.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from renderManifest import (
+    DEFAULT_MANIFEST,
+    layout_key,
+    load_manifest,
+    render_outputs,
+    spec_rows,
+    table_layout,
+    write_outputs,
+)
+from SVG4 import _table_data, autopush_svgs
+from splitCharts import DEFAULT_CHART_DIR, DEFAULT_OUT_DIR, load_index, split_chapter, write_index
+from tableColumns import DELIMITERS, load_table
+
+REPO_DIR = Path(__file__).resolve().parent
+DEFAULT_TABLE_DIR = REPO_DIR / "tablejsons"
+DEFAULT_DEBOUNCE = 0.25
+WATCHED_SUFFIXES = {".json", *DELIMITERS}
+
+
+def _watched(name: str) -> bool:
+    """True for the file types a source or chapter can be (JSON, CSV, TSV)."""
+    return os.path.splitext(name)[1].lower() in WATCHED_SUFFIXES
+
+
+# ----------------------------
+#  Watchers
+# ----------------------------
+
+class InotifyWatcher:
+    """Change events for source files in a few directories (not recursive), via Linux inotify."""
+
+    # <sys/inotify.h>
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    _EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+    def __init__(self, dirs: List[Path]):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_MOVED_FROM | self.IN_DELETE
+        self._dirs: Dict[int, Path] = {}
+        for d in dirs:
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(str(d)), mask)
+            if wd < 0:
+                os.close(self._fd)
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {d}")
+            self._dirs[wd] = d
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        """Changed source paths, or an empty set after timeout seconds (None = block)."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(buf):
+            wd, _, _, length = self._EVENT.unpack_from(buf, offset)
+            offset += self._EVENT.size
+            name = buf[offset:offset + length].rstrip(b"\0").decode("utf-8", "replace")
+            offset += length
+            if wd in self._dirs and _watched(name):
+                changed.add(self._dirs[wd] / name)
+        return changed
+
+    def close(self):
+        os.close(self._fd)
+
+
+class PollWatcher:
+    """Same interface as InotifyWatcher, by comparing (mtime, size) snapshots."""
+
+    def __init__(self, dirs: List[Path], interval: float = 1.0):
+        self._dirs = dirs
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot: Dict[Path, Tuple[int, int]] = {}
+        for d in self._dirs:
+            with os.scandir(d) as entries:
+                for entry in entries:
+                    if _watched(entry.name) and entry.is_file():
+                        st = entry.stat()
+                        snapshot[Path(d) / entry.name] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def wait(self, timeout: Optional[float]) -> Set[Path]:
+        time.sleep(self.interval if timeout is None else min(self.interval, timeout))
+        snapshot = self._scan()
+        changed = {p for p in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(p) != self._snapshot.get(p)}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(dirs: List[Path], poll: Optional[float] = None):
+    """inotify where available, else (or if poll is given) polling."""
+    if poll is None:
+        try:
+            return InotifyWatcher(dirs)
+        except (OSError, AttributeError) as e:  # AttributeError: libc without inotify
+            print(f"inotify unavailable ({e}); polling every 1s.")
+            poll = 1.0
+    return PollWatcher(dirs, poll)
+
+
+def wait_for_batch(watcher, debounce: float) -> Set[Path]:
+    """Block until something changes, then keep collecting until debounce seconds are quiet."""
+    changed: Set[Path] = set()
+    while not changed:
+        changed = watcher.wait(None)
+    while True:
+        more = watcher.wait(debounce)
+        if not more:
+            return changed
+        changed |= more
+
+
+# ----------------------------
+#  Warm renderer
+# ----------------------------
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class WarmRenderer:
+    """
+    Re-renders manifest tables on demand, keeping parsed data (per source
+    file) and fitted layouts (per table) between calls.
+    """
+
+    def __init__(self, manifest_path: Path = DEFAULT_MANIFEST, figures_dir: Path = DEFAULT_OUT_DIR):
+        self.manifest_path = Path(manifest_path)
+        self.specs: Dict[str, Dict[str, Any]] = load_manifest(self.manifest_path, check_sources=False)
+        self.figures_dir = Path(figures_dir)
+        self.chart_index: Optional[Dict[str, Any]] = None
+        self._data: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+        self._layouts: Dict[str, Tuple[Tuple, List[Dict], Tuple]] = {}
+
+    def load_data(self, source: str) -> Tuple[Tuple[int, int], Any]:
+        """(stamp, parsed rows) for a JSON / CSV / TSV source, re-parsed only if the file changed."""
+        stamp = _stamp(Path(source))
+        if stamp is None:
+            self._data.pop(source, None)
+            raise FileNotFoundError(f"source not found: {source}")
+        cached = self._data.get(source)
+        if cached is not None and cached[0] == stamp:
+            return cached
+        entry = (stamp, _table_data(load_table(source)))
+        self._data[source] = entry
+        return entry
+
+    def render(self, name: str) -> List[Path]:
+        """Render one table and its highlights; returns the files written."""
+        spec = self.specs[name]
+        stamp, data = self.load_data(spec["source"])
+
+        key = (stamp, layout_key(spec))
+        cached = self._layouts.get(name)
+        if cached is not None and cached[0] == key:
+            rows, resolved = cached[1], cached[2]
+        else:
+            rows = spec_rows(spec, data)
+            resolved = table_layout(spec, rows)
+            self._layouts[name] = (key, rows, resolved)
+        return write_outputs(render_outputs(name, spec, rows, resolved))
+
+    def reload_manifest(self) -> List[str]:
+        """Re-read the manifest; returns the tables whose spec is new or changed."""
+        old = self.specs
+        self.specs = load_manifest(self.manifest_path, check_sources=False)
+        for name in set(old) - set(self.specs):
+            self._layouts.pop(name, None)
+        return [n for n in sorted(self.specs) if old.get(n) != self.specs[n]]
+
+    def tables_for(self, path: Path) -> List[str]:
+        source = str(path.resolve())
+        return [n for n in sorted(self.specs) if self.specs[n]["source"] == source]
+
+    def split_chart(self, path: Path) -> Dict[str, int]:
+        """Re-split one chapter file into per-figure files (warm splitCharts index)."""
+        if self.chart_index is None:
+            self.chart_index = load_index(self.figures_dir)
+        self.figures_dir.mkdir(parents=True, exist_ok=True)
+        counts = split_chapter(path, self.figures_dir, self.chart_index)
+        if write_index(self.figures_dir, self.chart_index):
+            print(f"Index written to: {self.figures_dir / 'index.json'}")
+        return counts
+
+    def handle(self, changed: Set[Path]) -> Set[Path]:
+        """Re-render whatever a batch of changed files affects; returns the output dirs touched."""
+        touched: Set[Path] = set()
+        names: Set[str] = set()
+
+        if self.manifest_path in changed:
+            try:
+                names.update(self.reload_manifest())
+            except (OSError, ValueError) as e:
+                print(f"ERROR: manifest not reloaded (keeping the previous one): {e}")
+
+        for path in sorted(changed - {self.manifest_path}):
+            if path.parent == DEFAULT_CHART_DIR and path.name.startswith("Ch") and path.suffix == ".json":
+                if not path.exists():
+                    continue
+                counts = self.split_chart(path)
+                if counts["written"] or counts["removed"]:
+                    print(f"{path.name}: {counts['written']} written, {counts['removed']} removed")
+                    touched.add(self.figures_dir)
+                continue
+            names.update(self.tables_for(path))
+        return touched | self.render_tables(names)
+
+    def render_tables(self, names) -> Set[Path]:
+        """Render the given tables, reporting errors; returns the output dirs touched."""
+        touched: Set[Path] = set()
+        for name in sorted(names):
+            try:
+                written = self.render(name)
+            except Exception as e:
+                print(f"ERROR: {name}: {type(e).__name__}: {e}")
+                continue
+            for path in written:
+                print(f"Table SVG saved to: {path}")
+                touched.add(path.parent)
+        return touched
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Watch table and chart JSON and re-render what changed."
+    )
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST), help="Render manifest path")
+    parser.add_argument(
+        "--poll",
+        type=float,
+        metavar="SECONDS",
+        help="Poll at this interval instead of using inotify",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=f"Quiet period that ends a burst of changes, in seconds (default: {DEFAULT_DEBOUNCE})",
+    )
+    parser.add_argument("--push", action="store_true", help="Commit + push the output folders after each batch")
+    args = parser.parse_args()
+
+    manifest_path = Path(args.manifest).resolve()
+    renderer = WarmRenderer(manifest_path)
+    dirs = {DEFAULT_TABLE_DIR, DEFAULT_CHART_DIR, manifest_path.parent}
+    dirs |= {Path(s["source"]).parent for s in renderer.specs.values()}
+    dirs = sorted(d for d in dirs if d.is_dir())
+
+    # Bring every table up to date once; this also warms the caches
+    touched = renderer.render_tables(renderer.specs)
+    if args.push:
+        for out_dir in sorted(touched):
+            autopush_svgs(out_dir)
+
+    watcher = make_watcher(dirs, args.poll)
+    mode = f"polling every {watcher.interval}s" if isinstance(watcher, PollWatcher) else "inotify"
+    print(f"Watching {len(dirs)} folders ({mode}, {len(renderer.specs)} tables). Ctrl-C to stop.")
+    try:
+        while True:
+            changed = wait_for_batch(watcher, args.debounce)
+            touched = renderer.handle({p.resolve() for p in changed})
+            if args.push:
+                for out_dir in sorted(touched):
+                    autopush_svgs(out_dir)
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        watcher.close()
+
+
+if __name__ == "__main__":
+    main()